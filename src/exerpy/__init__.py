@@ -8,3 +8,4 @@ __datapath__ = os.path.join(importlib.resources.files("exerpy"), "data")
 
 
 from .analyses import EconomicAnalysis, ExergoeconomicAnalysis, ExergyAnalysis
+from .scenarios import ScenarioBatch
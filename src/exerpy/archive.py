@@ -0,0 +1,347 @@
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from .streams import COST_FIELDS
+
+#: Version of the archive layout.
+ARCHIVE_FORMAT_VERSION = 1
+
+#: Per-case fields of the components: exergy results and, after an exergoeconomic analysis, costs.
+COMPONENT_FIELDS = (
+    "E_F",
+    "E_P",
+    "E_D",
+    "epsilon",
+    "y",
+    "y_star",
+    "C_F",
+    "C_P",
+    "C_D",
+    "c_F",
+    "c_P",
+    "Z_costs",
+    "r",
+    "f",
+)
+
+#: Per-case fields of the connections.
+CONNECTION_FIELDS = ("m", "T", "p", "E", "E_PH", "E_T", "E_M", "E_CH") + COST_FIELDS
+
+#: Per-case fields of the system.
+SYSTEM_FIELDS = ("E_F", "E_P", "E_D", "E_L", "epsilon")
+
+_TABLES = {"components": COMPONENT_FIELDS, "connections": CONNECTION_FIELDS, "system": SYSTEM_FIELDS}
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def topology_hash(data):
+    """
+    Return the hash of the topology of a model.
+
+    Two models have the same hash if they have the same components (type
+    and name) and connections (name, kind and connected components and
+    connectors), regardless of their order and of the numeric state.
+
+    Parameters
+    ----------
+    data : dict
+        Model in the layout of :meth:`exerpy.ExergyAnalysis._serialize`.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    topology = {
+        "components": sorted([comp_type, name] for comp_type, comps in data["components"].items() for name in comps),
+        "connections": sorted(
+            [
+                name,
+                conn.get("kind"),
+                str(conn.get("source_component")),
+                str(conn.get("source_connector")),
+                str(conn.get("target_component")),
+                str(conn.get("target_connector")),
+            ]
+            for name, conn in data["connections"].items()
+        ),
+    }
+    return hashlib.sha256(json.dumps(topology, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TopologyResults:
+    r"""
+    Results of all archived cases of one plant topology.
+
+    The names of the components and connections are stored once in
+    ``topology.json``. Every field (e.g. ``E_D`` of the components) is a
+    raw float64 file with one row per case, appended for every case and
+    memory-mapped when read, so slicing a single component or connection
+    over all cases does not load the other values. Missing values are NaN.
+    The labels of the cases are stored in ``cases.jsonl``, one line per
+    case; a case counts once its line is complete.
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the topology inside the archive.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "topology.json"), encoding="utf-8") as f:
+            self._topology = json.load(f)
+        if self._topology.get("format") != ARCHIVE_FORMAT_VERSION:
+            msg = (
+                f"Unsupported results archive format {self._topology.get('format')}, "
+                f"expected {ARCHIVE_FORMAT_VERSION}."
+            )
+            raise ValueError(msg)
+        self._index = {table: {name: i for i, name in enumerate(self.names(table))} for table in _TABLES}
+        # Number of cases and the size of cases.jsonl they were counted in
+        self._n_cases = 0
+        self._cases_size = 0
+
+    @classmethod
+    def create(cls, directory, data):
+        """Create the directory of a topology from the first model appended to it."""
+        os.makedirs(directory, exist_ok=True)
+        topology = {
+            "format": ARCHIVE_FORMAT_VERSION,
+            "components": [name for comps in data["components"].values() for name in comps],
+            "component_types": [comp_type for comp_type, comps in data["components"].items() for _ in comps],
+            "connections": list(data["connections"]),
+            "system": ["system"],
+        }
+        tmp_path = os.path.join(directory, "topology.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(topology, f)
+        os.replace(tmp_path, os.path.join(directory, "topology.json"))
+        return cls(directory)
+
+    def names(self, table):
+        """Return the names of the ``"components"``, ``"connections"`` or ``"system"`` in column order."""
+        return self._topology[table]
+
+    @property
+    def cases(self):
+        """Labels of the archived cases, in the order they were appended."""
+        path = os.path.join(self.directory, "cases.jsonl")
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def __len__(self):
+        # Only the lines written since the last call are counted
+        path = os.path.join(self.directory, "cases.jsonl")
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < self._cases_size:
+            self._n_cases = 0
+            self._cases_size = 0
+        if size > self._cases_size:
+            with open(path, "rb") as f:
+                f.seek(self._cases_size)
+                self._n_cases += f.read(size - self._cases_size).count(b"\n")
+            self._cases_size = size
+        return self._n_cases
+
+    def _path(self, table, field):
+        return os.path.join(self.directory, f"{table}.{field}.f8")
+
+    def append(self, rows, case):
+        """
+        Append the values of one case.
+
+        Parameters
+        ----------
+        rows : dict
+            ``{table: {field: {name: value}}}``.
+        case : object
+            JSON-serialisable label of the case.
+        """
+        n_cases = len(self)
+        for table, fields in _TABLES.items():
+            index = self._index[table]
+            for field in fields:
+                row = np.full(len(index), np.nan)
+                for name, value in rows[table][field].items():
+                    row[index[name]] = _number(value)
+                with open(self._path(table, field), "ab") as f:
+                    # Drop the rows an interrupted append left behind, they have no case label
+                    f.truncate(n_cases * row.nbytes)
+                    f.write(row.tobytes())
+        # The case counts once its label is written
+        with open(os.path.join(self.directory, "cases.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(case) + "\n")
+
+    def column(self, table, field):
+        """
+        Return the values of a field for all cases.
+
+        Parameters
+        ----------
+        table : str
+            ``"components"``, ``"connections"`` or ``"system"``.
+        field : str
+            Field, e.g. ``"E_D"``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only memory-mapped array of shape ``(cases, names)``.
+        """
+        if field not in _TABLES[table]:
+            raise KeyError(f"No field '{field}' in {table}. Available fields: {list(_TABLES[table])}.")
+        shape = (len(self), len(self.names(table)))
+        if shape[0] == 0 or shape[1] == 0:
+            return np.empty(shape)
+        return np.memmap(self._path(table, field), dtype=np.float64, mode="r", shape=shape)
+
+    def series(self, table, field, name):
+        """
+        Return the values of a field of one component or connection over all cases.
+
+        Parameters
+        ----------
+        table : str
+            ``"components"``, ``"connections"`` or ``"system"``.
+        field : str
+            Field, e.g. ``"E_D"``.
+        name : str
+            Name of the component or connection.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values in case order.
+        """
+        if name not in self._index[table]:
+            raise KeyError(f"'{name}' is not in the archived {table}.")
+        return np.array(self.column(table, field)[:, self._index[table][name]])
+
+
+class ResultsArchive:
+    r"""
+    Append-only store of the results of many operating points.
+
+    Cases are grouped by the hash of the plant topology (see
+    :func:`topology_hash`), so the component and connection metadata of a
+    plant is stored once and only the numeric results are appended per
+    case, see :class:`TopologyResults`. Example::
+
+        archive = ResultsArchive("results")
+        for hour, ean in enumerate(analyses):
+            archive.append(ean, case=hour)
+        E_D = archive.series("components", "E_D", "HX-3")
+
+    Parameters
+    ----------
+    directory : str
+        Directory of the archive. Created if it does not exist.
+    """
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        # Opened topologies by hash
+        self._results = {}
+
+    def topologies(self):
+        """Return the hashes of the archived topologies."""
+        return sorted(
+            name
+            for name in os.listdir(self.directory)
+            if os.path.exists(os.path.join(self.directory, name, "topology.json"))
+        )
+
+    def topology(self, key=None):
+        """
+        Return the results of one topology.
+
+        Parameters
+        ----------
+        key : str, optional
+            Topology hash. May be omitted if the archive holds a single topology.
+
+        Returns
+        -------
+        TopologyResults
+            Results of the topology.
+        """
+        if key is None:
+            topologies = self.topologies()
+            if len(topologies) != 1:
+                msg = f"The archive holds {len(topologies)} topologies, please select one of {topologies}."
+                raise ValueError(msg)
+            key = topologies[0]
+        if key not in self._results:
+            self._results[key] = TopologyResults(os.path.join(self.directory, key))
+        return self._results[key]
+
+    def append(self, analysis, case=None):
+        """
+        Append the results of an analysed model.
+
+        Parameters
+        ----------
+        analysis : ExergyAnalysis
+            Analysed model. Component costs are included if an exergoeconomic
+            analysis has been run on it.
+        case : object, optional
+            JSON-serialisable label of the case, e.g. the hour of the year.
+            Defaults to the index of the case.
+
+        Returns
+        -------
+        str
+            Hash of the topology the case was appended to.
+        """
+        data = analysis._serialize()
+        key = topology_hash(data)
+        directory = os.path.join(self.directory, key)
+        if key in self._results or os.path.exists(os.path.join(directory, "topology.json")):
+            results = self.topology(key)
+        else:
+            results = self._results[key] = TopologyResults.create(directory, data)
+            logging.info(f"Created results archive for topology {key}.")
+
+        # Exergy results from the serialized data, costs from the components
+        components = {}
+        for comps in data["components"].values():
+            for name, comp_data in comps.items():
+                exergy_results = comp_data.get("exergy_results", {})
+                components[name] = {
+                    field: (
+                        exergy_results[field]
+                        if field in exergy_results
+                        else getattr(analysis.components[name], field, None)
+                    )
+                    for field in COMPONENT_FIELDS
+                }
+        rows = {
+            "components": {
+                field: {name: values[field] for name, values in components.items()} for field in COMPONENT_FIELDS
+            },
+            "connections": {
+                field: {name: conn.get(field) for name, conn in data["connections"].items()}
+                for field in CONNECTION_FIELDS
+            },
+            "system": {field: {"system": data["system_results"].get(field)} for field in SYSTEM_FIELDS},
+        }
+        results.append(rows, len(results) if case is None else case)
+        return key
+
+    def series(self, table, field, name, topology=None):
+        """Return a field of one component or connection over all cases, see :meth:`TopologyResults.series`."""
+        return self.topology(topology).series(table, field, name)
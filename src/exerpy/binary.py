@@ -0,0 +1,316 @@
+import json
+import logging
+import struct
+import zipfile
+
+import numpy as np
+
+#: Version of the binary model format.
+BINARY_FORMAT_VERSION = 1
+
+# Cell states of a column
+_MISSING = 0  # key not present in the row
+_NONE = 1  # value None
+_VALUE = 2  # value stored in the column
+_INT = 3  # integer stored in a float column of mixed numbers
+
+_MAX_EXACT_INT = 2**53
+
+
+def _cell_kind(value):
+    if isinstance(value, bool | np.bool_):
+        return "bool"
+    if isinstance(value, int | np.integer):
+        return "int"
+    if isinstance(value, float | np.floating):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    return "json"
+
+
+def _column_kind(values):
+    kinds = {_cell_kind(value) for value in values}
+    if not kinds:
+        return "none"
+    if len(kinds) == 1:
+        kind = kinds.pop()
+        if kind == "int" and not all(-(2**63) <= value < 2**63 for value in values):
+            return "json"
+        return kind
+    if kinds == {"int", "float"} and all(
+        -_MAX_EXACT_INT <= value <= _MAX_EXACT_INT for value in values if _cell_kind(value) == "int"
+    ):
+        return "number"
+    return "json"
+
+
+def _json_default(value):
+    if isinstance(value, np.generic | np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+#: Matrix a column of each kind is stored in, with its dtype and the fill value of unset cells.
+_MATRICES = {
+    "float": ("float", float, np.nan),
+    "number": ("float", float, np.nan),
+    "int": ("int", np.int64, 0),
+    "bool": ("bool", np.bool_, False),
+    "str": ("text", None, b""),
+    "json": ("text", None, b""),
+}
+
+
+def _encode_cell(kind, cell):
+    if kind == "str":
+        return cell.encode("utf-8")
+    if kind == "json":
+        return json.dumps(cell, default=_json_default).encode("utf-8")
+    return cell
+
+
+def _encode_table(prefix, rows, arrays):
+    """Add the columns of ``{row_name: {key: value}}`` to ``arrays`` and return the column specs."""
+    keys = list(dict.fromkeys(key for row in rows.values() for key in row))
+    arrays[f"{prefix}.names"] = np.array([name.encode("utf-8") for name in rows], dtype=bytes)
+    state = np.full((len(rows), len(keys)), _MISSING, dtype=np.uint8)
+    matrices = {"float": [], "int": [], "bool": [], "text": []}
+    columns = []
+    for i, key in enumerate(keys):
+        cells = [row.get(key) for row in rows.values()]
+        for j, row in enumerate(rows.values()):
+            if key in row:
+                state[j, i] = _NONE if row[key] is None else _VALUE
+        is_set = state[:, i] == _VALUE
+        kind = _column_kind([cell for cell, set_ in zip(cells, is_set, strict=True) if set_])
+        column = {"key": key, "kind": kind}
+        if kind != "none":
+            matrix, _, fill = _MATRICES[kind]
+            column["index"] = len(matrices[matrix])
+            matrices[matrix].append(
+                [_encode_cell(kind, cell) if set_ else fill for cell, set_ in zip(cells, is_set, strict=True)]
+            )
+            if kind == "number":
+                state[[set_ and _cell_kind(cell) == "int" for cell, set_ in zip(cells, is_set, strict=True)], i] = _INT
+        columns.append(column)
+    arrays[f"{prefix}.state"] = state
+    for matrix, dtype, _ in _MATRICES.values():
+        if dtype is not None and matrices[matrix]:
+            arrays[f"{prefix}.{matrix}"] = np.array(matrices[matrix], dtype=dtype).T
+    # Strings of all text columns in one buffer, cell k = column * n_rows + row spans offsets[k]:offsets[k + 1]
+    text = [cell for column in matrices["text"] for cell in column]
+    arrays[f"{prefix}.text"] = np.frombuffer(b"".join(text), dtype=np.uint8)
+    arrays[f"{prefix}.offsets"] = np.concatenate(([0], np.cumsum([len(cell) for cell in text], dtype=np.int64)))
+    return columns
+
+
+def write_binary(path, data, compress=False):
+    """
+    Write a model to the binary format.
+
+    The connections and components are stored as tables in an uncompressed
+    ``.npz`` archive. Each key becomes a column of one matrix per value type
+    (float, integer or boolean) or a column of UTF-8 strings, which are
+    concatenated in one buffer (nested values such as compositions are
+    stored as JSON). A matrix of cell states records
+    whether a key is missing, None or set in a row. The remaining sections
+    (ambient conditions, settings, system results) and the column layout
+    are stored in a small JSON header. Unless the archive is compressed,
+    :func:`read_binary` can memory-map the matrices.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, e.g. ``"model.npz"``.
+    data : dict
+        Model with the sections ``components`` (``{type: {name: data}}``)
+        and ``connections`` (``{name: data}``), as written by
+        :meth:`exerpy.ExergyAnalysis.export_to_json`.
+    compress : bool, optional
+        Compress the archive (default is False). Compressed archives are
+        smaller but cannot be memory-mapped.
+    """
+    arrays = {}
+    components = {}
+    groups = []
+    for comp_type, comps in data["components"].items():
+        for comp_name, comp_data in comps.items():
+            components[comp_name] = comp_data
+            groups.append(comp_type)
+    meta = {
+        "format": BINARY_FORMAT_VERSION,
+        "sections": {key: value for key, value in data.items() if key not in ("components", "connections")},
+        "component_types": list(data["components"]),
+        "connections": _encode_table("connections", data["connections"], arrays),
+        "components": _encode_table("components", components, arrays),
+    }
+    arrays["components.groups"] = np.array([group.encode("utf-8") for group in groups], dtype=bytes)
+    arrays["meta"] = np.frombuffer(json.dumps(meta, default=_json_default).encode("utf-8"), dtype=np.uint8)
+    with open(path, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+    logging.info(f"Model exported to binary file: {path}.")
+
+
+def _memmap_npz(path):
+    """Memory-map the arrays of an uncompressed ``.npz`` archive."""
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as f:
+        infos = zf.infolist()
+        if any(info.compress_type != zipfile.ZIP_STORED for info in infos):
+            return None
+        if not infos:
+            return arrays
+        mapped = np.memmap(f, dtype=np.uint8, mode="r")
+        for info in infos:
+            # Skip the local file header to the start of the .npy member
+            f.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", f.read(30)[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            order = "F" if fortran_order else "C"
+            name = info.filename.removesuffix(".npy")
+            arrays[name] = np.ndarray(shape, dtype=dtype, buffer=mapped, offset=f.tell(), order=order)
+    return arrays
+
+
+class BinaryModel:
+    """
+    Model read from the binary format written by :func:`write_binary`.
+
+    The columns are available as (memory-mapped) arrays through
+    :meth:`column`, e.g. for comparing the exergy flows of many archived
+    operating points, and as the original dictionaries through
+    :meth:`connections` and :meth:`components`.
+
+    Parameters
+    ----------
+    arrays : dict
+        Arrays of the archive.
+
+    Attributes
+    ----------
+    sections : dict
+        Sections stored in the header, e.g. ``ambient_conditions``.
+    """
+
+    def __init__(self, arrays):
+        self._arrays = arrays
+        self._meta = json.loads(bytes(arrays["meta"]).decode("utf-8"))
+        if self._meta.get("format") != BINARY_FORMAT_VERSION:
+            msg = f"Unsupported binary model format {self._meta.get('format')}, expected {BINARY_FORMAT_VERSION}."
+            raise ValueError(msg)
+        self.sections = self._meta["sections"]
+
+    def names(self, table):
+        """Return the row names of ``"connections"`` or ``"components"``."""
+        return [name.decode("utf-8") for name in self._arrays[f"{table}.names"].tolist()]
+
+    def _values(self, table, column):
+        matrix = _MATRICES[column["kind"]][0]
+        if matrix != "text":
+            return self._arrays[f"{table}.{matrix}"][:, column["index"]]
+        n_rows = len(self._arrays[f"{table}.names"])
+        offsets = self._arrays[f"{table}.offsets"][column["index"] * n_rows : (column["index"] + 1) * n_rows + 1]
+        text = self._arrays[f"{table}.text"][offsets[0] : offsets[-1]].tobytes()
+        bounds = (offsets - offsets[0]).tolist()
+        return np.array([text[start:end] for start, end in zip(bounds[:-1], bounds[1:], strict=True)], dtype=object)
+
+    def column(self, table, key):
+        """
+        Return the values of a column.
+
+        Parameters
+        ----------
+        table : str
+            ``"connections"`` or ``"components"``.
+        key : str
+            Key of the column, e.g. ``"E"``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values in row order. Numeric columns hold NaN for missing and
+            None values; strings are UTF-8 encoded and nested values are
+            returned as encoded JSON.
+        """
+        for column in self._meta[table]:
+            if column["key"] == key:
+                if column["kind"] == "none":
+                    return np.full(len(self._arrays[f"{table}.names"]), np.nan)
+                return self._values(table, column)
+        raise KeyError(f"No column '{key}' in {table}.")
+
+    def _rows(self, table):
+        names = self.names(table)
+        rows = [{} for _ in names]
+        state = np.asarray(self._arrays[f"{table}.state"])
+        for i, column in enumerate(self._meta[table]):
+            key, kind = column["key"], column["kind"]
+            column_state = state[:, i]
+            if kind == "none":
+                for j in np.flatnonzero(column_state == _NONE).tolist():
+                    rows[j][key] = None
+                continue
+            values = self._values(table, column).tolist()
+            for j, cell_state in enumerate(column_state.tolist()):
+                if cell_state == _MISSING:
+                    continue
+                if cell_state == _NONE:
+                    rows[j][key] = None
+                elif cell_state == _INT:
+                    rows[j][key] = int(values[j])
+                elif kind == "str":
+                    rows[j][key] = values[j].decode("utf-8")
+                elif kind == "json":
+                    rows[j][key] = json.loads(values[j])
+                else:
+                    rows[j][key] = values[j]
+        return names, rows
+
+    def connections(self):
+        """Return the connections as ``{name: data}``."""
+        names, rows = self._rows("connections")
+        return dict(zip(names, rows, strict=True))
+
+    def components(self):
+        """Return the components as ``{type: {name: data}}``."""
+        names, rows = self._rows("components")
+        components = {comp_type: {} for comp_type in self._meta["component_types"]}
+        groups = [group.decode("utf-8") for group in self._arrays["components.groups"].tolist()]
+        for comp_type, name, row in zip(groups, names, rows, strict=True):
+            components[comp_type][name] = row
+        return components
+
+    def to_dict(self):
+        """Return the model in the layout of :meth:`exerpy.ExergyAnalysis.export_to_json`."""
+        data = {"components": self.components(), "connections": self.connections()}
+        data.update(self.sections)
+        return data
+
+
+def read_binary(path, mmap=True):
+    """
+    Read a model written by :func:`write_binary`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    mmap : bool, optional
+        Memory-map the columns instead of reading them (default is True).
+
+    Returns
+    -------
+    BinaryModel
+        The model.
+    """
+    arrays = _memmap_npz(path) if mmap else None
+    if arrays is None:
+        with np.load(path) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+    return BinaryModel(arrays)
@@ -0,0 +1,293 @@
+import json
+import logging
+import os
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+import CoolProp.CoolProp as CP
+
+from exerpy import __datapath__
+
+#: Statistics of a :class:`ChemicalExergyCache`.
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+@lru_cache(maxsize=None)
+def molar_mass(substance):
+    """
+    Return the molar mass of a CoolProp fluid, cached per process.
+
+    Parameters
+    ----------
+    substance : str
+        CoolProp fluid name or alias.
+
+    Returns
+    -------
+    float
+        Molar mass in kg/mol.
+
+    Raises
+    ------
+    ValueError
+        If CoolProp does not know the substance (failures are not cached).
+    """
+    return CP.PropsSI("M", substance)
+
+
+class ChemExLibrary:
+    r"""
+    Chemical exergy library, loaded once per name and indexed for lookups.
+
+    The library file ``<name>.json`` in the data directory maps upper-case
+    substance names to their standard chemical exergy data (in J/kmol). On
+    loading, the aliases of all CoolProp fluids are resolved against the
+    library keys once, so looking up the entry of a substance does not call
+    :func:`CoolProp.CoolProp.get_aliases` for every stream. Molar masses are
+    kept in a table as well.
+
+    Use :meth:`load` to obtain a library; instances are cached per name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the library, e.g. ``"Ahrendts"``.
+    data : dict
+        Library data, ``{SUBSTANCE: [CAS, ..., e_CH_liquid, e_CH_gas, ...]}``.
+
+    Attributes
+    ----------
+    name : str
+        Name of the library.
+    data : dict
+        Library data as read from the file.
+    aliases : dict
+        ``{alias: library_key}`` for all CoolProp fluids; the key is None
+        if the library has no entry for the fluid.
+    water_aliases : tuple of str
+        CoolProp aliases of water.
+    molar_masses : dict
+        ``{alias: molar_mass}`` in kg/mol, filled on first use.
+    """
+
+    _cache = {}
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.aliases = {}
+        self.water_aliases = tuple(CP.get_aliases("H2O"))
+        self.molar_masses = {}
+        self._water = set(self.water_aliases)
+        for fluid in CP.FluidsList():
+            self._index(fluid, CP.get_aliases(fluid))
+
+    @classmethod
+    def load(cls, name):
+        """
+        Return the library of the given name, reading the file only on first use.
+
+        Parameters
+        ----------
+        name : str
+            Name of the library, e.g. ``"Ahrendts"``.
+
+        Returns
+        -------
+        ChemExLibrary
+            The cached library.
+
+        Raises
+        ------
+        FileNotFoundError
+            If there is no data file for the library.
+        """
+        library = cls._cache.get(name)
+        if library is None:
+            chem_ex_file = os.path.join(__datapath__, f"{name}.json")
+            try:
+                with open(chem_ex_file) as file:
+                    data = json.load(file)  # data in J/kmol
+            except FileNotFoundError:
+                error_msg = (
+                    f"Chemical exergy data file '{name}.json' not found. "
+                    f"Please ensure the file exists or set chemExLib to 'Ahrendts'."
+                )
+                logging.error(error_msg)
+                raise FileNotFoundError(error_msg)
+            library = cls(name, data)
+            cls._cache[name] = library
+        return library
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Forget all loaded libraries, e.g. after a data file was changed.
+
+        The results in :data:`CHEMICAL_EXERGY_CACHE` are calculated from the
+        libraries and are cleared as well.
+        """
+        cls._cache.clear()
+        CHEMICAL_EXERGY_CACHE.clear()
+
+    def _index(self, substance, aliases):
+        key = next((alias.upper() for alias in aliases if alias.upper() in self.data), None)
+        is_water = bool(set(aliases) & set(self.water_aliases))
+        for alias in (substance, *aliases):
+            self.aliases.setdefault(alias, key)
+            if is_water:
+                self._water.add(alias)
+        return key
+
+    def key(self, substance):
+        """
+        Return the library key of a substance.
+
+        Parameters
+        ----------
+        substance : str
+            CoolProp fluid name or alias.
+
+        Returns
+        -------
+        str or None
+            Library key, None if the library has no entry for the substance.
+        """
+        if substance in self.aliases:
+            return self.aliases[substance]
+        return self._index(substance, CP.get_aliases(substance))
+
+    def entry(self, substance):
+        """
+        Return the library data of a substance.
+
+        Raises
+        ------
+        KeyError
+            If the library has no entry for the substance.
+        """
+        key = self.key(substance)
+        if key is None:
+            logging.error(f"No matching alias found for {substance}")
+            raise KeyError(f"No matching alias found for {substance}")
+        return self.data[key]
+
+    def is_water(self, substance):
+        """Whether the substance is an alias of water."""
+        if substance not in self.aliases:
+            self.key(substance)
+        return substance in self._water
+
+    def molar_mass(self, substance):
+        """Return the molar mass of a substance in kg/mol."""
+        value = self.molar_masses.get(substance)
+        if value is None:
+            value = molar_mass(substance)
+            self.molar_masses[substance] = value
+        return value
+
+
+class ChemicalExergyCache:
+    r"""
+    Least-recently-used cache of chemical exergy results keyed on the composition.
+
+    Most streams of a plant share a few compositions (air, flue gas, water,
+    fuel), so the chemical exergy of each composition only needs to be
+    calculated once. The key is the normalised composition, i.e. the basis
+    (molar or mass fractions) and the fractions sorted by substance,
+    together with the ambient state and the library name.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached results (default is 1024).
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups that had to calculate the chemical exergy.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(stream_data, Tamb, pamb, chemExLib):
+        """
+        Return the cache key of a stream.
+
+        Parameters
+        ----------
+        stream_data : dict
+            Stream data with ``molar_composition`` or ``mass_composition``.
+        Tamb : float
+            Ambient temperature.
+        pamb : float
+            Ambient pressure.
+        chemExLib : str
+            Name of the chemical exergy library.
+
+        Returns
+        -------
+        tuple
+            Hashable key.
+        """
+        if "molar_composition" in stream_data:
+            basis, composition = "molar", stream_data["molar_composition"]
+        else:
+            basis, composition = "mass", stream_data["mass_composition"]
+        fractions = tuple(sorted((substance, float(fraction)) for substance, fraction in composition.items()))
+        return basis, fractions, float(Tamb), float(pamb), chemExLib
+
+    def get(self, stream_data, Tamb, pamb, chemExLib, calculate):
+        """
+        Return the chemical exergy of a stream, calculating it on a cache miss.
+
+        Parameters
+        ----------
+        stream_data, Tamb, pamb, chemExLib
+            Arguments of ``calculate``, see :meth:`key`.
+        calculate : callable
+            Function ``calculate(stream_data, Tamb, pamb, chemExLib)``
+            returning the chemical exergy, e.g.
+            :func:`exerpy.functions.calc_chemical_exergy`. Errors are not cached.
+
+        Returns
+        -------
+        float
+            Chemical exergy in J/kg.
+        """
+        key = self.key(stream_data, Tamb, pamb, chemExLib)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = calculate(stream_data, Tamb, pamb, chemExLib)
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def info(self):
+        """Return the hit and miss statistics as :data:`CacheInfo`."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """Remove all results and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+#: Process-wide cache used by :func:`exerpy.functions.add_chemical_exergy`.
+CHEMICAL_EXERGY_CACHE = ChemicalExergyCache()
@@ -14,6 +14,89 @@ def component_registry(cls):
 component_registry.items = {}
 
 
+def batch_epsilon(E_F, E_P):
+    r"""
+    Vectorised counterpart of :meth:`Component.calc_epsilon`.
+
+    Parameters
+    ----------
+    E_F : numpy.ndarray
+        Exergy fuel of the instances in :math:`\mathrm{W}`.
+    E_P : numpy.ndarray
+        Exergy product of the instances in :math:`\mathrm{W}`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Exergetic efficiency, NaN where the exergy fuel is zero.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(E_F == 0, np.nan, E_P / E_F)
+
+
+def batch_stream_sums(streams, stream_lists, *fields):
+    r"""
+    Sum the product of stream properties over a variable number of streams per instance.
+
+    Parameters
+    ----------
+    streams : StreamTable
+        Stream table holding the streams.
+    stream_lists : list of list of dict
+        Streams of each instance, e.g. the material outlets of the turbines.
+    *fields : str
+        Properties multiplied per stream, e.g. ``"m", "e_PH"``.
+
+    Returns
+    -------
+    totals : numpy.ndarray
+        Sum over the streams of each instance, in the order of the streams.
+    complete : numpy.ndarray
+        Boolean mask of the instances whose streams are all in the table
+        with defined properties.
+    """
+    owner = np.repeat(np.arange(len(stream_lists)), [len(stream_list) for stream_list in stream_lists])
+    rows = streams.locate([stream for stream_list in stream_lists for stream in stream_list])
+    values = np.ones(len(rows))
+    for field in fields:
+        values = values * streams.take(field, rows)
+    undefined = np.isnan(values)
+    totals = np.bincount(owner, weights=np.where(undefined, 0.0, values), minlength=len(stream_lists))
+    complete = np.bincount(owner, weights=undefined, minlength=len(stream_lists)) == 0
+    return totals, complete
+
+
+def apply_batch_results(components, handled, T0, p0, split_physical_exergy, **results):
+    r"""
+    Write the results of a vectorised kernel back to the component instances.
+
+    Instances the kernel could not handle (e.g. undefined stream data or
+    branches that only issue warnings) fall back to their scalar
+    ``calc_exergy_balance``, so that both paths give identical results.
+
+    Parameters
+    ----------
+    components : list of Component
+        Instances evaluated by the kernel.
+    handled : numpy.ndarray
+        Boolean mask of the instances evaluated by the kernel.
+    T0 : float
+        Ambient temperature in :math:`\mathrm{K}`.
+    p0 : float
+        Ambient pressure in :math:`\mathrm{Pa}`.
+    split_physical_exergy : bool
+        Flag indicating whether physical exergy is split into thermal and mechanical components.
+    **results : numpy.ndarray
+        Attribute values per instance, e.g. ``E_F=..., E_P=...``.
+    """
+    for i, component in enumerate(components):
+        if handled[i]:
+            for attr, values in results.items():
+                setattr(component, attr, float(values[i]))
+        else:
+            component.calc_exergy_balance(T0, p0, split_physical_exergy)
+
+
 @component_registry
 class Component:
     r"""
@@ -80,6 +163,32 @@ class Component:
         """
         pass
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several instances of this class at once.
+
+        The default implementation calls :meth:`calc_exergy_balance` for each
+        instance. Child classes may override it with a vectorised kernel that
+        evaluates all instances from the columns of the stream table and uses
+        :func:`apply_batch_results` to write the results back.
+
+        Parameters
+        ----------
+        components : list of Component
+            Instances of this class with assigned ``inl`` and ``outl`` streams.
+        streams : StreamTable
+            Stream table holding the connections of the components.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        for component in components:
+            component.calc_exergy_balance(T0, p0, split_physical_exergy)
+
     def calc_epsilon(self):
         r"""
         Calculate the exergetic efficiency of the component.
@@ -2,7 +2,7 @@ import logging
 
 import numpy as np
 
-from exerpy.components.component import Component, component_registry
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -431,6 +431,98 @@ class HeatExchanger(Component):
             f"E_D={self.E_D:.2f} W, eps={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several heat exchangers at once.
+
+        Vectorised version of :meth:`calc_exergy_balance` for heat exchangers
+        with two inlets and two outlets: case 1 (all streams above ambient),
+        cases 2 to 5 with split physical exergy and the dissipative heat
+        exchangers. The cases that issue warnings or errors and heat
+        exchangers with undefined stream data are evaluated by the scalar
+        method.
+
+        Parameters
+        ----------
+        components : list of HeatExchanger
+            Heat exchangers with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the heat exchangers.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        in1 = streams.locate([c.inl.get(0) for c in components])
+        in2 = streams.locate([c.inl.get(1) for c in components])
+        out1 = streams.locate([c.outl.get(0) for c in components])
+        out2 = streams.locate([c.outl.get(1) for c in components])
+        valid = np.array([len(c.inl) == 2 and len(c.outl) == 2 for c in components], dtype=bool)
+        valid &= (in1 >= 0) & (in2 >= 0) & (out1 >= 0) & (out2 >= 0)
+        dissipative = valid & np.array([bool(c.dissipative) for c in components], dtype=bool)
+
+        def flow(rows, key):
+            return streams.take("m", rows) * streams.take(key, rows)
+
+        T_i1, T_i2 = streams.take("T", in1), streams.take("T", in2)
+        T_o1, T_o2 = streams.take("T", out1), streams.take("T", out2)
+        PH_i1, PH_i2, PH_o1, PH_o2 = (flow(rows, "e_PH") for rows in (in1, in2, out1, out2))
+
+        # Case 1: All streams are above the ambient temperature
+        remaining = valid & ~dissipative
+        case1 = remaining & (T_i1 >= T0) & (T_i2 >= T0) & (T_o1 >= T0) & (T_o2 >= T0)
+        handled = case1 | dissipative
+        if split_physical_exergy:
+            TH_i1, TH_i2, TH_o1, TH_o2 = (flow(rows, "e_T") for rows in (in1, in2, out1, out2))
+            M_i1, M_i2, M_o1, M_o2 = (flow(rows, "e_M") for rows in (in1, in2, out1, out2))
+            E_P = TH_o2 - TH_i2
+            E_F = PH_i1 - PH_o1 + (M_i2 - M_o2)
+
+            # Case 2: All streams are below or equal to the ambient temperature
+            remaining &= ~case1
+            case2 = remaining & (T_i1 <= T0) & (T_i2 <= T0) & (T_o1 <= T0) & (T_o2 <= T0)
+            E_P = np.where(case2, TH_o1 - TH_i1, E_P)
+            E_F = np.where(case2, PH_i2 - PH_o2 + (M_i1 - M_o1), E_F)
+            # Case 3: Both streams crossing the ambient temperature
+            remaining &= ~case2
+            case3 = remaining & (T_i1 > T0) & (T_o2 > T0) & (T_o1 <= T0) & (T_i2 <= T0)
+            E_P = np.where(case3, TH_o1 + TH_o2, E_P)
+            E_F = np.where(case3, PH_i1 + PH_i2 - (M_o1 + M_o2), E_F)
+            # Case 4: Only the hot inlet above the ambient temperature
+            remaining &= ~case3
+            case4 = remaining & (T_i1 > T0) & (T_i2 <= T0) & (T_o1 <= T0) & (T_o2 <= T0)
+            E_P = np.where(case4, TH_o1, E_P)
+            E_F = np.where(case4, PH_i1 + PH_i2 - (PH_o2 + M_o1), E_F)
+            # Case 5: Only the cold inlet at or below the ambient temperature
+            remaining &= ~case4
+            case5 = remaining & (T_i1 > T0) & (T_i2 <= T0) & (T_o1 > T0) & (T_o2 > T0)
+            E_P = np.where(case5, TH_o2, E_P)
+            E_F = np.where(case5, PH_i1 - PH_o1 + (PH_i2 - M_o2), E_F)
+            handled |= case2 | case3 | case4 | case5
+        else:
+            E_P = PH_o2 - PH_i2
+            E_F = PH_i1 - PH_o1
+
+        # Dissipative heat exchangers have no exergy product
+        E_P = np.where(dissipative, np.nan, E_P)
+        E_F = np.where(dissipative, PH_i1 - PH_o1 - PH_o2 + PH_i2, E_F)
+        handled &= ~np.isnan(E_F) & (dissipative | ~np.isnan(E_P))
+        E_D = np.where(np.isnan(E_P), E_F, E_F - E_P)
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_D,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         r"""
         Add auxiliary cost equations for the heat exchanger.
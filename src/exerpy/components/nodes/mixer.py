@@ -2,7 +2,7 @@ import logging
 
 import numpy as np
 
-from exerpy.components.component import Component, component_registry
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -190,6 +190,86 @@ class Mixer(Component):
             f"E_D={self.E_D:.2f} W, eps={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several mixers at once.
+
+        Vectorised version of :meth:`calc_exergy_balance`. The contributions
+        of a variable number of inlets are evaluated for all mixers at once
+        and summed per mixer. Mixers with the outlet at ambient temperature,
+        outlets in different states or undefined stream data are evaluated by
+        the scalar method.
+
+        Parameters
+        ----------
+        components : list of Mixer
+            Mixers with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the mixers.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        n = len(components)
+        out = streams.locate([c.outl.get(0) for c in components])
+        T_out, e_out = streams.take("T", out), streams.take("e_PH", out)
+        valid = np.array([len(c.inl) >= 2 and len(c.outl) >= 1 for c in components], dtype=bool) & (out >= 0)
+
+        # All outlets must have the state of the first one
+        outlet_owner = np.repeat(np.arange(n), [len(c.outl) for c in components])
+        outlets = streams.locate([conn for c in components for conn in c.outl.values()])
+        same_state = (streams.take("T", outlets) == T_out[outlet_owner]) & (
+            streams.take("e_PH", outlets) == e_out[outlet_owner]
+        )
+        valid &= np.bincount(outlet_owner, weights=~same_state, minlength=n) == 0
+
+        # Contributions of the inlets, summed per mixer in the order of the inlets
+        owner = np.repeat(np.arange(n), [len(c.inl) for c in components])
+        inlets = streams.locate([conn for c in components for conn in c.inl.values()])
+        T_in, m, e = streams.take("T", inlets), streams.take("m", inlets), streams.take("e_PH", inlets)
+        T_o, e_o = T_out[owner], e_out[owner]
+        above = T_o > T0  # Case 1: Outlet temperature is greater than ambient
+        colder = T_in < T_o
+        hotter = T_in > T_o
+        P_parts = np.select(
+            [
+                above & colder & (T_in >= T0),
+                above & colder,
+                ~above & hotter & (T_in >= T0),
+                ~above & hotter,
+            ],
+            [m * (e_o - e), m * e_o, m * e_o, m * (e_o - e)],
+            default=0.0,
+        )
+        F_parts = np.select(
+            [above & colder & (T_in >= T0), above & colder, ~above & hotter & (T_in >= T0), ~above & hotter],
+            [0.0, m * e, m * e, 0.0],
+            default=m * (e - e_o),
+        )
+        undefined = np.isnan(P_parts) | np.isnan(F_parts)
+        E_P = np.bincount(owner, weights=P_parts, minlength=n)
+        E_F = np.bincount(owner, weights=F_parts, minlength=n)
+        valid &= np.bincount(owner, weights=undefined, minlength=n) == 0
+
+        # Case 2 (outlet at ambient temperature) is left to the scalar method
+        handled = valid & ((T_out > T0) | (T_out < T0))
+        E_D = E_F - E_P
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_D,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         """
         Auxiliary equations for the mixer.
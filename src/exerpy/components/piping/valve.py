@@ -2,7 +2,7 @@ import logging
 
 import numpy as np
 
-from exerpy.components.component import Component, component_registry
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -233,6 +233,70 @@ class Valve(Component):
             f"E_D={self.E_D:.2f} W, eps={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several valves at once.
+
+        Vectorised version of :meth:`calc_exergy_balance`. Zero mass flow,
+        physically identical inlet and outlet, temperature increase across
+        ambient and non-split physical exergy below ambient are left to the
+        scalar method, as are instances with undefined stream data.
+
+        Parameters
+        ----------
+        components : list of Valve
+            Valves with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the valves.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        inl = streams.locate([c.inl.get(0) for c in components])
+        outl = streams.locate([c.outl.get(0) for c in components])
+        T_in, T_out = streams.take("T", inl), streams.take("T", outl)
+        p_in, p_out = streams.take("p", inl), streams.take("p", outl)
+        m_in = streams.take("m", inl)
+        identical = (np.abs(T_in - T_out) < 1e-2) & (np.abs(p_in - p_out) <= 1e-4 * np.maximum(p_in, 1e-9))
+        regular = (inl >= 0) & (outl >= 0) & (np.abs(m_in) >= 1e-10) & ~identical
+
+        # Case 1: Both temperatures above ambient (dissipative)
+        case1 = regular & (T_in > T0) & (T_out > T0)
+        E_P = np.full(len(components), np.nan)
+        E_F = m_in * (streams.take("e_PH", inl) - streams.take("e_PH", outl))
+        handled = case1.copy()
+
+        if split_physical_exergy:
+            e_T_in, e_T_out = streams.take("e_T", inl), streams.take("e_T", outl)
+            e_M_in, e_M_out = streams.take("e_M", inl), streams.take("e_M", outl)
+            # Case 2: Inlet above ambient, outlet below or equal to ambient
+            case2 = regular & (T_in > T0) & (T_out <= T0)
+            E_P = np.where(case2, m_in * e_T_out, E_P)
+            E_F = np.where(case2, m_in * (e_T_in + e_M_in - e_M_out), E_F)
+            # Case 3: Both temperatures below ambient
+            case3 = regular & (T_in <= T0) & (T_out <= T0)
+            E_P = np.where(case3, m_in * (e_T_out - e_T_in), E_P)
+            E_F = np.where(case3, m_in * (e_M_in - e_M_out), E_F)
+            handled |= (case2 | case3) & ~np.isnan(E_P)
+
+        handled &= ~np.isnan(E_F)
+        E_D = np.where(np.isnan(E_P), E_F, E_F - E_P)
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_D,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         """
         Auxiliary equations for the valve.
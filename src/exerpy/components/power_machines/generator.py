@@ -1,6 +1,8 @@
 import logging
 
-from exerpy.components.component import Component, component_registry
+import numpy as np
+
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -92,6 +94,45 @@ class Generator(Component):
             f"Efficiency={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several generators at once.
+
+        Vectorised version of :meth:`calc_exergy_balance`. Instances with
+        undefined stream data are evaluated by the scalar method.
+
+        Parameters
+        ----------
+        components : list of Generator
+            Generators with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the generators.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        inl = streams.locate([c.inl.get(0) for c in components])
+        outl = streams.locate([c.outl.get(0) for c in components])
+        # Exergy product is the electrical power output, exergy fuel the input power
+        E_P = streams.take("energy_flow", outl)
+        E_F = streams.take("energy_flow", inl)
+        handled = ~np.isnan(E_P) & ~np.isnan(E_F)
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_F - E_P,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         """
         Auxiliary equations for the generator.
@@ -1,6 +1,8 @@
 import logging
 
-from exerpy.components.component import Component, component_registry
+import numpy as np
+
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -98,6 +100,47 @@ class Motor(Component):
             f"Efficiency={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several motors at once.
+
+        Vectorised version of :meth:`calc_exergy_balance`. Instances with
+        undefined stream data are evaluated by the scalar method.
+
+        Parameters
+        ----------
+        components : list of Motor
+            Motors with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the motors.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        inl = streams.locate([c.inl.get(0) for c in components])
+        outl = streams.locate([c.outl.get(0) for c in components])
+        energy_in = streams.take("energy_flow", inl)
+        energy_out = streams.take("energy_flow", outl)
+        # The larger of both power flows is the fuel, the smaller one the product
+        E_P = np.where(energy_out > energy_in, energy_in, energy_out)
+        E_F = np.where(energy_out > energy_in, energy_out, energy_in)
+        handled = ~np.isnan(energy_in) & ~np.isnan(energy_out)
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_F - E_P,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         """
         Auxiliary equations for the motor.
@@ -2,7 +2,7 @@ import logging
 
 import numpy as np
 
-from exerpy.components.component import Component, component_registry
+from exerpy.components.component import Component, apply_batch_results, batch_epsilon, component_registry
 
 
 @component_registry
@@ -243,6 +243,85 @@ class Compressor(Component):
             f"E_D={self.E_D:.2f} W, eps={self.epsilon:.2%}"
         )
 
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several compressors at once.
+
+        Vectorised version of :meth:`calc_exergy_balance` for the regular
+        cases (outlet temperature not below inlet temperature, split physical
+        exergy below ambient). All other instances, including those with
+        undefined stream data, are evaluated by the scalar method.
+
+        Parameters
+        ----------
+        components : list of Compressor
+            Compressors with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the compressors.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+        inl = streams.locate([c.inl.get(0) for c in components])
+        outl = streams.locate([c.outl.get(0) for c in components])
+        power = streams.locate(
+            [
+                c.inl[1]
+                if c.inl.get(1) is not None and c.inl[1].get("kind") == "power" and "energy_flow" in c.inl[1]
+                else None
+                for c in components
+            ]
+        )
+
+        T_in, T_out = streams.take("T", inl), streams.take("T", outl)
+        m_in, m_out = streams.take("m", inl), streams.take("m", outl)
+        P = np.where(
+            power >= 0,
+            streams.take("energy_flow", power),
+            m_out * (streams.take("h", outl) - streams.take("h", inl)),
+        )
+        T_in_r, T_out_r = np.round(T_in, 5), np.round(T_out, 5)
+        valid = (inl >= 0) & (outl >= 0) & (T_in <= T_out)
+
+        # Case 1: Both temperatures above ambient
+        case1 = valid & (T_in_r >= T0) & (T_out_r > T0)
+        E_P = m_out * (streams.take("e_PH", outl) - streams.take("e_PH", inl))
+        E_F = np.abs(P)
+
+        if split_physical_exergy:
+            e_T_in, e_T_out = streams.take("e_T", inl), streams.take("e_T", outl)
+            e_M_in, e_M_out = streams.take("e_M", inl), streams.take("e_M", outl)
+            # Case 2: Inlet below, outlet above ambient
+            case2 = valid & (T_in_r < T0) & (T_out_r > T0)
+            E_P = np.where(case2, m_out * e_T_out + m_out * (e_M_out - e_M_in), E_P)
+            E_F = np.where(case2, np.abs(P) + m_in * e_T_in, E_F)
+            # Case 3: Both temperatures below ambient
+            case3 = valid & (T_in_r < T0) & (T_out_r <= T0)
+            E_P = np.where(case3, m_out * (e_M_out - e_M_in), E_P)
+            E_F = np.where(case3, np.abs(P) + m_in * (e_T_in - e_T_out), E_F)
+            handled = case1 | case2 | case3
+        else:
+            handled = case1
+
+        handled &= ~np.isnan(E_P) & ~np.isnan(E_F)
+        E_D = E_F - E_P
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            P=P,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_D,
+            epsilon=batch_epsilon(E_F, E_P),
+        )
+
     def aux_eqs(self, A, b, counter, T0, equations, chemical_exergy_enabled):
         """
         Auxiliary equations for the compressor.
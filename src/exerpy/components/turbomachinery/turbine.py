@@ -2,7 +2,13 @@ import logging
 
 import numpy as np
 
-from exerpy.components.component import Component, component_registry
+from exerpy.components.component import (
+    Component,
+    apply_batch_results,
+    batch_epsilon,
+    batch_stream_sums,
+    component_registry,
+)
 
 
 @component_registry
@@ -164,14 +170,100 @@ class Turbine(Component):
             branch = "unexpected"
 
         # Block log: minimal but explicit
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
         out_m_sum = sum(outlet.get('m', 0) for outlet in self.outl.values() if outlet and outlet.get('kind', 'material') != 'power' and outlet.get('m') is not None)
         logging.info(
             f"Turbine {self.name} | branch={branch} | T_in={Tin:.2f}K T_out={Tout:.2f}K | P={self.P:.2f} W | "
             f"in_m={self.inl[0].get('m')}, out_m_sum={out_m_sum:.6f} kg/s | "
-            f"e_PH_in={self.inl[0].get('e_PH'):.2f} J/kg, E_PH_out={self._total_outlet('m','e_PH'):.2f} W | "
-            f"e_T_in={self.inl[0].get('e_T'):.2f} J/kg, E_T_out={self._total_outlet('m','e_T'):.2f} W | "
-            f"E_F={self.E_F:.2f} W, E_P={self.E_P if np.isnan(self.E_P) else f'{self.E_P:.2f}'} W, "
-            f"E_D={self.E_D:.2f} W, eps={self.epsilon:.2%}"
+            f"e_PH_in={_fmt(self.inl[0].get('e_PH'))} J/kg, E_PH_out={_fmt(self._total_outlet('m', 'e_PH'))} W | "
+            f"e_T_in={_fmt(self.inl[0].get('e_T'))} J/kg, E_T_out={_fmt(self._total_outlet('m', 'e_T'))} W | "
+            f"E_F={_fmt(self.E_F)} W, E_P={_fmt(self.E_P)} W, "
+            f"E_D={_fmt(self.E_D)} W, eps={_fmt(self.epsilon, '.2%')}"
+        )
+
+    @classmethod
+    def calc_exergy_balance_batch(cls, components, streams, T0: float, p0: float, split_physical_exergy) -> None:
+        r"""
+        Calculate the exergy balance of several turbines at once.
+
+        Vectorised version of :meth:`calc_exergy_balance`. The power and the
+        exergy of a variable number of outlets (e.g. extractions) are summed
+        per turbine from the stream table. The cases that only issue warnings
+        and turbines with undefined stream data are evaluated by the scalar
+        method.
+
+        Parameters
+        ----------
+        components : list of Turbine
+            Turbines with assigned inlet and outlet streams.
+        streams : StreamTable
+            Stream table holding the connections of the turbines.
+        T0 : float
+            Ambient temperature in :math:`\mathrm{K}`.
+        p0 : float
+            Ambient pressure in :math:`\mathrm{Pa}`.
+        split_physical_exergy : bool
+            Flag indicating whether physical exergy is split into thermal and mechanical components.
+        """
+
+        def power(connections):
+            return [
+                conn
+                for conn in connections.values()
+                if conn is not None and conn.get("kind") == "power" and "energy_flow" in conn
+            ]
+
+        material_outlets = [
+            [conn for conn in c.outl.values() if conn and conn.get("kind", "material") != "power"] for c in components
+        ]
+        power_in, power_in_complete = batch_stream_sums(streams, [power(c.inl) for c in components], "energy_flow")
+        power_out, power_out_complete = batch_stream_sums(streams, [power(c.outl) for c in components], "energy_flow")
+        H_out, H_out_complete = batch_stream_sums(streams, material_outlets, "m", "h")
+        E_PH_out, E_PH_out_complete = batch_stream_sums(streams, material_outlets, "m", "e_PH")
+
+        inl = streams.locate([c.inl.get(0) for c in components])
+        outl = streams.locate([c.outl.get(0) for c in components])
+        T_in, T_out = streams.take("T", inl), streams.take("T", outl)
+        m_in = streams.take("m", inl)
+        net_power = power_out - power_in
+        P = np.where(net_power != 0.0, np.abs(net_power), H_out - m_in * streams.take("h", inl))
+        valid = (inl >= 0) & (outl >= 0) & power_in_complete & power_out_complete
+        valid &= (net_power != 0.0) | H_out_complete
+
+        # Case 1: Both temperatures above ambient
+        case1 = valid & (T_in >= T0) & (T_out >= T0) & (T_in >= T_out)
+        E_P = np.abs(P)
+        E_F = m_in * streams.take("e_PH", inl) - E_PH_out
+        handled = case1 & E_PH_out_complete
+
+        if split_physical_exergy:
+            E_T_out, E_T_out_complete = batch_stream_sums(streams, material_outlets, "m", "e_T")
+            E_M_out, E_M_out_complete = batch_stream_sums(streams, material_outlets, "m", "e_M")
+            e_T_in, e_M_in = streams.take("e_T", inl), streams.take("e_M", inl)
+            # Case 2: Inlet above, outlet at/below ambient
+            case2 = valid & ~case1 & (T_in > T0) & (T_out <= T0)
+            E_P = np.where(case2, np.abs(P) + E_T_out, E_P)
+            E_F = np.where(case2, m_in * e_T_in + m_in * e_M_in - E_M_out, E_F)
+            # Case 3: Both temperatures at/below ambient
+            case3 = valid & ~case1 & ~case2 & (T_in <= T0) & (T_out <= T0)
+            E_P = np.where(case3, np.abs(P) + (E_T_out - m_in * e_T_in), E_P)
+            E_F = np.where(case3, m_in * e_M_in - E_M_out, E_F)
+            handled |= (case2 | case3) & E_T_out_complete & E_M_out_complete
+
+        handled &= ~np.isnan(E_P) & ~np.isnan(E_F)
+        E_D = E_F - E_P
+        apply_batch_results(
+            components,
+            handled,
+            T0,
+            p0,
+            split_physical_exergy,
+            P=P,
+            E_P=E_P,
+            E_F=E_F,
+            E_D=E_D,
+            epsilon=batch_epsilon(E_F, E_P),
         )
 
     def _total_outlet(self, mass_flow: str, property_name: str) -> float:
@@ -473,3 +565,11 @@ class Turbine(Component):
         self.C_D = self.c_F * self.E_D
         self.r = (self.C_P - self.C_F) / self.C_F
         self.f = self.Z_costs / (self.Z_costs + self.C_D)
+
+
+def _fmt(value, spec=".2f"):
+    """Format a number for the block log, tolerating missing values."""
+    try:
+        return format(value, spec)
+    except (TypeError, ValueError):
+        return str(value)
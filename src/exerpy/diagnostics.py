@@ -0,0 +1,145 @@
+import logging
+
+import pandas as pd
+
+#: Diagnostics levels accepted by :meth:`exerpy.ExergyAnalysis.analyse`.
+DIAGNOSTICS_MODES = ("off", "summary", "full")
+
+#: Stream properties captured per inlet/outlet in ``"full"`` mode.
+STREAM_PROPERTIES = ("T", "p", "m", "h", "e_PH", "e_T", "e_M")
+
+
+class DiagnosticsReport:
+    r"""
+    Structured diagnostics collected while running an exergy analysis.
+
+    The report replaces the printed per-component input summaries. Depending
+    on the mode, one record is stored per component before its exergy balance
+    is calculated:
+
+    - ``"off"``: nothing is collected and no strings are built.
+    - ``"summary"``: number of inlets and outlets, connectors with missing or
+      undefined physical exergy and the power flows at the component.
+    - ``"full"``: additionally a snapshot of the stream properties
+      (``T``, ``p``, ``m``, ``h``, ``e_PH``, ``e_T``, ``e_M``) of every
+      inlet and outlet.
+
+    Parameters
+    ----------
+    mode : str, optional
+        Diagnostics level, one of ``"off"``, ``"summary"`` or ``"full"``
+        (default is ``"off"``).
+
+    Attributes
+    ----------
+    mode : str
+        Diagnostics level.
+    records : dict
+        ``{component_name: record}`` in the order the components were analysed.
+    """
+
+    def __init__(self, mode="off"):
+        if mode not in DIAGNOSTICS_MODES:
+            msg = f"Invalid diagnostics mode '{mode}'. Choose one of {list(DIAGNOSTICS_MODES)}."
+            raise ValueError(msg)
+        self.mode = mode
+        self.records = {}
+
+    @property
+    def enabled(self):
+        """Whether diagnostics are collected."""
+        return self.mode != "off"
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, component_name):
+        return component_name in self.records
+
+    def __getitem__(self, component_name):
+        return self.records[component_name]
+
+    def record_component(self, component):
+        """
+        Collect the inputs of a component before its exergy balance is calculated.
+
+        Does nothing if the report is disabled.
+
+        Parameters
+        ----------
+        component : Component
+            Component with assigned ``inl`` and ``outl`` streams.
+        """
+        if self.mode == "off":
+            return
+
+        inl = getattr(component, "inl", {}) or {}
+        outl = getattr(component, "outl", {}) or {}
+        record = {
+            "type": component.__class__.__name__,
+            "n_inlets": len(inl),
+            "n_outlets": len(outl),
+            "missing_e_PH": [],
+            "power": {},
+        }
+        for side, streams in (("in", inl), ("out", outl)):
+            for idx, stream in streams.items():
+                if not isinstance(stream, dict):
+                    record["missing_e_PH"].append(f"{side}_{idx}")
+                    continue
+                if stream.get("kind") == "power":
+                    if "energy_flow" in stream:
+                        record["power"][f"{side}_{idx}"] = stream.get("energy_flow")
+                elif stream.get("e_PH") is None:
+                    record["missing_e_PH"].append(f"{side}_{idx}")
+
+        if self.mode == "full":
+            record["inlets"] = {idx: _snapshot(stream) for idx, stream in inl.items()}
+            record["outlets"] = {idx: _snapshot(stream) for idx, stream in outl.items()}
+
+        if record["missing_e_PH"]:
+            logging.warning(
+                "Component %s: physical exergy missing at %s.", component.name, ", ".join(record["missing_e_PH"])
+            )
+
+        self.records[component.name] = record
+
+    def issues(self):
+        """
+        Return the components with connectors lacking a physical exergy value.
+
+        Returns
+        -------
+        dict
+            ``{component_name: [connector, ...]}``, e.g. ``{"T1": ["in_0"]}``.
+        """
+        return {name: record["missing_e_PH"] for name, record in self.records.items() if record["missing_e_PH"]}
+
+    def to_dataframe(self):
+        """
+        Return the summary of all records as a DataFrame with one row per component.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns ``Component``, ``Type``, ``Inlets``, ``Outlets``,
+            ``Missing e_PH`` and ``Power [W]``.
+        """
+        rows = [
+            {
+                "Component": name,
+                "Type": record["type"],
+                "Inlets": record["n_inlets"],
+                "Outlets": record["n_outlets"],
+                "Missing e_PH": record["missing_e_PH"],
+                "Power [W]": record["power"],
+            }
+            for name, record in self.records.items()
+        ]
+        return pd.DataFrame(rows, columns=["Component", "Type", "Inlets", "Outlets", "Missing e_PH", "Power [W]"])
+
+
+def _snapshot(stream):
+    if not isinstance(stream, dict):
+        return None
+    return {prop: stream.get(prop) for prop in STREAM_PROPERTIES}
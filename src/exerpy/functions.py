@@ -1,12 +1,13 @@
-import json
 import logging
 import math
-import os
 
 import CoolProp.CoolProp as CP
+import numpy as np
 
-from exerpy import __datapath__
-import re
+from exerpy.chemex import CHEMICAL_EXERGY_CACHE, ChemExLibrary, molar_mass
+from exerpy.streams import StreamTable
+from exerpy.topology import ConnectionGraph
+from exerpy.units import UnitNotFoundError, UnitRegistry, get_unit_audit_sink
 
 
 def mass_to_molar_fractions(mass_fractions):
@@ -30,7 +31,7 @@ def mass_to_molar_fractions(mass_fractions):
         # Step 1: Get the molar masses for each component
         for fraction in mass_fractions:
             try:
-                molar_masses[fraction] = CP.PropsSI("M", fraction)
+                molar_masses[fraction] = molar_mass(fraction)
             except Exception:
                 #  print(f"Warning: Could not retrieve molar mass for {fraction} ({fraction}). Error: {e}")
                 continue  # Skip this fraction if there's an issue
@@ -72,7 +73,7 @@ def molar_to_mass_fractions(molar_fractions):
     # Step 1: Get the molar masses for each component
     for fraction in molar_fractions:
         try:
-            molar_masses[fraction] = CP.PropsSI("M", fraction)
+            molar_masses[fraction] = molar_mass(fraction)
         except Exception:
             # print(f"Warning: Could not retrieve molar mass for {fraction} ({fraction}). Error: {e}")
             continue  # Skip this fraction if there's an issue
@@ -122,18 +123,12 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
         else:
             # If not, convert mass composition to molar fractions
             molar_fractions = mass_to_molar_fractions(stream_data["mass_composition"])
-        try:
-            # Load chemical exergy data
-            chem_ex_file = os.path.join(__datapath__, f"{chemExLib}.json")
-            with open(chem_ex_file) as file:
-                chem_ex_data = json.load(file)  # data in J/kmol
-        except FileNotFoundError:
-            error_msg = f"Chemical exergy data file '{chemExLib}.json' not found. Please ensure the file exists or set chemExLib to 'Ahrendts'."
-            logging.error(error_msg)
-            raise FileNotFoundError(error_msg)
+        # Load chemical exergy data (read once per library and process)
+        library = ChemExLibrary.load(chemExLib)
+        chem_ex_data = library.data  # data in J/kmol
 
         R = 8.314  # Universal gas constant in J/(molK)
-        aliases_water = CP.get_aliases("H2O")
+        aliases_water = library.water_aliases
 
         # Handle pure substance (Case A)
         if len(molar_fractions) == 1:
@@ -141,20 +136,12 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
             substance = next(iter(molar_fractions))  # Get the single key
 
             try:
-                aliases = CP.get_aliases(substance)
-
-                if set(aliases) & set(aliases_water):
-                    eCH = chem_ex_data["WATER"][2] / CP.PropsSI("M", "H2O")  # liquid water, in J/kg
+                if library.is_water(substance):
+                    eCH = chem_ex_data["WATER"][2] / library.molar_mass("H2O")  # liquid water, in J/kg
                     logging.info(f"Pure water detected. Chemical exergy: {eCH} J/kg")
                 else:
-                    for alias in aliases:
-                        if alias.upper() in chem_ex_data:
-                            eCH = chem_ex_data[alias.upper()][3] / CP.PropsSI("M", substance)  # in J/kg
-                            logging.info(f"Found exergy data for {substance}. Chemical exergy: {eCH} J/kg")
-                            break
-                    else:
-                        logging.error(f"No matching alias found for {substance}")
-                        raise KeyError(f"No matching alias found for {substance}")
+                    eCH = library.entry(substance)[3] / library.molar_mass(substance)  # in J/kg
+                    logging.info(f"Found exergy data for {substance}. Chemical exergy: {eCH} J/kg")
 
             except Exception:
                 eCH = 0  # If no aliases found, set chemical exergy to 0
@@ -171,8 +158,7 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
 
             # Calculate the total molar mass of the mixture
             for substance, fraction in molar_fractions.items():
-                molar_mass = CP.PropsSI("M", substance)  # Molar mass in kg/mol
-                total_molar_mass += fraction * molar_mass  # Weighted sum for molar mass in kg/mol
+                total_molar_mass += fraction * library.molar_mass(substance)  # Weighted sum for molar mass in kg/mol
             logging.info(f"Total molar mass of the mixture: {total_molar_mass} kg/mol")
 
             water_present = any(alias in molar_fractions for alias in aliases_water)
@@ -198,14 +184,7 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
                             molar_fractions_gas[substance] = molar_fractions[substance] / x_total_gas
 
                     for substance, fraction in molar_fractions_gas.items():
-                        aliases = CP.get_aliases(substance)
-                        for alias in aliases:
-                            if alias.upper() in chem_ex_data:
-                                eCH_gas_mol += fraction * (chem_ex_data[alias.upper()][3])  # Exergy is in J/mol
-                                break
-                        else:
-                            logging.error(f"No matching alias found for {substance}")
-                            raise KeyError(f"No matching alias found for {substance}")
+                        eCH_gas_mol += fraction * library.entry(substance)[3]  # Exergy is in J/mol
 
                         if fraction > 0:  # Avoid log(0)
                             entropy_mixing += fraction * math.log(fraction)
@@ -218,14 +197,7 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
                     logging.info("Water does not condense.")
                     eCH_mol = 0
                     for substance, fraction in molar_fractions.items():
-                        aliases = CP.get_aliases(substance)
-                        for alias in aliases:
-                            if alias.upper() in chem_ex_data:
-                                eCH_mol += fraction * (chem_ex_data[alias.upper()][3])  # Exergy in J/kmol
-                                break
-                        else:
-                            logging.error(f"No matching alias found for {substance}")
-                            raise KeyError(f"No matching alias found for {substance}")
+                        eCH_mol += fraction * library.entry(substance)[3]  # Exergy in J/kmol
 
                         if fraction > 0:  # Avoid log(0)
                             entropy_mixing += fraction * math.log(fraction)
@@ -236,14 +208,7 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
                 logging.info("No water present in the mixture.")
                 eCH_mol = 0
                 for substance, fraction in molar_fractions.items():
-                    aliases = CP.get_aliases(substance)
-                    for alias in aliases:
-                        if alias.upper() in chem_ex_data:
-                            eCH_mol += fraction * (chem_ex_data[alias.upper()][3])  # Exergy in J/kmol
-                            break
-                    else:
-                        logging.error(f"No matching alias found for {substance}")
-                        raise KeyError(f"No matching alias found for {substance}")
+                    eCH_mol += fraction * library.entry(substance)[3]  # Exergy in J/kmol
 
                     if fraction > 0:  # Avoid log(0)
                         entropy_mixing += fraction * math.log(fraction)
@@ -260,7 +225,7 @@ def calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib):
         raise
 
 
-def add_chemical_exergy(my_json, Tamb, pamb, chemExLib):
+def add_chemical_exergy(my_json, Tamb, pamb, chemExLib, cache=CHEMICAL_EXERGY_CACHE):
     """
     Adds the chemical exergy to each connection in the JSON data, prioritizing molar composition if available.
 
@@ -268,6 +233,9 @@ def add_chemical_exergy(my_json, Tamb, pamb, chemExLib):
     - my_json: The JSON object containing the components and connections.
     - Tamb: Ambient temperature in Celsius.
     - pamb: Ambient pressure in bar.
+    - cache: ChemicalExergyCache for the results, keyed on the composition
+      (default is the process-wide cache exerpy.chemex.CHEMICAL_EXERGY_CACHE).
+      Pass None to calculate every connection.
 
     Returns:
     - The modified JSON object with added chemical exergy for each connection.
@@ -281,39 +249,60 @@ def add_chemical_exergy(my_json, Tamb, pamb, chemExLib):
 
     # Iterate over each material connection with kind == 'material'
     for conn_name, conn_data in my_json["connections"].items():
-        if conn_data["kind"] == "material":
-            # Prefer molar composition if available, otherwise use mass composition
-            molar_composition = conn_data.get("molar_composition", {})
-            mass_composition = conn_data.get("mass_composition", {})
-
-            # Prepare stream data for exergy calculation, prioritizing molar composition
-            if molar_composition:
-                stream_data = {"molar_composition": molar_composition}
-                logging.info(f"Using molar composition for connection {conn_name}")
-            else:
-                stream_data = {"mass_composition": mass_composition}
-                logging.info(f"Using mass composition for connection {conn_name}")
-
-            # If there is no composition data, skip chemical exergy calculation
-            comp_keys = stream_data.get("molar_composition") or stream_data.get("mass_composition") or {}
-            if not comp_keys:
-                logging.warning(f"No composition data for connection {conn_name}; skipping chemical exergy calculation.")
-                conn_data["e_CH"] = None
-                conn_data["e_CH_unit"] = None
-            else:
-                # Add the chemical exergy value
-                conn_data["e_CH"] = calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib)
-                conn_data["e_CH_unit"] = fluid_property_data["e"]["SI_unit"]
-                logging.info(f"Added chemical exergy to connection {conn_name}: {conn_data['e_CH']} kJ/kg")
-        else:
-            logging.info(
-                f"Skipped chemical exergy calculation for non-material connection {conn_name} ({conn_data['kind']})"
-            )
+        add_connection_chemical_exergy(conn_name, conn_data, Tamb, pamb, chemExLib, cache)
+
+    if cache is not None:
+        logging.info(f"Chemical exergy cache: {cache.info()}")
 
     return my_json
 
 
-def add_total_exergy_flow(my_json, split_physical_exergy):
+def add_connection_chemical_exergy(conn_name, conn_data, Tamb, pamb, chemExLib, cache=CHEMICAL_EXERGY_CACHE):
+    """
+    Adds the chemical exergy to a single connection, prioritizing molar composition if available.
+
+    Parameters:
+    - conn_name: Name of the connection.
+    - conn_data: Connection data, modified in place. Only material connections get a chemical exergy.
+    - Tamb: Ambient temperature in K.
+    - pamb: Ambient pressure in Pa.
+    - chemExLib: Name of the chemical exergy library.
+    - cache: ChemicalExergyCache for the results, see add_chemical_exergy. Pass None to calculate the value.
+    """
+    if conn_data["kind"] == "material":
+        # Prefer molar composition if available, otherwise use mass composition
+        molar_composition = conn_data.get("molar_composition", {})
+        mass_composition = conn_data.get("mass_composition", {})
+
+        # Prepare stream data for exergy calculation, prioritizing molar composition
+        if molar_composition:
+            stream_data = {"molar_composition": molar_composition}
+            logging.info(f"Using molar composition for connection {conn_name}")
+        else:
+            stream_data = {"mass_composition": mass_composition}
+            logging.info(f"Using mass composition for connection {conn_name}")
+
+        # If there is no composition data, skip chemical exergy calculation
+        comp_keys = stream_data.get("molar_composition") or stream_data.get("mass_composition") or {}
+        if not comp_keys:
+            logging.warning(f"No composition data for connection {conn_name}; skipping chemical exergy calculation.")
+            conn_data["e_CH"] = None
+            conn_data["e_CH_unit"] = None
+        else:
+            # Add the chemical exergy value
+            if cache is None:
+                conn_data["e_CH"] = calc_chemical_exergy(stream_data, Tamb, pamb, chemExLib)
+            else:
+                conn_data["e_CH"] = cache.get(stream_data, Tamb, pamb, chemExLib, calc_chemical_exergy)
+            conn_data["e_CH_unit"] = fluid_property_data["e"]["SI_unit"]
+            logging.info(f"Added chemical exergy to connection {conn_name}: {conn_data['e_CH']} kJ/kg")
+    else:
+        logging.info(
+            f"Skipped chemical exergy calculation for non-material connection {conn_name} ({conn_data['kind']})"
+        )
+
+
+def add_total_exergy_flow(my_json, split_physical_exergy, graph=None):
     r"""
     Adds the total exergy flow to each connection in the JSON data based on its kind.
 
@@ -333,6 +322,9 @@ def add_total_exergy_flow(my_json, split_physical_exergy):
         The JSON object containing the components and connections.
     split_physical_exergy : bool
         Split physical exergy in mechanical and thermal shares.
+    graph : ConnectionGraph, optional
+        Topology index of ``my_json["connections"]``. Built on the fly if not
+        provided.
 
     Returns
     -------
@@ -340,38 +332,46 @@ def add_total_exergy_flow(my_json, split_physical_exergy):
         The modified JSON object with added total exergy flow for each
         connection.
     """
+    if graph is None:
+        graph = ConnectionGraph(my_json["connections"])
+    # For material connections: E = m * (e^PH + e^CH), evaluated column-wise.
+    # Missing mass flows and exergies are treated as zero.
+    streams = StreamTable(my_json["connections"])
+    material = streams.kind == "material"
+    if material.any():
+        names = [name for name, is_material in zip(streams.names, material, strict=True) if is_material]
+        m = np.nan_to_num(streams.column("m")[material])
+        e_ph = streams.column("e_PH")[material]
+        e_ch = streams.column("e_CH")[material]
+        for name in np.asarray(names, dtype=object)[np.isnan(e_ph)]:
+            logging.warning(f"Connection {name}: e_PH missing; using 0 for total exergy flow")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for name in np.asarray(names, dtype=object)[np.isnan(e_ch)]:
+                logging.info(f"Missing chemical exergy for connection {name}. Using only physical exergy.")
+
+        E_PH = m * np.nan_to_num(e_ph)
+        E_CH = m * np.nan_to_num(e_ch)
+        has_ch = ~np.isnan(e_ch)
+        streams.set_column("E_PH", E_PH, names)
+        streams.set_column("E", np.where(has_ch, E_PH + E_CH, E_PH), names)
+        if has_ch.any():
+            ch_names = np.asarray(names, dtype=object)[has_ch]
+            streams.set_column("E_CH", E_CH[has_ch], ch_names)
+
+        if split_physical_exergy:
+            for key in ("e_T", "e_M"):
+                e_split = streams.column(key)[material]
+                for name in np.asarray(names, dtype=object)[np.isnan(e_split)]:
+                    logging.warning(f"Connection {name}: {key} missing; using 0 for E_{key[2:]}")
+                streams.set_column(f"E_{key[2:]}", m * np.nan_to_num(e_split), names)
+
     for conn_name, conn_data in my_json["connections"].items():
+        if conn_data["kind"] == "material":
+            # Total exergy flows of material streams are evaluated column-wise above.
+            conn_data["E_unit"] = fluid_property_data["power"]["SI_unit"]
+            continue
         try:
-            if conn_data["kind"] == "material":
-                # For material connections: E = m * (e^PH + e^CH). Treat missing exergies as zero.
-                m_val = conn_data.get("m") or 0.0
-                e_ph_val = conn_data.get("e_PH") or 0.0
-                if conn_data.get("e_PH") is None:
-                    logging.warning(f"Connection {conn_name}: e_PH missing; using 0 for total exergy flow")
-
-                conn_data["E_PH"] = m_val * e_ph_val
-
-                if conn_data.get("e_CH") is not None:
-                    e_ch_val = conn_data.get("e_CH") or 0.0
-                    conn_data["E_CH"] = m_val * e_ch_val
-                    conn_data["E"] = conn_data["E_PH"] + conn_data["E_CH"]
-                else:
-                    conn_data["E"] = conn_data["E_PH"]
-                    logging.info(f"Missing chemical exergy for connection {conn_name}. Using only physical exergy.")
-
-                if split_physical_exergy:
-                    e_t_val = conn_data.get("e_T")
-                    e_m_val = conn_data.get("e_M")
-                    if e_t_val is None:
-                        logging.warning(f"Connection {conn_name}: e_T missing; using 0 for E_T")
-                        e_t_val = 0.0
-                    if e_m_val is None:
-                        logging.warning(f"Connection {conn_name}: e_M missing; using 0 for E_M")
-                        e_m_val = 0.0
-
-                    conn_data["E_T"] = m_val * e_t_val
-                    conn_data["E_M"] = m_val * e_m_val
-            elif conn_data["kind"] == "power":
+            if conn_data["kind"] == "power":
                 # For power connections, use the energy flow value directly.
                 conn_data["E"] = conn_data["energy_flow"]
             elif conn_data["kind"] == "heat":
@@ -384,17 +384,9 @@ def add_total_exergy_flow(my_json, split_physical_exergy):
                     and comp_name in my_json["components"]["SimpleHeatExchanger"]
                 ):
                     # Retrieve the inlet material streams: those with this component as target.
-                    inlet_conns = [
-                        c
-                        for c in my_json["connections"].values()
-                        if c.get("target_component") == comp_name and c.get("kind") == "material"
-                    ]
+                    inlet_conns = graph.inlet_connections(comp_name, kind="material")
                     # Retrieve the outlet material streams: those with this component as source.
-                    outlet_conns = [
-                        c
-                        for c in my_json["connections"].values()
-                        if c.get("source_component") == comp_name and c.get("kind") == "material"
-                    ]
+                    outlet_conns = graph.outlet_connections(comp_name, kind="material")
                     # Determine which exergy key to use based on the flag.
                     exergy_key = "e_T" if split_physical_exergy else "e_PH"
 
@@ -415,16 +407,8 @@ def add_total_exergy_flow(my_json, split_physical_exergy):
                         )
                 elif "SteamGenerator" in my_json["components"] and comp_name in my_json["components"]["SteamGenerator"]:
                     # Retrieve material connections for the steam generator.
-                    inlet_conns = [
-                        c
-                        for c in my_json["connections"].values()
-                        if c.get("target_component") == comp_name and c.get("kind") == "material"
-                    ]
-                    outlet_conns = [
-                        c
-                        for c in my_json["connections"].values()
-                        if c.get("source_component") == comp_name and c.get("kind") == "material"
-                    ]
+                    inlet_conns = graph.inlet_connections(comp_name, kind="material")
+                    outlet_conns = graph.outlet_connections(comp_name, kind="material")
                     if inlet_conns and outlet_conns:
                         # For the steam generator, group the material connections as follows:
                         feed_water = inlet_conns[0]  # inl[0]: Feed water inlet (HP)
@@ -500,14 +484,6 @@ def convert_to_SI(property, value, unit, context=None):
     ------
     ValueError: If the property or unit is invalid or conversion is not possible.
     """
-    # Debug: print incoming unit info so users can see raw UnitString from Aspen
-    try:
-        debug_msg = f"convert_to_SI called -> property='{property}', value={value}, raw_unit={repr(unit)}, context={context}"
-        print(debug_msg)
-        logging.debug(debug_msg)
-    except Exception:
-        pass
-
     # Check if value is None
     if value is None:
         logging.warning(f"Value is None for property '{property}', cannot convert.")
@@ -518,131 +494,100 @@ def convert_to_SI(property, value, unit, context=None):
         logging.warning(f"Unrecognized property: '{property}'. Returning original value {value} {unit}.")
         return value
 
-    # Normalize unit string to handle common synonyms coming from external parsers
-    def normalize_unit(u: str) -> str:
-        if not isinstance(u, str):
-            return u
-        s = u.strip().lower()
-        # remove degree symbol and similar
-        s = s.replace("°", " ")
-        # replace common separators with space
-        s = s.replace("-", " ")
-        s = s.replace("\u00b7", " ")
-        # remove commas and dots
-        s = s.replace(",", "").replace(".", "")
-        # normalize per expressions: 'per' -> '/'
-        s = re.sub(r"\bper\b", "/", s)
-        # collapse multiple spaces
-        s = re.sub(r"\s+", " ", s).strip()
-        # remove trailing plural 's' for alphabetic words longer than 2 chars
-        if s.isalpha() and s.endswith("s") and len(s) > 2:
-            s = s[:-1]
-        return s
-
-    if isinstance(unit, str):
-        raw_unit = unit
-        unit_norm = normalize_unit(unit)
-        if unit_norm == "unknown":
-            logging.warning(
-                f"Unrecognized unit {unit} for property '{property}' (context={context}). Returning original value {value} {unit}."
-            )
-            return value
-
-        # map common human-readable unit names to canonical keys used in fluid_property_data
-        unit_alias_map = {
-            # power / heat (normalized keys)
-            "watt": "W",
-            "w": "W",
-            "wat": "W",
-            "kilowatt": "kW",
-            "kw": "kW",
-            "megawatt": "MW",
-            "mw": "MW",
-            # thermal conductance variants
-            "w / k": "W / K",
-            "w/k": "W / K",
-            # plural handlings (already normalized, but keep entries)
-            "watts": "W",
-            # pressure unit variants -> Pascal
-            "n/sqm": "Pa",
-            "n/sq m": "Pa",
-            "n/m2": "Pa",
-            "n / m2": "Pa",
-            "newton/m2": "Pa",
-            "newton/sqm": "Pa",
-            "newton/sq m": "Pa",
-            "pa": "Pa",
-        }
-
-        lower_unit = unit_norm
-        if lower_unit in unit_alias_map:
-            unit = unit_alias_map[lower_unit]
+    # Normalisation, alias mapping and lookup of the unit are precompiled in UNIT_REGISTRY
+    try:
+        resolved = UNIT_REGISTRY.resolve(property, unit)
+    except UnitNotFoundError as e:
+        _record_seen_unit(property, unit, context)
+        if property == "T":
+            msg = f"Invalid unit '{e}' for temperature. Unit not found. Context: {context}"
         else:
-            # try to preserve some spacing patterns for lookup (e.g., 'w / k')
-            unit = unit_norm
+            # Record unknown unit for later inspection so we can add mappings
+            _record_detected_unit(property, unit, str(e), context)
+            msg = f"Invalid unit '{e}' for property '{property}'. Unit not found. Context: {context}"
+        raise ValueError(f"An error occurred during the unit conversion: {msg}")
+
+    if resolved is None:
+        logging.warning(
+            f"Unrecognized unit {unit} for property '{property}' (context={context}). Returning original value {value} {unit}."
+        )
+        return value
+    _record_seen_unit(property, unit, context)
 
-        # Record every seen unit for later inspection (dedupe externally)
-        try:
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-            seen_path = os.path.join(repo_root, "seen_units.txt")
-            with open(seen_path, "a", encoding="utf-8") as f:
-                f.write(f"{property}\t{raw_unit}\t{unit}\t{context}\n")
-        except Exception:
-            logging.exception("Could not write seen unit to file")
+    _, offset, factor = resolved
+    try:
+        if property == "T":
+            return (value + offset) * factor
+        return value * factor
+    except Exception as e:
+        raise ValueError(f"An error occurred during the unit conversion: {e}")
+
+
+def convert_array_to_SI(property, values, unit, context=None):
+    """
+    Convert an array of values of one property and unit to SI values.
+
+    Vectorised counterpart of :func:`convert_to_SI` for whole columns: the
+    unit is resolved once and the conversion is applied as one array
+    operation.
 
+    Parameters
+    ----------
+    property : str
+        Fluid property to convert.
+
+    values : array_like
+        Values to convert, None entries become NaN.
+
+    unit : str
+        Unit of all values.
+
+    Returns
+    -------
+    SI_values : numpy.ndarray
+        Values in SI units. The unconverted values are returned if the
+        property or the unit is not recognised.
+
+    Raises
+    ------
+    ValueError: If the unit is invalid for the property.
+    """
+    values = np.asarray(values, dtype=float)
+    if property not in fluid_property_data:
+        logging.warning(f"Unrecognized property: '{property}'. Returning original values in {unit}.")
+        return values
     try:
-        # Handle temperature conversions separately
-        # Accept lowercase temperature unit codes (e.g., 'c' -> 'C')
-        if property == "T" and isinstance(unit, str):
-            unit = unit.upper()
+        resolved = UNIT_REGISTRY.resolve(property, unit)
+    except UnitNotFoundError as e:
+        _record_detected_unit(property, unit, str(e), context)
+        raise ValueError(f"Invalid unit '{e}' for property '{property}'. Unit not found. Context: {context}")
+    if resolved is None:
+        logging.warning(
+            f"Unrecognized unit {unit} for property '{property}' (context={context}). Returning original values."
+        )
+        return values
+    _record_seen_unit(property, unit, context)
 
-        if property == "T":
-            # Try direct lookup first, then attempt normalized match against known keys
-            if unit not in fluid_property_data["T"]["units"]:
-                # attempt normalized matching
-                matched = None
-                for candidate in fluid_property_data["T"]["units"].keys():
-                    if normalize_unit(candidate) == normalize_unit(unit):
-                        matched = candidate
-                        break
-                if matched is None:
-                    raise ValueError(
-                        f"Invalid unit '{unit}' for temperature. Unit not found. Context: {context}"
-                    )
-                unit = matched
-            converters = fluid_property_data["T"]["units"][unit]
-            return (value + converters[0]) * converters[1]
+    _, offset, factor = resolved
+    if property == "T":
+        return (values + offset) * factor
+    return values * factor
 
-        # Handle all other property conversions
-        else:
-            if unit not in fluid_property_data[property]["units"]:
-                # Try to match normalized form of the unit to a known key
-                matched = None
-                for candidate in fluid_property_data[property]["units"].keys():
-                    if normalize_unit(candidate) == normalize_unit(unit):
-                        matched = candidate
-                        break
-                if matched is not None:
-                    unit = matched
-                else:
-                    # Record unknown unit for later inspection so we can add mappings
-                    try:
-                        repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-                        log_path = os.path.join(repo_root, "detected_units.txt")
-                        with open(log_path, "a", encoding="utf-8") as f:
-                            f.write(f"{property}\t{unit}\t{context}\n")
-                    except Exception:
-                        logging.exception("Could not write detected unit to file")
-                    raise ValueError(
-                        f"Invalid unit '{unit}' for property '{property}'. Unit not found. Context: {context}"
-                    )
-            conversion_factor = fluid_property_data[property]["units"][unit]
-            return value * conversion_factor
 
-    except KeyError as e:
-        raise ValueError(f"Conversion error: {e}")
-    except Exception as e:
-        raise ValueError(f"An error occurred during the unit conversion: {e}")
+def _record_seen_unit(property, unit, context):
+    # Record every seen unit in the audit sink, if auditing is enabled
+    sink = get_unit_audit_sink()
+    if sink is None or not isinstance(unit, str):
+        return
+    sink.record("seen", property, unit, UNIT_REGISTRY.canonical(property, unit), context)
+
+
+def _record_detected_unit(property, raw_unit, unit, context):
+    # Record units missing in the conversion table so that mappings can be added
+    sink = get_unit_audit_sink()
+    if sink is None:
+        return
+    sink.record("unknown", property, raw_unit, unit, context)
 
 
 fluid_property_data = {
@@ -902,3 +847,6 @@ for alias, base in {
     "e_T": "power",
 }.items():
     fluid_property_data[alias] = fluid_property_data[base]
+
+#: Precompiled unit conversion table of :data:`fluid_property_data`, used by :func:`convert_to_SI`.
+UNIT_REGISTRY = UnitRegistry(fluid_property_data)
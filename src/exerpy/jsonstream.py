@@ -0,0 +1,179 @@
+import json
+
+#: Top-level sections of a model JSON file that are read member by member.
+STREAMED_SECTIONS = ("components", "connections")
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonScanner:
+    r"""
+    Incremental reader of a JSON document from a text file.
+
+    The document is read in chunks and decoded one value at a time, so only
+    the value being decoded (plus one chunk) is held as text. Objects can be
+    walked member by member with :meth:`members`, reading each member with
+    :meth:`value` or, for nested objects, with :meth:`members` again.
+
+    Parameters
+    ----------
+    file : file object
+        Text file opened for reading.
+    chunk_size : int, optional
+        Number of characters read at a time (default is 65536). Values larger
+        than a chunk are read with doubling chunk sizes.
+    """
+
+    def __init__(self, file, chunk_size=1 << 16):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size):
+        # Drop the decoded text and append the next chunk
+        chunk = self._file.read(size)
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        if not chunk:
+            self._eof = True
+        return bool(chunk)
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def peek(self):
+        """Return the next non-whitespace character, ``""`` at the end of the document."""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer):
+                return buffer[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char):
+        """
+        Consume the next non-whitespace character.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If the character is not ``char``.
+        """
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def value(self):
+        """
+        Decode the next value.
+
+        Returns
+        -------
+        object
+            The decoded value, e.g. a dict for a JSON object.
+        """
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill(size)
+                size *= 2
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number may continue in the next chunk
+                self._fill(size)
+                continue
+            self._pos = end
+            return value
+
+    def members(self):
+        """
+        Iterate over the keys of the next object.
+
+        The value of each key must be consumed (with :meth:`value` or
+        :meth:`members`) before advancing the iterator.
+
+        Yields
+        ------
+        str
+            Key of the next member.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def end(self):
+        """
+        Check that the document has been read completely.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If there is data after the document.
+        """
+        if self.peek() != "":
+            raise self._error("Extra data")
+
+
+def iter_json_sections(json_path, streamed_sections=STREAMED_SECTIONS, chunk_size=1 << 16):
+    r"""
+    Read a model JSON file section by section without loading it as a whole.
+
+    The members of the streamed sections (by default the components per
+    component type and the individual connections) are yielded one at a
+    time as ``(section, key, value)``, preceded by ``(section, None, {})``
+    when the section starts. All other sections, e.g. the ambient
+    conditions, are yielded as a whole as ``(section, None, value)``. Setting
+    ``data[section] = value`` for key None and ``data[section][key] = value``
+    otherwise rebuilds the document.
+
+    Parameters
+    ----------
+    json_path : str
+        Path to the JSON file.
+    streamed_sections : tuple of str, optional
+        Top-level sections read member by member.
+    chunk_size : int, optional
+        Number of characters read at a time.
+
+    Yields
+    ------
+    tuple
+        ``(section, key, value)``.
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the file content is not valid JSON.
+    """
+    with open(json_path) as file:
+        scanner = JsonScanner(file, chunk_size)
+        for section in scanner.members():
+            if section in streamed_sections and scanner.peek() == "{":
+                yield section, None, {}
+                for key in scanner.members():
+                    yield section, key, scanner.value()
+            else:
+                yield section, None, scanner.value()
+        scanner.end()
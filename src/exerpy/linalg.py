@@ -0,0 +1,815 @@
+import hashlib
+import warnings
+
+import numpy as np
+
+try:
+    import scipy.linalg as sla
+    import scipy.sparse as sp
+    import scipy.sparse.linalg as spla
+    from scipy.sparse.csgraph import connected_components, maximum_bipartite_matching
+
+    __scipy_available__ = True
+except ImportError:
+    sla = None
+    sp = None
+    spla = None
+    connected_components = None
+    maximum_bipartite_matching = None
+    __scipy_available__ = False
+
+#: Number of unknowns from which the sparse solver is used in ``"auto"`` mode.
+SPARSE_THRESHOLD = 500
+
+#: Solver backends accepted by :func:`solve_linear_system`.
+SOLVERS = ("auto", "dense", "sparse", "block")
+
+
+class TripletMatrix:
+    r"""
+    Sparse matrix builder that records element assignments as COO triplets.
+
+    The builder supports the indexed assignment ``A[i, j] = value`` used by the
+    ``aux_eqs`` and ``dis_eqs`` methods of the components, so the equations of
+    the exergoeconomic system are assembled without allocating a dense
+    :math:`n \times n` array. Assigning the same element twice overwrites the
+    previous value, exactly like assigning into a dense array.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of rows and columns.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Number of rows and columns.
+    """
+
+    def __init__(self, shape):
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._entries = {}
+
+    def _key(self, key):
+        i, j = key
+        i, j = int(i), int(j)
+        if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+            msg = f"Index ({i}, {j}) is out of bounds for a matrix of shape {self.shape}."
+            raise IndexError(msg)
+        return i, j
+
+    def __setitem__(self, key, value):
+        self._entries[self._key(key)] = float(value)
+
+    def __getitem__(self, key):
+        return self._entries.get(self._key(key), 0.0)
+
+    @property
+    def nnz(self):
+        """Number of stored non-zero entries."""
+        return sum(1 for value in self._entries.values() if value != 0)
+
+    def triplets(self):
+        """
+        Return the non-zero entries as COO triplets.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            ``(rows, cols, values)`` sorted by row and column.
+        """
+        entries = sorted((key, value) for key, value in self._entries.items() if value != 0)
+        rows = np.fromiter((key[0] for key, _ in entries), dtype=np.intp, count=len(entries))
+        cols = np.fromiter((key[1] for key, _ in entries), dtype=np.intp, count=len(entries))
+        values = np.fromiter((value for _, value in entries), dtype=float, count=len(entries))
+        return rows, cols, values
+
+    def fingerprint(self, values=True):
+        """
+        Return a hash of the shape and the non-zero entries.
+
+        Two matrices with equal fingerprints have identical coefficients, so
+        the fingerprint can be used as cache key for factorisations.
+
+        Parameters
+        ----------
+        values : bool, optional
+            Include the values of the entries (default is True). Without them
+            the hash only depends on the sparsity pattern, e.g. as cache key
+            for structural checks.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-1 digest.
+        """
+        rows, cols, entries = self.triplets()
+        digest = hashlib.sha1(np.asarray(self.shape, dtype=np.int64).tobytes())
+        for array in (rows.astype(np.int64), cols.astype(np.int64)) + ((entries,) if values else ()):
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    def toarray(self):
+        """Return the matrix as a dense NumPy array."""
+        A = np.zeros(self.shape)
+        rows, cols, values = self.triplets()
+        A[rows, cols] = values
+        return A
+
+    def tocsr(self):
+        """Return the matrix as a ``scipy.sparse.csr_matrix``."""
+        if not __scipy_available__:
+            msg = "Sparse matrices require scipy. Install it with 'pip install scipy'."
+            raise ImportError(msg)
+        rows, cols, values = self.triplets()
+        return sp.coo_matrix((values, (rows, cols)), shape=self.shape).tocsr()
+
+
+def use_sparse(n, solver="auto", threshold=SPARSE_THRESHOLD):
+    """
+    Decide whether a system with ``n`` unknowns is handled with sparse matrices.
+
+    Parameters
+    ----------
+    n : int
+        Number of unknowns.
+    solver : str, optional
+        ``"auto"``, ``"dense"``, ``"sparse"`` or ``"block"`` (default is
+        ``"auto"``).
+    threshold : int, optional
+        Number of unknowns from which ``"auto"`` picks the sparse backend.
+
+    Returns
+    -------
+    bool
+        True for the sparse backend. ``"auto"`` falls back to the dense
+        backend if scipy is not installed. ``"block"`` works on the sparse
+        matrix if scipy is installed and on the dense array otherwise.
+    """
+    if solver not in SOLVERS:
+        msg = f"Invalid solver '{solver}'. Choose one of {list(SOLVERS)}."
+        raise ValueError(msg)
+    if solver == "auto":
+        return __scipy_available__ and n >= threshold
+    if solver == "block":
+        return __scipy_available__
+    return solver == "sparse"
+
+
+def solve_linear_system(A, b):
+    """
+    Solve the linear system ``A x = b`` with a dense or sparse direct solver.
+
+    Dense arrays are solved with :func:`numpy.linalg.solve`, scipy sparse
+    matrices with a sparse LU factorisation (:func:`scipy.sparse.linalg.splu`).
+
+    Parameters
+    ----------
+    A : numpy.ndarray or scipy.sparse.spmatrix
+        Square coefficient matrix.
+    b : numpy.ndarray
+        Right-hand side vector.
+
+    Returns
+    -------
+    numpy.ndarray
+        Solution vector.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the matrix is singular, for both backends.
+    """
+    if sp is not None and sp.issparse(A):
+        try:
+            return spla.splu(A.tocsc()).solve(np.asarray(b, dtype=float))
+        except RuntimeError as e:
+            raise np.linalg.LinAlgError(str(e)) from e
+    return np.linalg.solve(A, b)
+
+
+class LUFactorisation:
+    r"""
+    LU factorisation of a square matrix for repeated solves.
+
+    The matrix is factorised once; :meth:`solve` then only performs the
+    forward and backward substitution, for a single right-hand side or for
+    many right-hand sides stacked as columns. Sparse matrices are factorised
+    with :func:`scipy.sparse.linalg.splu`, dense arrays with
+    :func:`scipy.linalg.lu_factor`. Without scipy, dense systems fall back to
+    :func:`numpy.linalg.solve`, which still solves all columns in one call.
+
+    Parameters
+    ----------
+    A : numpy.ndarray or scipy.sparse.spmatrix
+        Square coefficient matrix.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the factorised matrix.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the matrix is singular, for both backends.
+    """
+
+    def __init__(self, A):
+        self.shape = A.shape
+        self._A = None
+        self._lu = None
+        self._splu = None
+        if sp is not None and sp.issparse(A):
+            try:
+                self._splu = spla.splu(A.tocsc())
+            except RuntimeError as e:
+                raise np.linalg.LinAlgError(str(e)) from e
+        elif sla is not None:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", sla.LinAlgWarning)
+                lu, piv = sla.lu_factor(np.asarray(A, dtype=float), check_finite=False)
+            if not np.all(np.diag(lu)):
+                raise np.linalg.LinAlgError("Singular matrix")
+            self._lu = (lu, piv)
+        else:
+            self._A = np.asarray(A, dtype=float)
+
+    def solve(self, b, trans=False):
+        """
+        Solve ``A x = b`` with the stored factorisation.
+
+        Parameters
+        ----------
+        b : numpy.ndarray
+            Right-hand side of shape ``(n,)`` or ``(n, k)`` for ``k`` systems.
+        trans : bool, optional
+            Solve the transposed system ``A^T x = b`` instead, e.g. for
+            adjoint sensitivities (default is False).
+
+        Returns
+        -------
+        numpy.ndarray
+            Solution with the shape of ``b``.
+        """
+        b = np.asarray(b, dtype=float)
+        if self._splu is not None:
+            return self._splu.solve(b, trans="T" if trans else "N")
+        if self._lu is not None:
+            return sla.lu_solve(self._lu, b, trans=int(trans), check_finite=False)
+        return np.linalg.solve(self._A.T if trans else self._A, b)
+
+
+def _triplets(A):
+    """Return the entries of a dense, scipy sparse or :class:`TripletMatrix` matrix as COO triplets."""
+    if isinstance(A, TripletMatrix):
+        return A.triplets()
+    if sp is not None and sp.issparse(A):
+        A = A.tocoo()
+        return A.row.astype(np.intp), A.col.astype(np.intp), A.data.astype(float)
+    A = np.asarray(A, dtype=float)
+    rows, cols = np.nonzero(A)
+    return rows, cols, A[rows, cols]
+
+
+def _colinear_pairs(rows, cols, values, norms, tol_strict, tol_near):
+    """
+    Find pairs of parallel or anti-parallel rows by hashing their normalised sparsity pattern.
+
+    Each row is scaled to unit length with a positive leading entry. Only rows
+    with the same pattern of significant entries (above ``tol_near`` after
+    scaling) can be colinear, so the rows are grouped by that pattern and only
+    rows within a group are compared, which is linear in the number of entries
+    for the sparse systems of the exergoeconomic analysis.
+    """
+    groups = {}
+    starts = np.searchsorted(rows, np.arange(len(norms) + 1))
+    unit = {}
+    for i in np.flatnonzero(norms).tolist():
+        row_cols = cols[starts[i] : starts[i + 1]]
+        row_values = values[starts[i] : starts[i + 1]] / norms[i]
+        row_values = row_values * np.sign(row_values[0])
+        unit[i] = (row_cols, row_values)
+        key = row_cols[np.abs(row_values) > tol_near].tobytes()
+        groups.setdefault(key, []).append(i)
+
+    strict, near = [], []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        group_cols = np.unique(np.concatenate([unit[i][0] for i in members]))
+        U = np.zeros((len(members), len(group_cols)))
+        for k, i in enumerate(members):
+            U[k, np.searchsorted(group_cols, unit[i][0])] = unit[i][1]
+        errors = np.minimum(
+            np.linalg.norm(U[:, None] - U[None, :], axis=2), np.linalg.norm(U[:, None] + U[None, :], axis=2)
+        )
+        for a, b in zip(*np.triu_indices(len(members), 1), strict=True):
+            pair = (members[a], members[b])
+            if errors[a, b] <= tol_strict:
+                strict.append(pair)
+            elif errors[a, b] <= tol_near:
+                near.append(pair)
+    return sorted(strict), sorted(near)
+
+
+def _peel_column_singletons(rows, cols, significant, shape):
+    """
+    Return the rows that can take part in a linear dependency.
+
+    A row holding the only entry of a column is independent of all other rows,
+    unless the entry is insignificant compared to the rest of the row. Such
+    rows are removed repeatedly, as removing them can leave further columns
+    with a single entry.
+    """
+    row_starts = np.searchsorted(rows, np.arange(shape[0] + 1))
+    col_order = np.argsort(cols, kind="stable")
+    col_rows = rows[col_order]
+    col_starts = np.searchsorted(cols[col_order], np.arange(shape[1] + 1))
+    count = np.diff(col_starts)
+    active = np.diff(row_starts) > 0
+    stack = np.flatnonzero(count == 1).tolist()
+    while stack:
+        col = stack.pop()
+        if count[col] != 1:
+            continue
+        candidates = col_rows[col_starts[col] : col_starts[col + 1]]
+        index = col_order[col_starts[col] : col_starts[col + 1]][active[candidates]][0]
+        if not significant[index]:
+            continue
+        row = rows[index]
+        active[row] = False
+        for other in cols[row_starts[row] : row_starts[row + 1]].tolist():
+            count[other] -= 1
+            if count[other] == 1:
+                stack.append(other)
+    return active
+
+
+def _row_blocks(rows, cols, active, shape):
+    """Split the active rows into groups that share no column."""
+    mask = active[rows]
+    rows, cols = rows[mask], cols[mask]
+    if sp is None:
+        return [np.flatnonzero(active)] if active.any() else []
+    # Bipartite graph of rows (0..m-1) and columns (m..m+n-1)
+    n_nodes = shape[0] + shape[1]
+    graph = sp.coo_matrix((np.ones(len(rows)), (rows, cols + shape[0])), shape=(n_nodes, n_nodes))
+    _, labels = connected_components(graph, directed=False)
+    row_labels = labels[: shape[0]]
+    return [np.flatnonzero(active & (row_labels == label)) for label in np.unique(row_labels[active])]
+
+
+def _left_null_space(rows, cols, values, shape, tol):
+    """
+    Return an orthonormal basis ``Q`` of the vectors ``y`` with ``|y^T B| <= tol`` and the residuals.
+
+    Square blocks are factorised with a sparse LU. If no pivot is small, the
+    block is treated as non-singular and an empty basis is returned. Otherwise
+    the left null space is found by inverse iteration with the slightly
+    shifted block, which amplifies the null directions, and a Rayleigh-Ritz
+    step that rotates the basis so that each vector has its own residual. The
+    other blocks, and all blocks without scipy, use a dense SVD.
+    """
+    if spla is not None and shape[0] == shape[1]:
+        B = sp.csc_matrix((values, (rows, cols)), shape=shape)
+        try:
+            pivots = np.abs(spla.splu(B).U.diagonal())
+            if pivots.min() > tol:
+                return np.empty((shape[0], 0)), np.empty(0)
+        except RuntimeError:
+            pass
+        try:
+            shift = max(1e-3 * tol, np.finfo(float).eps * np.abs(values).max())
+            lu = spla.splu((B + shift * sp.identity(shape[0])).tocsc())
+        except RuntimeError:
+            lu = None
+        if lu is not None:
+            rng = np.random.default_rng(0)
+            k = min(shape[0], 4)
+            while True:
+                Y = rng.standard_normal((shape[0], k))
+                for _ in range(2):
+                    Y, _ = np.linalg.qr(lu.solve(Y, trans="T"))
+                _, s, Wt = np.linalg.svd(B.T @ Y, full_matrices=False)
+                null = s <= tol
+                if null.all() and k < shape[0]:
+                    k = min(shape[0], 2 * k)
+                    continue
+                return (Y @ Wt.T)[:, null], s[null]
+    B = np.zeros(shape)
+    B[rows, cols] = values
+    U, s, _ = np.linalg.svd(B)
+    s = np.concatenate((s, np.zeros(shape[0] - len(s))))
+    null = s <= tol
+    return U[:, null], s[null]
+
+
+def _sparse_basis(Y, tol=1e-8):
+    """Reduce the columns of a null-space basis to row echelon form, so each vector involves few rows."""
+    Y = Y.T.copy()
+    for k in range(Y.shape[0]):
+        pivot = int(np.argmax(np.abs(Y[k])))
+        Y[k] /= Y[k, pivot]
+        for other in range(Y.shape[0]):
+            if other != k:
+                Y[other] -= Y[other, pivot] * Y[k]
+    return [np.flatnonzero(np.abs(y) > tol * np.abs(y).max()) for y in Y]
+
+
+def find_linear_dependencies(A, tol_strict=1e-12, tol_near=1e-8):
+    r"""
+    Find empty, colinear and linearly dependent equations of a linear system.
+
+    The diagnostic scales with the number of non-zero entries instead of the
+    number of row pairs:
+
+    1. Empty rows and columns are read from the sparsity pattern.
+    2. Colinear row pairs are found by hashing the normalised rows, see
+       :func:`_colinear_pairs`. A pair is colinear if the distance between
+       the rows scaled to unit length (up to the sign) is at most
+       ``tol_strict`` and nearly colinear if it is at most ``tol_near``.
+    3. Dependencies among more than two rows are found with a singular value
+       decomposition of the rows that can be dependent at all: rows holding
+       the only entry of a column are removed first and the rest is split
+       into blocks of rows sharing columns. Square blocks for which a sparse
+       LU factorisation has no pivot below ``tol_near`` times the largest
+       one are skipped. Singular values below ``tol_strict`` (``tol_near``)
+       times the largest singular value of the block give the (nearly)
+       dependent equation sets.
+
+    Parameters
+    ----------
+    A : numpy.ndarray, scipy.sparse.spmatrix or TripletMatrix
+        Coefficient matrix.
+    tol_strict : float, optional
+        Tolerance for exact dependencies (default is 1e-12).
+    tol_near : float, optional
+        Tolerance for near dependencies (default is 1e-8).
+
+    Returns
+    -------
+    dict
+        - ``zero_rows`` and ``zero_columns``: indices of empty rows and columns
+          (entries below ``tol_strict`` count as zero).
+        - ``colinear_equations_strict`` and ``colinear_equations_near_only``:
+          pairs ``(i, j)`` with ``i < j`` of colinear rows.
+        - ``dependent_equation_sets`` and ``near_dependent_equation_sets``:
+          lists of row indices whose rows are (nearly) linearly dependent,
+          one list per dependency.
+        - ``rank``: numerical rank of the matrix with tolerance ``tol_strict``.
+    """
+    shape = A.shape
+    rows, cols, values = _triplets(A)
+    keep = np.abs(values) >= tol_strict
+    order = np.lexsort((cols[keep], rows[keep]))
+    rows, cols, values = rows[keep][order], cols[keep][order], values[keep][order]
+
+    norms = np.sqrt(np.bincount(rows, weights=values**2, minlength=shape[0]))
+    zero_rows = np.flatnonzero(norms == 0).tolist()
+    zero_cols = np.flatnonzero(np.bincount(cols, minlength=shape[1]) == 0).tolist()
+    strict, near = _colinear_pairs(rows, cols, values, norms, tol_strict, tol_near)
+
+    dependent, near_dependent = [], []
+    active = _peel_column_singletons(rows, cols, np.abs(values) > tol_near * norms[rows], shape)
+    for block_rows in _row_blocks(rows, cols, active, shape):
+        mask = np.isin(rows, block_rows)
+        block_cols = np.unique(cols[mask])
+        block = (np.searchsorted(block_rows, rows[mask]), np.searchsorted(block_cols, cols[mask]))
+        scale = norms[block_rows].max()
+        Q, s = _left_null_space(*block, values[mask], (len(block_rows), len(block_cols)), tol_near * scale)
+        for sets, null in ((dependent, s <= tol_strict * scale), (near_dependent, s > tol_strict * scale)):
+            if null.any():
+                sets.extend(block_rows[support].tolist() for support in _sparse_basis(Q[:, null]))
+
+    return {
+        "zero_rows": zero_rows,
+        "zero_columns": zero_cols,
+        "colinear_equations_strict": strict,
+        "colinear_equations_near_only": near,
+        "dependent_equation_sets": sorted(dependent),
+        "near_dependent_equation_sets": sorted(near_dependent),
+        "rank": shape[0] - len(zero_rows) - len(dependent),
+    }
+
+
+def _adjacency(rows, cols, shape):
+    """Return the columns of each row and the rows of each column as lists."""
+    row_cols = [[] for _ in range(shape[0])]
+    col_rows = [[] for _ in range(shape[1])]
+    for i, j in zip(rows.tolist(), cols.tolist(), strict=True):
+        row_cols[i].append(j)
+        col_rows[j].append(i)
+    return row_cols, col_rows
+
+
+def _maximum_matching(rows, cols, shape, row_cols):
+    """Return the column matched to each row (-1 if unmatched) of a maximum bipartite matching."""
+    if maximum_bipartite_matching is not None:
+        graph = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=shape)
+        return maximum_bipartite_matching(graph, perm_type="column").tolist()
+    row_match = [-1] * shape[0]
+    col_match = [-1] * shape[1]
+    for start in range(shape[0]):
+        # Depth-first search for an augmenting path from the unmatched row
+        parent = {}
+        stack = [(start, iter(row_cols[start]))]
+        while stack:
+            row, candidates = stack[-1]
+            col = next((c for c in candidates if c not in parent), None)
+            if col is None:
+                stack.pop()
+                continue
+            parent[col] = row
+            if col_match[col] == -1:
+                while col is not None:
+                    row = parent[col]
+                    previous = row_match[row]
+                    row_match[row], col_match[col] = col, row
+                    col = previous if previous != -1 else None
+                break
+            stack.append((col_match[col], iter(row_cols[col_match[col]])))
+    return row_match
+
+
+def _reach(starts, neighbours, match):
+    """Return the nodes reachable from ``starts`` along alternating paths (any edge, then a matched edge)."""
+    seen, seen_other = set(starts), set()
+    queue = list(starts)
+    while queue:
+        node = queue.pop()
+        for other in neighbours[node]:
+            if other not in seen_other:
+                seen_other.add(other)
+                back = match[other]
+                if back != -1 and back not in seen:
+                    seen.add(back)
+                    queue.append(back)
+    return seen, seen_other
+
+
+def _split_blocks(part_rows, part_cols, row_cols):
+    """Split a part of the decomposition into connected blocks of ``(rows, columns)``."""
+    col_rows = {}
+    for row in part_rows:
+        for col in row_cols[row]:
+            if col in part_cols:
+                col_rows.setdefault(col, []).append(row)
+    remaining = {"row": set(part_rows), "col": set(part_cols)}
+    blocks = []
+    while remaining["row"] or remaining["col"]:
+        start = ("row", remaining["row"].pop()) if remaining["row"] else ("col", remaining["col"].pop())
+        block = {"row": set(), "col": set()}
+        block[start[0]].add(start[1])
+        queue = [start]
+        while queue:
+            kind, node = queue.pop()
+            other_kind = "col" if kind == "row" else "row"
+            for other in row_cols[node] if kind == "row" else col_rows.get(node, []):
+                if other in remaining[other_kind]:
+                    remaining[other_kind].discard(other)
+                    block[other_kind].add(other)
+                    queue.append((other_kind, other))
+        blocks.append((sorted(block["row"]), sorted(block["col"])))
+    return sorted(blocks)
+
+
+def dulmage_mendelsohn(A):
+    r"""
+    Structural analysis of a linear system by the coarse Dulmage-Mendelsohn decomposition.
+
+    Only the sparsity pattern of ``A`` is used: rows (equations) and columns
+    (variables) form a bipartite graph with an edge for every non-zero entry.
+    A maximum matching of that graph gives the structural rank, the largest
+    rank any matrix with the same pattern can have. Rows and columns left
+    unmatched, together with everything reachable from them along alternating
+    paths, form
+
+    - the under-determined part: variables that the equations cannot fix,
+      with more columns than rows;
+    - the over-determined part: equations that compete for too few
+      variables, with more rows than columns.
+
+    The remaining rows and columns form the well-determined square part. A
+    system with a structural rank below its size is singular for any
+    coefficients, so this check finds ill-posed systems before any numeric
+    factorisation.
+
+    Parameters
+    ----------
+    A : numpy.ndarray, scipy.sparse.spmatrix or TripletMatrix
+        Coefficient matrix.
+
+    Returns
+    -------
+    dict
+        - ``structural_rank``: size of the maximum matching.
+        - ``underdetermined`` and ``overdetermined``: lists of connected
+          blocks ``(rows, columns)`` of the two parts.
+    """
+    shape = A.shape
+    rows, cols, values = _triplets(A)
+    rows, cols = rows[values != 0], cols[values != 0]
+    row_cols, col_rows = _adjacency(rows, cols, shape)
+    row_match = _maximum_matching(rows, cols, shape, row_cols)
+    col_match = [-1] * shape[1]
+    for row, col in enumerate(row_match):
+        if col != -1:
+            col_match[col] = row
+
+    # Over-determined: from unmatched rows via any column to the row matched to it
+    over_rows, over_cols = _reach([i for i, j in enumerate(row_match) if j == -1], row_cols, col_match)
+    # Under-determined: from unmatched columns via any row to the column matched to it
+    under_cols, under_rows = _reach([j for j, i in enumerate(col_match) if i == -1], col_rows, row_match)
+
+    return {
+        "structural_rank": sum(1 for col in row_match if col != -1),
+        "underdetermined": _split_blocks(under_rows, under_cols, row_cols),
+        "overdetermined": _split_blocks(over_rows, over_cols, row_cols),
+    }
+
+
+def _strongly_connected_components(successors):
+    """
+    Return the strongly connected components of a directed graph (Tarjan's algorithm).
+
+    Every component is returned after all components it has an edge to, so for
+    the graph "row depends on the variable of row" the components come in the
+    order in which they can be solved.
+    """
+    n = len(successors)
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, i = work.pop()
+            if i == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            targets = successors[node]
+            while i < len(targets):
+                target = targets[i]
+                i += 1
+                if index[target] == -1:
+                    # Descend into the target and resume this node afterwards
+                    work.append((node, i))
+                    work.append((target, 0))
+                    break
+                if on_stack[target]:
+                    low[node] = min(low[node], index[target])
+            else:
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+    return components
+
+
+class BlockTriangularFactorisation:
+    r"""
+    Factorisation of a square matrix permuted to block lower-triangular form.
+
+    A maximum matching of equations and variables puts a non-zero entry on
+    the diagonal of every row. The strongly connected components of the
+    graph in which each row points to the rows whose (matched) variables it
+    uses are the diagonal blocks of the block lower-triangular form. They
+    are solved one after another, each with the solution of the blocks
+    before it, so a feed-forward system only needs one division per
+    variable and only the blocks of recycle loops are LU-factorised (with
+    :class:`LUFactorisation`). The interface matches
+    :class:`LUFactorisation`.
+
+    Parameters
+    ----------
+    A : numpy.ndarray, scipy.sparse.spmatrix or TripletMatrix
+        Square coefficient matrix.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the factorised matrix.
+    block_sizes : list of int
+        Sizes of the diagonal blocks in solution order.
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the matrix is structurally singular or a diagonal block is
+        singular.
+    """
+
+    def __init__(self, A):
+        self.shape = A.shape
+        if self.shape[0] != self.shape[1]:
+            raise np.linalg.LinAlgError("Matrix must be square")
+        rows, cols, values = _triplets(A)
+        keep = values != 0
+        order = np.lexsort((cols[keep], rows[keep]))
+        rows, cols, values = rows[keep][order], cols[keep][order], values[keep][order]
+        row_cols, _ = _adjacency(rows, cols, self.shape)
+        row_match = _maximum_matching(rows, cols, self.shape, row_cols)
+        if -1 in row_match:
+            raise np.linalg.LinAlgError("Singular matrix")
+        col_match = [0] * self.shape[1]
+        for row, col in enumerate(row_match):
+            col_match[col] = row
+        successors = [
+            [col_match[col] for col in row_cols[row] if col_match[col] != row] for row in range(self.shape[0])
+        ]
+
+        starts = np.searchsorted(rows, np.arange(self.shape[0] + 1))
+        self._blocks = []
+        for block_rows in _strongly_connected_components(successors):
+            block_cols = [row_match[row] for row in block_rows]
+            position = {col: k for k, col in enumerate(block_cols)}
+            diagonal = np.zeros((len(block_rows), len(block_cols)))
+            off_rows, off_cols, off_values = [], [], []
+            for k, row in enumerate(block_rows):
+                for col, value in zip(
+                    cols[starts[row] : starts[row + 1]].tolist(),
+                    values[starts[row] : starts[row + 1]].tolist(),
+                    strict=True,
+                ):
+                    if col in position:
+                        diagonal[k, position[col]] = value
+                    else:
+                        off_rows.append(k)
+                        off_cols.append(col)
+                        off_values.append(value)
+            if len(block_rows) == 1:
+                factorisation = diagonal[0, 0]
+            elif sp is not None and len(block_rows) >= SPARSE_THRESHOLD:
+                factorisation = LUFactorisation(sp.csr_matrix(diagonal))
+            else:
+                factorisation = LUFactorisation(diagonal)
+            self._blocks.append(
+                (
+                    np.array(block_rows),
+                    np.array(block_cols),
+                    factorisation,
+                    np.array(off_rows, dtype=np.intp),
+                    np.array(off_cols, dtype=np.intp),
+                    np.array(off_values),
+                )
+            )
+        self.block_sizes = [len(block[0]) for block in self._blocks]
+
+    def solve(self, b, trans=False):
+        """
+        Solve ``A x = b`` block by block.
+
+        Parameters
+        ----------
+        b : numpy.ndarray
+            Right-hand side of shape ``(n,)`` or ``(n, k)`` for ``k`` systems.
+        trans : bool, optional
+            Solve the transposed system ``A^T x = b`` instead. Its blocks are
+            solved in reverse order (default is False).
+
+        Returns
+        -------
+        numpy.ndarray
+            Solution with the shape of ``b``.
+        """
+        b = np.asarray(b, dtype=float)
+        x = np.zeros_like(b)
+        trailing = (1,) * (b.ndim - 1)
+        if trans:
+            # Contributions of the solved later blocks to the equations of the earlier blocks' variables
+            coupling = np.zeros_like(b)
+            for block_rows, block_cols, factorisation, off_rows, off_cols, off_values in reversed(self._blocks):
+                rhs = b[block_cols] - coupling[block_cols]
+                if isinstance(factorisation, LUFactorisation):
+                    x[block_rows] = factorisation.solve(rhs, trans=True)
+                else:
+                    x[block_rows] = rhs / factorisation
+                if len(off_values):
+                    np.add.at(coupling, off_cols, off_values.reshape((-1,) + trailing) * x[block_rows[off_rows]])
+            return x
+        for block_rows, block_cols, factorisation, off_rows, off_cols, off_values in self._blocks:
+            rhs = b[block_rows]
+            if len(off_values):
+                # Move the contributions of the variables of earlier blocks to the right-hand side
+                np.subtract.at(rhs, off_rows, off_values.reshape((-1,) + trailing) * x[off_cols])
+            if isinstance(factorisation, LUFactorisation):
+                x[block_cols] = factorisation.solve(rhs)
+            else:
+                x[block_cols] = rhs / factorisation
+        return x
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+#: Version of the cache entry format, part of every cache key.
+CACHE_FORMAT_VERSION = 1
+
+_CHUNK_SIZE = 1 << 20
+
+
+def file_hash(path):
+    """
+    Return the SHA-256 digest of a file's content.
+
+    Parameters
+    ----------
+    path : str
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    r"""
+    On-disk cache of parsed simulator models keyed on the model content.
+
+    Opening an Aspen Plus or Ebsilon model via COM and walking all blocks and
+    streams takes minutes for large models. The cache stores the parsed,
+    SI-normalised component and connection data returned by
+    :func:`~exerpy.parser.from_aspen.aspen_parser.run_aspen` or
+    :func:`~exerpy.parser.from_ebsilon.ebsilon_parser.run_ebsilon` as a
+    pickle file, so that repeated analyses of an unchanged model skip the
+    simulator.
+
+    An entry is identified by the SHA-256 hash of the model file, the parser
+    name and version, the ``split_physical_exergy`` flag and
+    :data:`CACHE_FORMAT_VERSION`. Changing any of them leads to a new key,
+    i.e. a cache miss; the stale entry is left in place until :meth:`clear`
+    is called. The key is stored in the entry as well and checked on
+    loading, and unreadable entries are treated as misses.
+
+    Parameters
+    ----------
+    directory : str
+        Cache directory, created if it does not exist.
+
+    Attributes
+    ----------
+    hits : int
+        Number of parses answered from the cache.
+    misses : int
+        Number of parses that had to run the simulator.
+
+    Notes
+    -----
+    Entries are pickle files, so only use cache directories you trust.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model_path, parser, parser_version, split_physical_exergy):
+        """
+        Return the cache key of a model.
+
+        Parameters
+        ----------
+        model_path : str
+            Path to the model file.
+        parser : str
+            Name of the parser, e.g. ``"aspen"``.
+        parser_version : str
+            Version of the parser; bump it when the parsed data changes.
+        split_physical_exergy : bool
+            Flag passed to the parser.
+
+        Returns
+        -------
+        dict
+            Key fields.
+        """
+        return {
+            "format": CACHE_FORMAT_VERSION,
+            "parser": parser,
+            "parser_version": str(parser_version),
+            "file_hash": file_hash(model_path),
+            "split_physical_exergy": bool(split_physical_exergy),
+        }
+
+    def entry_path(self, key):
+        """Return the path of the cache entry of a key."""
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(self.directory, f"{key['parser']}-{digest}.pkl")
+
+    def load(self, key):
+        """
+        Return the cached data of a key.
+
+        Parameters
+        ----------
+        key : dict
+            Key returned by :meth:`key`.
+
+        Returns
+        -------
+        dict or None
+            Parsed data, None if there is no valid entry.
+        """
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable parse cache entry {path}: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            logging.warning(f"Ignoring parse cache entry {path} with mismatching key.")
+            return None
+        return entry["data"]
+
+    def store(self, key, data):
+        """
+        Write the parsed data of a key to the cache.
+
+        The entry is written to a temporary file first and then moved into
+        place, so concurrent readers never see a partial entry.
+
+        Parameters
+        ----------
+        key : dict
+            Key returned by :meth:`key`.
+        data : dict
+            Parsed data.
+        """
+        path = self.entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def get(self, model_path, parser, parser_version, split_physical_exergy, parse):
+        """
+        Return the parsed data of a model, running the parser on a cache miss.
+
+        Parameters
+        ----------
+        model_path, parser, parser_version, split_physical_exergy
+            See :meth:`key`.
+        parse : callable
+            Function without arguments that parses the model, e.g.
+            ``lambda: run_aspen(path)``. Errors are not cached.
+
+        Returns
+        -------
+        dict
+            Parsed data. Every call returns a new copy, so the caller may
+            modify it.
+        """
+        key = self.key(model_path, parser, parser_version, split_physical_exergy)
+        data = self.load(key)
+        if data is not None:
+            self.hits += 1
+            logging.info(f"Loaded parsed model {model_path} from the parse cache.")
+            return data
+
+        self.misses += 1
+        data = parse()
+        self.store(key, data)
+        logging.info(f"Stored parsed model {model_path} in the parse cache.")
+        # Return a copy, like a cache hit, so that later processing does not alter what was parsed
+        return self.load(key)
+
+    def clear(self):
+        """
+        Remove all cache entries.
+
+        Returns
+        -------
+        int
+            Number of removed entries.
+        """
+        removed = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+        return removed
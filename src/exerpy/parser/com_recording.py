@@ -0,0 +1,311 @@
+import gzip
+import json
+import logging
+
+#: Version of the recording file format.
+RECORDING_FORMAT_VERSION = 1
+
+_PRIMITIVES = (type(None), bool, int, float, str)
+
+
+class ReplayError(LookupError):
+    """Raised if a replayed parser accesses something that was not recorded."""
+
+
+def _entry_key(op, key=""):
+    # "." attribute access, "()" call with JSON-encoded arguments, "[]" iteration
+    return f"{op}{key}"
+
+
+class ComRecorder:
+    r"""
+    Record the COM objects a parser touches, for replaying them without the simulator.
+
+    :meth:`wrap` returns a proxy of a COM object (e.g. the Aspen Plus document
+    or the Ebsilon application) that forwards every attribute access, call
+    and iteration to the object and records the result. Objects reached
+    through a proxy, e.g. the nodes returned by ``Tree.FindNode`` or the
+    pipes returned by ``ObjectCaster.CastToPipe``, are wrapped as well, so the
+    recording contains exactly the part of the COM tree the parser used:
+    values, unit strings, element lists and missing attributes.
+
+    Results are kept as a sequence per object and access, so stateful
+    objects (e.g. Ebsilon fluid data objects whose properties are set
+    before a calculation) replay in the same order. The recording is saved
+    as gzip-compressed JSON with :meth:`save` and replayed with
+    :class:`ComRecording`.
+
+    Attributes
+    ----------
+    objects : list of dict
+        Recorded accesses per object, ``{entry: [result, ...]}``.
+    roots : dict
+        ``{name: object_id}`` of the wrapped root objects.
+    """
+
+    def __init__(self):
+        self.objects = []
+        self.roots = {}
+
+    def wrap(self, name, obj):
+        """
+        Wrap a root COM object.
+
+        Parameters
+        ----------
+        name : str
+            Name of the root, e.g. ``"aspen"`` or ``"app"``.
+        obj : object
+            COM object.
+
+        Returns
+        -------
+        RecordingProxy
+            Recording proxy of the object.
+        """
+        proxy = self._proxy(obj)
+        self.roots[name] = proxy._ref
+        return proxy
+
+    def _proxy(self, obj):
+        self.objects.append({})
+        return RecordingProxy(obj, self, len(self.objects) - 1)
+
+    def _record(self, ref, entry, value):
+        encoded, live = self._encode(value)
+        self.objects[ref].setdefault(entry, []).append(encoded)
+        return live
+
+    def _record_error(self, ref, entry, error):
+        self.objects[ref].setdefault(entry, []).append({"e": f"{type(error).__name__}: {error}"})
+
+    def _encode(self, value):
+        if isinstance(value, _PRIMITIVES):
+            return value, value
+        if type(value) in (tuple, list):  # arrays returned by COM, collections are proxied
+            items = [self._encode(item) for item in value]
+            return {"t": [encoded for encoded, _ in items]}, tuple(live for _, live in items)
+        if isinstance(value, RecordingProxy):
+            return {"r": value._ref}, value
+        proxy = self._proxy(value)
+        return {"r": proxy._ref}, proxy
+
+    def save(self, path):
+        """
+        Write the recording to a gzip-compressed JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the recording file, e.g. ``"model.rec.json.gz"``.
+        """
+        data = {"format": RECORDING_FORMAT_VERSION, "roots": self.roots, "objects": self.objects}
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        logging.info(f"Saved COM recording of {len(self.objects)} objects to {path}")
+
+
+def _encode_args(args):
+    encoded = []
+    for arg in args:
+        if isinstance(arg, (RecordingProxy, ReplayObject)):
+            encoded.append({"r": arg._ref})
+        elif isinstance(arg, (tuple, list)):
+            encoded.append({"t": json.loads(_encode_args(arg))})
+        else:
+            encoded.append(arg)
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+def _unwrap(value):
+    if isinstance(value, RecordingProxy):
+        return value._obj
+    if isinstance(value, (tuple, list)):
+        return type(value)(_unwrap(item) for item in value)
+    return value
+
+
+class RecordingProxy:
+    """
+    Proxy of a COM object that records all accesses in a :class:`ComRecorder`.
+
+    Parameters
+    ----------
+    obj : object
+        COM object.
+    recorder : ComRecorder
+        Recorder the accesses are written to.
+    ref : int
+        Id of the object in the recording.
+    """
+
+    __slots__ = ("_obj", "_recorder", "_ref")
+
+    def __init__(self, obj, recorder, ref):
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_ref", ref)
+
+    def __getattr__(self, name):
+        entry = _entry_key(".", name)
+        try:
+            value = getattr(self._obj, name)
+        except AttributeError:
+            self._recorder.objects[self._ref].setdefault(entry, []).append({"m": 1})
+            raise
+        return self._recorder._record(self._ref, entry, value)
+
+    def __setattr__(self, name, value):
+        setattr(self._obj, name, _unwrap(value))
+
+    def __call__(self, *args):
+        entry = _entry_key("()", _encode_args(args))
+        try:
+            value = self._obj(*_unwrap(args))
+        except Exception as e:
+            self._recorder._record_error(self._ref, entry, e)
+            raise
+        return self._recorder._record(self._ref, entry, value)
+
+    def __iter__(self):
+        return iter(self._recorder._record(self._ref, _entry_key("[]"), list(self._obj)))
+
+    def __bool__(self):
+        return True
+
+
+class ComRecording:
+    r"""
+    Replay backend for a recording made with :class:`ComRecorder`.
+
+    The root objects returned by :meth:`root` offer the same surface as the
+    recorded COM objects (``Tree.FindNode``, ``Elements``, ``CastToPipe``,
+    attribute values, ...), so the Aspen Plus and Ebsilon parsers can run on
+    any platform without the simulators, e.g. for benchmarks and regression
+    tests. Each access returns the next recorded result for that object and
+    access; once the recorded results are used up, the last one is repeated.
+    Setting attributes has no effect.
+
+    Parameters
+    ----------
+    data : dict
+        Recording data as written by :meth:`ComRecorder.save`.
+
+    Raises
+    ------
+    ValueError
+        If the recording has an unsupported format version.
+    """
+
+    def __init__(self, data):
+        if data.get("format") != RECORDING_FORMAT_VERSION:
+            msg = f"Unsupported COM recording format {data.get('format')}, expected {RECORDING_FORMAT_VERSION}."
+            raise ValueError(msg)
+        self.roots = data["roots"]
+        self.objects = data["objects"]
+        self._cursors = {}
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a recording file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the recording file.
+
+        Returns
+        -------
+        ComRecording
+            Replay backend.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_recorder(cls, recorder):
+        """Return a replay backend of a recording that has not been saved."""
+        return cls({"format": RECORDING_FORMAT_VERSION, "roots": dict(recorder.roots), "objects": recorder.objects})
+
+    def root(self, name):
+        """
+        Return a recorded root object.
+
+        Parameters
+        ----------
+        name : str
+            Name the root was wrapped with, e.g. ``"aspen"``.
+
+        Returns
+        -------
+        ReplayObject
+            Replayed object.
+        """
+        if name not in self.roots:
+            msg = f"The COM recording has no root '{name}'. Available roots: {sorted(self.roots)}."
+            raise ReplayError(msg)
+        return ReplayObject(self, self.roots[name])
+
+    def rewind(self):
+        """Restart the replay, e.g. to run the parser again."""
+        self._cursors.clear()
+
+    def _next(self, ref, entry):
+        results = self.objects[ref].get(entry)
+        if results is None:
+            msg = f"The COM recording has no entry '{entry}' for object {ref}."
+            raise ReplayError(msg)
+        index = self._cursors.get((ref, entry), 0)
+        self._cursors[(ref, entry)] = index + 1
+        return self._decode(results[min(index, len(results) - 1)], entry)
+
+    def _decode(self, value, entry=None):
+        if not isinstance(value, dict):
+            return value
+        if "r" in value:
+            return ReplayObject(self, value["r"])
+        if "t" in value:
+            return tuple(self._decode(item) for item in value["t"])
+        if "m" in value:
+            raise AttributeError(entry.lstrip("."))
+        raise RuntimeError(value["e"])
+
+
+class ReplayObject:
+    """
+    Replayed COM object of a :class:`ComRecording`.
+
+    Parameters
+    ----------
+    recording : ComRecording
+        Replay backend.
+    ref : int
+        Id of the object in the recording.
+    """
+
+    __slots__ = ("_recording", "_ref")
+
+    def __init__(self, recording, ref):
+        object.__setattr__(self, "_recording", recording)
+        object.__setattr__(self, "_ref", ref)
+
+    def __getattr__(self, name):
+        return self._recording._next(self._ref, _entry_key(".", name))
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __call__(self, *args):
+        return self._recording._next(self._ref, _entry_key("()", _encode_args(args)))
+
+    def __iter__(self):
+        return iter(self._recording._next(self._ref, _entry_key("[]")))
+
+    def __bool__(self):
+        return True
+
+
+def is_replay(obj):
+    """Whether an object is replayed from a :class:`ComRecording`."""
+    return isinstance(obj, ReplayObject)
@@ -1,10 +1,18 @@
 import json
 import logging
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from exerpy.functions import convert_to_SI, fluid_property_data
+from exerpy.units import flush_unit_audit
 
+from ..com_recording import ComRecorder, ComRecording
 from .aspen_config import connector_mappings, grouped_components
+from .aspen_tree import CachedTree, StreamSnapshot
+
+#: Version of the parsed data layout, part of the parse cache key. Bump it when the parser output changes.
+PARSER_VERSION = "1"
 
 
 class AspenModelParser:
@@ -12,16 +20,22 @@ class AspenModelParser:
     A class to parse Aspen Plus models, simulate them, extract data, and write to JSON.
     """
 
-    def __init__(self, model_path, split_physical_exergy=True):
+    def __init__(self, model_path, split_physical_exergy=True, recording=None, n_workers=1):
         """
         Initializes the parser with the given model path.
 
         Parameters:
             model_path (str): Path to the Aspen Plus model file.
             split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+            recording (ComRecording or str): Optional COM recording (or path to one) to replay instead of
+                opening Aspen Plus, see exerpy.parser.com_recording.
+            n_workers (int): Number of worker threads that build the stream data while the streams are
+                fetched from Aspen Plus. With 1, the streams are parsed one after another.
         """
         self.model_path = model_path
         self.split_physical_exergy = split_physical_exergy
+        self.recording = ComRecording.load(recording) if isinstance(recording, str) else recording
+        self.n_workers = n_workers
         self.aspen = None  # Aspen Plus application instance
         self.components_data = {}  # Dictionary to store component data
         self.connections_data = {}  # Dictionary to store connection data
@@ -41,7 +55,13 @@ class AspenModelParser:
     def initialize_model(self):
         """
         Initializes the Aspen Plus application and opens the specified model.
+        With a COM recording, the recorded document is replayed instead.
         """
+        if self.recording is not None:
+            self.aspen = self.recording.root("aspen")
+            logging.info(f"Replaying recorded model: {self.model_path}")
+            return
+
         from win32com.client import Dispatch
 
         try:
@@ -54,6 +74,17 @@ class AspenModelParser:
             logging.error(f"Failed to initialize the model: {e}")
             raise
 
+    def start_recording(self):
+        """
+        Record all accesses to the Aspen Plus document from now on.
+
+        Returns:
+            ComRecorder: Recorder to save with ComRecorder.save once the model is parsed.
+        """
+        recorder = ComRecorder()
+        self.aspen = recorder.wrap("aspen", self.aspen)
+        return recorder
+
     def parse_model(self):
         """
         Parses the components and connections from the Aspen model.
@@ -85,450 +116,491 @@ class AspenModelParser:
         logging.warning(f"Stream tree discovered: {stream_names}")
         logging.warning("Stream parsing will collect standard properties (T, p, h, s, m, exergy) and user-requested properties: LFRAC->lf, VFRAC_OUT->vf, VLSTD->vstd, MOLEFRAC(N2/O2/AR/CO2/H2O)->mfn2/mfo2/mfar/mfco/mfho, HMX->hmx, SMX->smx, STRM_UPP USRE*->e_CH/e_M/e_PH/e_T")
 
-        # Initialize connection data with the common fields
+        if self.n_workers > 1:
+            self._parse_streams_pipelined(stream_names)
+            return
+
         for stream_name in stream_names:
-            self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}")
-            connection_data = {
-                "name": stream_name,
-                "kind": None,
-                "source_component": None,
-                "source_connector": None,
-                "target_component": None,
-                "target_connector": None,
-            }
+            # Resolve every node of the stream and read its attributes only once
+            self.connections_data[stream_name] = self.parse_stream(CachedTree(self.aspen.Tree), stream_name)
 
-            # Find the source and target components
-            source_port_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Ports\SOURCE")
-            if source_port_node is not None and source_port_node.Elements.Count > 0:
-                connection_data["source_component"] = source_port_node.Elements(0).Name
+    def _parse_streams_pipelined(self, stream_names):
+        """
+        Parses the streams with a pool of worker threads.
 
-            destination_port_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Ports\DEST")
-            if destination_port_node is not None and destination_port_node.Elements.Count > 0:
-                connection_data["target_component"] = destination_port_node.Elements(0).Name
+        The nodes of each stream are fetched on the calling thread, which owns the COM connection, into a
+        StreamSnapshot. Unit conversion and the assembly of the connection data run in the workers. At most
+        two streams per worker are in flight, and the results are stored in stream order, so the parsed
+        data is identical to the serial parse.
 
-            # HEAT AND POWER STREAMS
-            if self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Input\WORK") is not None:
-                connection_data["kind"] = "power"
-                connection_data["energy_flow"] = (
-                    convert_to_SI(
-                        "power",
-                        abs(self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT").Value),
-                        self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT").UnitString,
-                        context=f"stream:{stream_name}:POWER_OUT",
-                    )
-                    if self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT") is not None
-                    else None
-                )
-            elif self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Input\HEAT") is not None:
-                connection_data["kind"] = "heat"
-                connection_data["energy_flow"] = (
-                    convert_to_SI(
-                        "power",
-                        abs(self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC").Value),
-                        self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC").UnitString,
-                        context=f"stream:{stream_name}:QCALC",
-                    )
-                    if self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC") is not None
-                    else None
-                )
+        Parameters:
+            stream_names (list): Names of the streams in the order of the Aspen tree.
+        """
+        max_pending = 2 * self.n_workers
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+            for stream_name in stream_names:
+                if len(pending) >= max_pending:
+                    name, future = pending.popleft()
+                    self.connections_data[name] = future.result()
+                snapshot = StreamSnapshot.fetch(CachedTree(self.aspen.Tree), stream_name)
+                pending.append((stream_name, pool.submit(self.parse_stream, snapshot, stream_name)))
+            while pending:
+                name, future = pending.popleft()
+                self.connections_data[name] = future.result()
+
+    def parse_stream(self, tree, stream_name):
+        """
+        Parses a single stream (connection) of the Aspen model.
 
-            # MATERIAL STREAMS
-            else:
-                # Assume it's a material stream and retrieve additional properties
-                # Pre-fetch some nodes to avoid repeated FindNode calls and handle missing values safely
-                hmx_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX_FLOW\MIXED")
-                temp_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\TEMP_OUT\MIXED")
-                pres_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\PRES_OUT\MIXED")
-                hmx_mass_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX_MASS\MIXED")
-                smx_mass_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\SMX_MASS\MIXED")
-                massflm_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MASSFLMX\MIXED")
-                exergy_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL")
-                totflow_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\TOT_FLOW")
-                lfrac_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\LFRAC\MIXED")
-                vfrac_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\VFRAC_OUT\MIXED")
-                vlstd_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\VLSTD")
-                hmx_total_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX\MIXED")
-                smx_total_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\SMX\MIXED")
-                usrech_node = self.aspen.Tree.FindNode(
-                    rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USRECH\MIXED\TOTAL"
-                )
-                usreme_node = self.aspen.Tree.FindNode(
-                    rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USREME\MIXED\TOTAL"
-                )
-                usreph_node = self.aspen.Tree.FindNode(
-                    rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USREPH\MIXED\TOTAL"
+        Parameters:
+            tree: Aspen tree with a FindNode method, e.g. a CachedTree or a fetched StreamSnapshot.
+            stream_name (str): Name of the stream.
+
+        Returns:
+            dict: Connection data of the stream.
+        """
+        # Initialize connection data with the common fields
+        connection_data = {
+            "name": stream_name,
+            "kind": None,
+            "source_component": None,
+            "source_connector": None,
+            "target_component": None,
+            "target_connector": None,
+        }
+
+        # Find the source and target components
+        source_port_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Ports\SOURCE")
+        if source_port_node is not None and source_port_node.Elements.Count > 0:
+            connection_data["source_component"] = source_port_node.Elements(0).Name
+
+        destination_port_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Ports\DEST")
+        if destination_port_node is not None and destination_port_node.Elements.Count > 0:
+            connection_data["target_component"] = destination_port_node.Elements(0).Name
+
+        # HEAT AND POWER STREAMS
+        if tree.FindNode(rf"\Data\Streams\{stream_name}\Input\WORK") is not None:
+            connection_data["kind"] = "power"
+            connection_data["energy_flow"] = (
+                convert_to_SI(
+                    "power",
+                    abs(tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT").Value),
+                    tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT").UnitString,
+                    context=f"stream:{stream_name}:POWER_OUT",
                 )
-                usreth_node = self.aspen.Tree.FindNode(
-                    rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USRETH\MIXED\TOTAL"
+                if tree.FindNode(rf"\Data\Streams\{stream_name}\Output\POWER_OUT") is not None
+                else None
+            )
+        elif tree.FindNode(rf"\Data\Streams\{stream_name}\Input\HEAT") is not None:
+            connection_data["kind"] = "heat"
+            connection_data["energy_flow"] = (
+                convert_to_SI(
+                    "power",
+                    abs(tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC").Value),
+                    tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC").UnitString,
+                    context=f"stream:{stream_name}:QCALC",
                 )
-                # Warn if nodes exist but have no value
-                if temp_node is not None and temp_node.Value is None:
-                    logging.warning(f"TEMP_OUT node for stream {stream_name} has no value")
-                if pres_node is not None and pres_node.Value is None:
-                    logging.warning(f"PRES_OUT node for stream {stream_name} has no value")
-                if hmx_mass_node is not None and hmx_mass_node.Value is None:
-                    logging.warning(f"HMX_MASS node for stream {stream_name} has no value")
-                if hmx_node is not None and hmx_node.Value is None:
-                    logging.warning(f"HMX_FLOW node for stream {stream_name} has no value")
-                if smx_mass_node is not None and smx_mass_node.Value is None:
-                    logging.warning(f"SMX_MASS node for stream {stream_name} has no value")
-                if massflm_node is not None and massflm_node.Value is None:
-                    logging.warning(f"MASSFLMX node for stream {stream_name} has no value")
-                if exergy_node is not None and exergy_node.Value is None:
-                    logging.warning(f"EXERGYMS node for stream {stream_name} has no value")
-                if totflow_node is not None and totflow_node.Value is None:
-                    logging.warning(f"TOT_FLOW node for stream {stream_name} has no value")
-                if lfrac_node is not None and lfrac_node.Value is None:
-                    logging.warning(f"LFRAC node for stream {stream_name} has no value")
-                if vfrac_node is not None and vfrac_node.Value is None:
-                    logging.warning(f"VFRAC_OUT node for stream {stream_name} has no value")
-                if vlstd_node is not None and vlstd_node.Value is None:
-                    logging.warning(f"VLSTD node for stream {stream_name} has no value")
-                if hmx_total_node is not None and hmx_total_node.Value is None:
-                    logging.warning(f"HMX node for stream {stream_name} has no value")
-                if smx_total_node is not None and smx_total_node.Value is None:
-                    logging.warning(f"SMX node for stream {stream_name} has no value")
-                if usrech_node is not None and usrech_node.Value is None:
-                    logging.warning(f"USRECH node for stream {stream_name} has no value")
-                if usreme_node is not None and usreme_node.Value is None:
-                    logging.warning(f"USREME node for stream {stream_name} has no value")
-                if usreph_node is not None and usreph_node.Value is None:
-                    logging.warning(f"USREPH node for stream {stream_name} has no value")
-                if usreth_node is not None and usreth_node.Value is None:
-                    logging.warning(f"USRETH node for stream {stream_name} has no value")
-
-                connection_data.update(
-                    {
-                        "kind": "material",
-                        "T": (
-                            convert_to_SI("T", temp_node.Value, temp_node.UnitString, context=f"stream:{stream_name}:TEMP_OUT")
-                            if (temp_node is not None and temp_node.Value is not None)
-                            else None
-                        ),
-                        "T_unit": fluid_property_data["T"]["SI_unit"],
-                        "p": (
-                            convert_to_SI("p", pres_node.Value, pres_node.UnitString, context=f"stream:{stream_name}:PRES_OUT")
-                            if (pres_node is not None and pres_node.Value is not None)
-                            else None
-                        ),
-                        "p_unit": fluid_property_data["p"]["SI_unit"],
-                        "h": (
-                            convert_to_SI("h_m", hmx_mass_node.Value, hmx_mass_node.UnitString, context=f"stream:{stream_name}:HMX_MASS")
-                            if (hmx_mass_node is not None and hmx_mass_node.Value is not None)
-                            else None
-                        ),
-                        "h_unit": fluid_property_data["h"]["SI_unit"],
-                        "s": (
-                            convert_to_SI("s_m", smx_mass_node.Value, smx_mass_node.UnitString, context=f"stream:{stream_name}:SMX_MASS")
-                            if (smx_mass_node is not None and smx_mass_node.Value is not None)
-                            else None
-                        ),
-                        "s_unit": fluid_property_data["s"]["SI_unit"],
-                        "m": (
-                            convert_to_SI("m", massflm_node.Value, massflm_node.UnitString, context=f"stream:{stream_name}:MASSFLMX")
-                            if (massflm_node is not None and massflm_node.Value is not None)
-                            else None
-                        ),
-                        "m_unit": fluid_property_data["m"]["SI_unit"],
-                        "energy_flow": (
-                            abs(hmx_node.Value)
-                            if (hmx_node is not None and hmx_node.Value is not None)
-                            else None
-                        ),
-                        "energy_flow_unit": (
-                            hmx_node.UnitString
-                            if (hmx_node is not None and hmx_node.Value is not None)
-                            else None
-                        ),
-                        "e_PH": (
-                            convert_to_SI("e", exergy_node.Value, exergy_node.UnitString, context=f"stream:{stream_name}:EXERGYMS")
-                            if (exergy_node is not None and exergy_node.Value is not None)
-                            else (logging.warning(f"e_PH node not found or empty for stream {stream_name}"), None)[1]
-                        ),
-                        "n": (
-                            convert_to_SI("n", totflow_node.Value, totflow_node.UnitString, context=f"stream:{stream_name}:TOT_FLOW")
-                            if (totflow_node is not None and totflow_node.Value is not None)
-                            else None
-                        ),
-                        "n_unit": fluid_property_data["n"]["SI_unit"],
-                        "lfrac": lfrac_node.Value if (lfrac_node is not None and lfrac_node.Value is not None) else None,
-                        "lfrac_unit": (
-                            lfrac_node.UnitString if (lfrac_node is not None and lfrac_node.Value is not None) else None
-                        ),
-                        "vfrac_out": vfrac_node.Value if (vfrac_node is not None and vfrac_node.Value is not None) else None,
-                        "vfrac_out_unit": (
-                            vfrac_node.UnitString if (vfrac_node is not None and vfrac_node.Value is not None) else None
-                        ),
-                        "vlstd": vlstd_node.Value if (vlstd_node is not None and vlstd_node.Value is not None) else None,
-                        "vlstd_unit": (
-                            vlstd_node.UnitString if (vlstd_node is not None and vlstd_node.Value is not None) else None
-                        ),
-                        "hmx": (
-                            hmx_total_node.Value
-                            if (hmx_total_node is not None and hmx_total_node.Value is not None)
-                            else None
-                        ),
-                        "hmx_unit": (
-                            hmx_total_node.UnitString
-                            if (hmx_total_node is not None and hmx_total_node.Value is not None)
-                            else None
-                        ),
-                        "smx": (
-                            smx_total_node.Value
-                            if (smx_total_node is not None and smx_total_node.Value is not None)
-                            else None
-                        ),
-                        "smx_unit": (
-                            smx_total_node.UnitString
-                            if (smx_total_node is not None and smx_total_node.Value is not None)
-                            else None
-                        ),
-                        "usrech": (
-                            usrech_node.Value if (usrech_node is not None and usrech_node.Value is not None) else None
-                        ),
-                        "usrech_unit": (
-                            usrech_node.UnitString
-                            if (usrech_node is not None and usrech_node.Value is not None)
-                            else None
-                        ),
-                        "usreme": (
-                            usreme_node.Value if (usreme_node is not None and usreme_node.Value is not None) else None
-                        ),
-                        "usreme_unit": (
-                            usreme_node.UnitString
-                            if (usreme_node is not None and usreme_node.Value is not None)
-                            else None
-                        ),
-                        "usreph": (
-                            usreph_node.Value if (usreph_node is not None and usreph_node.Value is not None) else None
-                        ),
-                        "usreph_unit": (
-                            usreph_node.UnitString
-                            if (usreph_node is not None and usreph_node.Value is not None)
-                            else None
-                        ),
-                        "usreth": (
-                            usreth_node.Value if (usreth_node is not None and usreth_node.Value is not None) else None
-                        ),
-                        "usreth_unit": (
-                            usreth_node.UnitString
-                            if (usreth_node is not None and usreth_node.Value is not None)
-                            else None
-                        ),
-                        "mass_composition": {},
-                        "molar_composition": {},
-                    }
+                if tree.FindNode(rf"\Data\Streams\{stream_name}\Output\QCALC") is not None
+                else None
+            )
+
+        # MATERIAL STREAMS
+        else:
+            # Assume it's a material stream and retrieve additional properties
+            # Pre-fetch some nodes to avoid repeated FindNode calls and handle missing values safely
+            hmx_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX_FLOW\MIXED")
+            temp_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\TEMP_OUT\MIXED")
+            pres_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\PRES_OUT\MIXED")
+            hmx_mass_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX_MASS\MIXED")
+            smx_mass_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\SMX_MASS\MIXED")
+            massflm_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MASSFLMX\MIXED")
+            exergy_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\STRM_UPP\EXERGYMS\MIXED\TOTAL")
+            totflow_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\TOT_FLOW")
+            lfrac_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\LFRAC\MIXED")
+            vfrac_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\VFRAC_OUT\MIXED")
+            vlstd_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\VLSTD")
+            hmx_total_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\HMX\MIXED")
+            smx_total_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\SMX\MIXED")
+            usrech_node = tree.FindNode(
+                rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USRECH\MIXED\TOTAL"
+            )
+            usreme_node = tree.FindNode(
+                rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USREME\MIXED\TOTAL"
+            )
+            usreph_node = tree.FindNode(
+                rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USREPH\MIXED\TOTAL"
+            )
+            usreth_node = tree.FindNode(
+                rf"\Data\Streams\{stream_name}\Output\STRM_UPP\USRETH\MIXED\TOTAL"
+            )
+            # Warn if nodes exist but have no value
+            if temp_node is not None and temp_node.Value is None:
+                logging.warning(f"TEMP_OUT node for stream {stream_name} has no value")
+            if pres_node is not None and pres_node.Value is None:
+                logging.warning(f"PRES_OUT node for stream {stream_name} has no value")
+            if hmx_mass_node is not None and hmx_mass_node.Value is None:
+                logging.warning(f"HMX_MASS node for stream {stream_name} has no value")
+            if hmx_node is not None and hmx_node.Value is None:
+                logging.warning(f"HMX_FLOW node for stream {stream_name} has no value")
+            if smx_mass_node is not None and smx_mass_node.Value is None:
+                logging.warning(f"SMX_MASS node for stream {stream_name} has no value")
+            if massflm_node is not None and massflm_node.Value is None:
+                logging.warning(f"MASSFLMX node for stream {stream_name} has no value")
+            if exergy_node is not None and exergy_node.Value is None:
+                logging.warning(f"EXERGYMS node for stream {stream_name} has no value")
+            if totflow_node is not None and totflow_node.Value is None:
+                logging.warning(f"TOT_FLOW node for stream {stream_name} has no value")
+            if lfrac_node is not None and lfrac_node.Value is None:
+                logging.warning(f"LFRAC node for stream {stream_name} has no value")
+            if vfrac_node is not None and vfrac_node.Value is None:
+                logging.warning(f"VFRAC_OUT node for stream {stream_name} has no value")
+            if vlstd_node is not None and vlstd_node.Value is None:
+                logging.warning(f"VLSTD node for stream {stream_name} has no value")
+            if hmx_total_node is not None and hmx_total_node.Value is None:
+                logging.warning(f"HMX node for stream {stream_name} has no value")
+            if smx_total_node is not None and smx_total_node.Value is None:
+                logging.warning(f"SMX node for stream {stream_name} has no value")
+            if usrech_node is not None and usrech_node.Value is None:
+                logging.warning(f"USRECH node for stream {stream_name} has no value")
+            if usreme_node is not None and usreme_node.Value is None:
+                logging.warning(f"USREME node for stream {stream_name} has no value")
+            if usreph_node is not None and usreph_node.Value is None:
+                logging.warning(f"USREPH node for stream {stream_name} has no value")
+            if usreth_node is not None and usreth_node.Value is None:
+                logging.warning(f"USRETH node for stream {stream_name} has no value")
+
+            connection_data.update(
+                {
+                    "kind": "material",
+                    "T": (
+                        convert_to_SI("T", temp_node.Value, temp_node.UnitString, context=f"stream:{stream_name}:TEMP_OUT")
+                        if (temp_node is not None and temp_node.Value is not None)
+                        else None
+                    ),
+                    "T_unit": fluid_property_data["T"]["SI_unit"],
+                    "p": (
+                        convert_to_SI("p", pres_node.Value, pres_node.UnitString, context=f"stream:{stream_name}:PRES_OUT")
+                        if (pres_node is not None and pres_node.Value is not None)
+                        else None
+                    ),
+                    "p_unit": fluid_property_data["p"]["SI_unit"],
+                    "h": (
+                        convert_to_SI("h_m", hmx_mass_node.Value, hmx_mass_node.UnitString, context=f"stream:{stream_name}:HMX_MASS")
+                        if (hmx_mass_node is not None and hmx_mass_node.Value is not None)
+                        else None
+                    ),
+                    "h_unit": fluid_property_data["h"]["SI_unit"],
+                    "s": (
+                        convert_to_SI("s_m", smx_mass_node.Value, smx_mass_node.UnitString, context=f"stream:{stream_name}:SMX_MASS")
+                        if (smx_mass_node is not None and smx_mass_node.Value is not None)
+                        else None
+                    ),
+                    "s_unit": fluid_property_data["s"]["SI_unit"],
+                    "m": (
+                        convert_to_SI("m", massflm_node.Value, massflm_node.UnitString, context=f"stream:{stream_name}:MASSFLMX")
+                        if (massflm_node is not None and massflm_node.Value is not None)
+                        else None
+                    ),
+                    "m_unit": fluid_property_data["m"]["SI_unit"],
+                    "energy_flow": (
+                        abs(hmx_node.Value)
+                        if (hmx_node is not None and hmx_node.Value is not None)
+                        else None
+                    ),
+                    "energy_flow_unit": (
+                        hmx_node.UnitString
+                        if (hmx_node is not None and hmx_node.Value is not None)
+                        else None
+                    ),
+                    "e_PH": (
+                        convert_to_SI("e", exergy_node.Value, exergy_node.UnitString, context=f"stream:{stream_name}:EXERGYMS")
+                        if (exergy_node is not None and exergy_node.Value is not None)
+                        else (logging.warning(f"e_PH node not found or empty for stream {stream_name}"), None)[1]
+                    ),
+                    "n": (
+                        convert_to_SI("n", totflow_node.Value, totflow_node.UnitString, context=f"stream:{stream_name}:TOT_FLOW")
+                        if (totflow_node is not None and totflow_node.Value is not None)
+                        else None
+                    ),
+                    "n_unit": fluid_property_data["n"]["SI_unit"],
+                    "lfrac": lfrac_node.Value if (lfrac_node is not None and lfrac_node.Value is not None) else None,
+                    "lfrac_unit": (
+                        lfrac_node.UnitString if (lfrac_node is not None and lfrac_node.Value is not None) else None
+                    ),
+                    "vfrac_out": vfrac_node.Value if (vfrac_node is not None and vfrac_node.Value is not None) else None,
+                    "vfrac_out_unit": (
+                        vfrac_node.UnitString if (vfrac_node is not None and vfrac_node.Value is not None) else None
+                    ),
+                    "vlstd": vlstd_node.Value if (vlstd_node is not None and vlstd_node.Value is not None) else None,
+                    "vlstd_unit": (
+                        vlstd_node.UnitString if (vlstd_node is not None and vlstd_node.Value is not None) else None
+                    ),
+                    "hmx": (
+                        hmx_total_node.Value
+                        if (hmx_total_node is not None and hmx_total_node.Value is not None)
+                        else None
+                    ),
+                    "hmx_unit": (
+                        hmx_total_node.UnitString
+                        if (hmx_total_node is not None and hmx_total_node.Value is not None)
+                        else None
+                    ),
+                    "smx": (
+                        smx_total_node.Value
+                        if (smx_total_node is not None and smx_total_node.Value is not None)
+                        else None
+                    ),
+                    "smx_unit": (
+                        smx_total_node.UnitString
+                        if (smx_total_node is not None and smx_total_node.Value is not None)
+                        else None
+                    ),
+                    "usrech": (
+                        usrech_node.Value if (usrech_node is not None and usrech_node.Value is not None) else None
+                    ),
+                    "usrech_unit": (
+                        usrech_node.UnitString
+                        if (usrech_node is not None and usrech_node.Value is not None)
+                        else None
+                    ),
+                    "usreme": (
+                        usreme_node.Value if (usreme_node is not None and usreme_node.Value is not None) else None
+                    ),
+                    "usreme_unit": (
+                        usreme_node.UnitString
+                        if (usreme_node is not None and usreme_node.Value is not None)
+                        else None
+                    ),
+                    "usreph": (
+                        usreph_node.Value if (usreph_node is not None and usreph_node.Value is not None) else None
+                    ),
+                    "usreph_unit": (
+                        usreph_node.UnitString
+                        if (usreph_node is not None and usreph_node.Value is not None)
+                        else None
+                    ),
+                    "usreth": (
+                        usreth_node.Value if (usreth_node is not None and usreth_node.Value is not None) else None
+                    ),
+                    "usreth_unit": (
+                        usreth_node.UnitString
+                        if (usreth_node is not None and usreth_node.Value is not None)
+                        else None
+                    ),
+                    "mass_composition": {},
+                    "molar_composition": {},
+                }
+            )
+            # Retrieve the fluid names for the stream
+            mole_frac_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED")
+            if mole_frac_node is not None:
+                fluid_names = [fluid.Name for fluid in mole_frac_node.Elements]
+
+                # Retrieve the molar composition for each fluid
+                for fluid_name in fluid_names:
+                    mole_frac = tree.FindNode(
+                        rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{fluid_name}"
+                    ).Value
+                    if mole_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
+                        connection_data["molar_composition"][fluid_name] = mole_frac
+
+            for fluid_name in ["N2", "O2", "AR", "CO2", "H2O"]:
+                mole_frac_node = tree.FindNode(
+                    rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{fluid_name}"
                 )
-                # Retrieve the fluid names for the stream
-                mole_frac_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED")
                 if mole_frac_node is not None:
-                    fluid_names = [fluid.Name for fluid in mole_frac_node.Elements]
-
-                    # Retrieve the molar composition for each fluid
-                    for fluid_name in fluid_names:
-                        mole_frac = self.aspen.Tree.FindNode(
-                            rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{fluid_name}"
-                        ).Value
-                        if mole_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
-                            connection_data["molar_composition"][fluid_name] = mole_frac
-
-                for fluid_name in ["N2", "O2", "AR", "CO2", "H2O"]:
-                    mole_frac_node = self.aspen.Tree.FindNode(
-                        rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{fluid_name}"
-                    )
-                    if mole_frac_node is not None:
-                        mole_frac = mole_frac_node.Value
-                        if mole_frac not in [0, None]:
-                            connection_data["molar_composition"][fluid_name] = mole_frac
-
-                mass_frac_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED")
-                if mass_frac_node is not None:
-                    # Retrieve the mass composition for each fluid
-                    for fluid_name in [fluid.Name for fluid in mass_frac_node.Elements]:
-                        mass_frac = self.aspen.Tree.FindNode(
-                            rf"\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED\{fluid_name}"
-                        ).Value
-                        if mass_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
-                            connection_data["mass_composition"][fluid_name] = mass_frac
-
-                # Map the user-requested nodes into explicit properties
-                # Use 'x' conversion (unitless fraction) where appropriate
-                if lfrac_node is not None and lfrac_node.Value is not None:
-                    raw_unit = lfrac_node.UnitString or "1"
-                    try:
-                        connection_data["lf"] = convert_to_SI("xlf", lfrac_node.Value, raw_unit, context=f"stream:{stream_name}:LFRAC")
-                        connection_data["lf_unit"] = fluid_property_data["x"]["SI_unit"]
-                    except Exception:
-                        logging.warning(f"Conversion for LFRAC in stream {stream_name} failed; storing raw value.")
-                        connection_data["lf"] = lfrac_node.Value
-                        connection_data["lf_unit"] = None
-                    connection_data["lf_raw"] = lfrac_node.Value
-                    connection_data["lf_raw_unit"] = raw_unit
-                else:
-                    connection_data["lf"] = None
+                    mole_frac = mole_frac_node.Value
+                    if mole_frac not in [0, None]:
+                        connection_data["molar_composition"][fluid_name] = mole_frac
+
+            mass_frac_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED")
+            if mass_frac_node is not None:
+                # Retrieve the mass composition for each fluid
+                for fluid_name in [fluid.Name for fluid in mass_frac_node.Elements]:
+                    mass_frac = tree.FindNode(
+                        rf"\Data\Streams\{stream_name}\Output\MASSFRAC\MIXED\{fluid_name}"
+                    ).Value
+                    if mass_frac not in [0, None]:  # Skip fluids with 0 or None as the fraction
+                        connection_data["mass_composition"][fluid_name] = mass_frac
+
+            # Map the user-requested nodes into explicit properties
+            # Use 'x' conversion (unitless fraction) where appropriate
+            if lfrac_node is not None and lfrac_node.Value is not None:
+                raw_unit = lfrac_node.UnitString or "1"
+                try:
+                    connection_data["lf"] = convert_to_SI("xlf", lfrac_node.Value, raw_unit, context=f"stream:{stream_name}:LFRAC")
+                    connection_data["lf_unit"] = fluid_property_data["x"]["SI_unit"]
+                except Exception:
+                    logging.warning(f"Conversion for LFRAC in stream {stream_name} failed; storing raw value.")
+                    connection_data["lf"] = lfrac_node.Value
                     connection_data["lf_unit"] = None
-                    connection_data["lf_raw"] = None
-                    connection_data["lf_raw_unit"] = None
-
-                if vfrac_node is not None and vfrac_node.Value is not None:
-                    raw_unit = vfrac_node.UnitString or "1"
-                    try:
-                        connection_data["vf"] = convert_to_SI("xvf", vfrac_node.Value, raw_unit, context=f"stream:{stream_name}:VFRAC_OUT")
-                        connection_data["vf_unit"] = fluid_property_data["x"]["SI_unit"]
-                    except Exception:
-                        logging.warning(f"Conversion for VFRAC_OUT in stream {stream_name} failed; storing raw value.")
-                        connection_data["vf"] = vfrac_node.Value
-                        connection_data["vf_unit"] = None
-                    connection_data["vf_raw"] = vfrac_node.Value
-                    connection_data["vf_raw_unit"] = raw_unit
-                else:
-                    connection_data["vf"] = None
+                connection_data["lf_raw"] = lfrac_node.Value
+                connection_data["lf_raw_unit"] = raw_unit
+            else:
+                connection_data["lf"] = None
+                connection_data["lf_unit"] = None
+                connection_data["lf_raw"] = None
+                connection_data["lf_raw_unit"] = None
+
+            if vfrac_node is not None and vfrac_node.Value is not None:
+                raw_unit = vfrac_node.UnitString or "1"
+                try:
+                    connection_data["vf"] = convert_to_SI("xvf", vfrac_node.Value, raw_unit, context=f"stream:{stream_name}:VFRAC_OUT")
+                    connection_data["vf_unit"] = fluid_property_data["x"]["SI_unit"]
+                except Exception:
+                    logging.warning(f"Conversion for VFRAC_OUT in stream {stream_name} failed; storing raw value.")
+                    connection_data["vf"] = vfrac_node.Value
                     connection_data["vf_unit"] = None
-                    connection_data["vf_raw"] = None
-                    connection_data["vf_raw_unit"] = None
-
-                if vlstd_node is not None and vlstd_node.Value is not None:
-                    raw_unit = vlstd_node.UnitString or "1"
+                connection_data["vf_raw"] = vfrac_node.Value
+                connection_data["vf_raw_unit"] = raw_unit
+            else:
+                connection_data["vf"] = None
+                connection_data["vf_unit"] = None
+                connection_data["vf_raw"] = None
+                connection_data["vf_raw_unit"] = None
+
+            if vlstd_node is not None and vlstd_node.Value is not None:
+                raw_unit = vlstd_node.UnitString or "1"
+                try:
+                    connection_data["vstd"] = convert_to_SI("vstd", vlstd_node.Value, raw_unit, context=f"stream:{stream_name}:VLSTD")
+                    connection_data["vstd_unit"] = fluid_property_data["x"]["SI_unit"]
+                except Exception:
+                    logging.warning(f"Conversion for VLSTD in stream {stream_name} failed; storing raw value.")
+                    connection_data["vstd"] = vlstd_node.Value
+                    connection_data["vstd_unit"] = None
+                connection_data["vstd_raw"] = vlstd_node.Value
+                connection_data["vstd_raw_unit"] = raw_unit
+            else:
+                connection_data["vstd"] = None
+                connection_data["vstd_unit"] = None
+                connection_data["vstd_raw"] = None
+                connection_data["vstd_raw_unit"] = None
+
+            # Explicit species mole fractions
+            for sp, key in [("N2", "mfn2"), ("O2", "mfo2"), ("AR", "mfar"), ("CO2", "mfco"), ("H2O", "mfho")]:
+                sp_node = tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{sp}")
+                if sp_node is not None and sp_node.Value is not None:
+                    raw_unit = sp_node.UnitString or "1"
+                    property_key = {
+                        "N2": "x_n2",
+                        "O2": "x_o2",
+                        "AR": "x_ar",
+                        "CO2": "x_co2",
+                        "H2O": "x_h2o",
+                    }[sp]
                     try:
-                        connection_data["vstd"] = convert_to_SI("vstd", vlstd_node.Value, raw_unit, context=f"stream:{stream_name}:VLSTD")
-                        connection_data["vstd_unit"] = fluid_property_data["x"]["SI_unit"]
+                        connection_data[key] = convert_to_SI(property_key, sp_node.Value, raw_unit, context=f"stream:{stream_name}:MOLEFRAC:{sp}")
+                        connection_data[f"{key}_unit"] = fluid_property_data["x"]["SI_unit"]
                     except Exception:
-                        logging.warning(f"Conversion for VLSTD in stream {stream_name} failed; storing raw value.")
-                        connection_data["vstd"] = vlstd_node.Value
-                        connection_data["vstd_unit"] = None
-                    connection_data["vstd_raw"] = vlstd_node.Value
-                    connection_data["vstd_raw_unit"] = raw_unit
-                else:
-                    connection_data["vstd"] = None
-                    connection_data["vstd_unit"] = None
-                    connection_data["vstd_raw"] = None
-                    connection_data["vstd_raw_unit"] = None
-
-                # Explicit species mole fractions
-                for sp, key in [("N2", "mfn2"), ("O2", "mfo2"), ("AR", "mfar"), ("CO2", "mfco"), ("H2O", "mfho")]:
-                    sp_node = self.aspen.Tree.FindNode(rf"\Data\Streams\{stream_name}\Output\MOLEFRAC\MIXED\{sp}")
-                    if sp_node is not None and sp_node.Value is not None:
-                        raw_unit = sp_node.UnitString or "1"
-                        property_key = {
-                            "N2": "x_n2",
-                            "O2": "x_o2",
-                            "AR": "x_ar",
-                            "CO2": "x_co2",
-                            "H2O": "x_h2o",
-                        }[sp]
-                        try:
-                            connection_data[key] = convert_to_SI(property_key, sp_node.Value, raw_unit, context=f"stream:{stream_name}:MOLEFRAC:{sp}")
-                            connection_data[f"{key}_unit"] = fluid_property_data["x"]["SI_unit"]
-                        except Exception:
-                            logging.warning(f"Conversion for MOLEFRAC {sp} in stream {stream_name} failed; storing raw value.")
-                            connection_data[key] = sp_node.Value
-                            connection_data[f"{key}_unit"] = None
-                        connection_data[f"{key}_raw"] = sp_node.Value
-                        connection_data[f"{key}_raw_unit"] = raw_unit
-                        if sp_node.Value not in [0, None]:
-                            connection_data["molar_composition"].setdefault(sp, sp_node.Value)
-                    else:
-                        connection_data[key] = None
+                        logging.warning(f"Conversion for MOLEFRAC {sp} in stream {stream_name} failed; storing raw value.")
+                        connection_data[key] = sp_node.Value
                         connection_data[f"{key}_unit"] = None
-                        connection_data[f"{key}_raw"] = None
-                        connection_data[f"{key}_raw_unit"] = None
-
-                # HMX and SMX (per-mole/kmol properties) as explicit fields
-                # HMX and SMX (per-mole/kmol properties) as explicit fields
-                if hmx_total_node is not None and hmx_total_node.Value is not None:
-                    # store raw values
-                    connection_data["hmx_raw"] = hmx_total_node.Value
-                    connection_data["hmx_raw_unit"] = hmx_total_node.UnitString
-                    try:
-                        connection_data["hmx"] = convert_to_SI("h", hmx_total_node.Value, hmx_total_node.UnitString, context=f"stream:{stream_name}:HMX")
-                        connection_data["hmx_unit"] = fluid_property_data["h"]["SI_unit"]
-                    except Exception as e:
-                        logging.warning(f"HMX conversion for stream {stream_name} failed: {e}. Setting to None.")
-                        connection_data["hmx"] = None
-                        connection_data["hmx_unit"] = None
+                    connection_data[f"{key}_raw"] = sp_node.Value
+                    connection_data[f"{key}_raw_unit"] = raw_unit
+                    if sp_node.Value not in [0, None]:
+                        connection_data["molar_composition"].setdefault(sp, sp_node.Value)
                 else:
+                    connection_data[key] = None
+                    connection_data[f"{key}_unit"] = None
+                    connection_data[f"{key}_raw"] = None
+                    connection_data[f"{key}_raw_unit"] = None
+
+            # HMX and SMX (per-mole/kmol properties) as explicit fields
+            # HMX and SMX (per-mole/kmol properties) as explicit fields
+            if hmx_total_node is not None and hmx_total_node.Value is not None:
+                # store raw values
+                connection_data["hmx_raw"] = hmx_total_node.Value
+                connection_data["hmx_raw_unit"] = hmx_total_node.UnitString
+                try:
+                    connection_data["hmx"] = convert_to_SI("h", hmx_total_node.Value, hmx_total_node.UnitString, context=f"stream:{stream_name}:HMX")
+                    connection_data["hmx_unit"] = fluid_property_data["h"]["SI_unit"]
+                except Exception as e:
+                    logging.warning(f"HMX conversion for stream {stream_name} failed: {e}. Setting to None.")
                     connection_data["hmx"] = None
                     connection_data["hmx_unit"] = None
-                    connection_data["hmx_raw"] = None
-                    connection_data["hmx_raw_unit"] = None
-
-                if smx_total_node is not None and smx_total_node.Value is not None:
-                    connection_data["smx_raw"] = smx_total_node.Value
-                    connection_data["smx_raw_unit"] = smx_total_node.UnitString
-                    try:
-                        connection_data["smx"] = convert_to_SI("s", smx_total_node.Value, smx_total_node.UnitString, context=f"stream:{stream_name}:SMX")
-                        connection_data["smx_unit"] = fluid_property_data["s"]["SI_unit"]
-                    except Exception as e:
-                        logging.warning(f"SMX conversion for stream {stream_name} failed: {e}. Setting to None.")
-                        connection_data["smx"] = None
-                        connection_data["smx_unit"] = None
-                else:
+            else:
+                connection_data["hmx"] = None
+                connection_data["hmx_unit"] = None
+                connection_data["hmx_raw"] = None
+                connection_data["hmx_raw_unit"] = None
+
+            if smx_total_node is not None and smx_total_node.Value is not None:
+                connection_data["smx_raw"] = smx_total_node.Value
+                connection_data["smx_raw_unit"] = smx_total_node.UnitString
+                try:
+                    connection_data["smx"] = convert_to_SI("s", smx_total_node.Value, smx_total_node.UnitString, context=f"stream:{stream_name}:SMX")
+                    connection_data["smx_unit"] = fluid_property_data["s"]["SI_unit"]
+                except Exception as e:
+                    logging.warning(f"SMX conversion for stream {stream_name} failed: {e}. Setting to None.")
                     connection_data["smx"] = None
                     connection_data["smx_unit"] = None
-                    connection_data["smx_raw"] = None
-                    connection_data["smx_raw_unit"] = None
-
-                # STRM_UPP user-supplied exergy terms -> try 'e', fallback to 'power'
-                for node, key, name, property_key in [
-                    (usrech_node, "ech", "USRECH", "e_CH"),
-                    (usreme_node, "em", "USREME", "e_M"),
-                    (usreph_node, "eph", "USREPH", "e_PH"),
-                    (usreth_node, "eth", "USRETH", "e_T"),
-                ]:
-                    if node is not None and node.Value is not None:
-                        connection_data[f"{key}_raw"] = node.Value
-                        connection_data[f"{key}_raw_unit"] = node.UnitString
-                        try:
-                            connection_data[key] = convert_to_SI(property_key, node.Value, node.UnitString, context=f"stream:{stream_name}:{name}")
-                            connection_data[f"{key}_unit"] = fluid_property_data["e"]["SI_unit"]
-                        except Exception as e:
-                            logging.warning(f"Conversion for {name} in stream {stream_name} failed: {e}. Setting to None.")
-                            connection_data[key] = None
-                            connection_data[f"{key}_unit"] = None
-                    elif key not in connection_data:
+            else:
+                connection_data["smx"] = None
+                connection_data["smx_unit"] = None
+                connection_data["smx_raw"] = None
+                connection_data["smx_raw_unit"] = None
+
+            # STRM_UPP user-supplied exergy terms -> try 'e', fallback to 'power'
+            for node, key, name, property_key in [
+                (usrech_node, "ech", "USRECH", "e_CH"),
+                (usreme_node, "em", "USREME", "e_M"),
+                (usreph_node, "eph", "USREPH", "e_PH"),
+                (usreth_node, "eth", "USRETH", "e_T"),
+            ]:
+                if node is not None and node.Value is not None:
+                    connection_data[f"{key}_raw"] = node.Value
+                    connection_data[f"{key}_raw_unit"] = node.UnitString
+                    try:
+                        connection_data[key] = convert_to_SI(property_key, node.Value, node.UnitString, context=f"stream:{stream_name}:{name}")
+                        connection_data[f"{key}_unit"] = fluid_property_data["e"]["SI_unit"]
+                    except Exception as e:
+                        logging.warning(f"Conversion for {name} in stream {stream_name} failed: {e}. Setting to None.")
                         connection_data[key] = None
                         connection_data[f"{key}_unit"] = None
-                    if key not in connection_data or connection_data.get(f"{key}_raw") is None:
-                        connection_data[f"{key}_raw"] = None
-                        connection_data[f"{key}_raw_unit"] = None
-
-                # Log parsed properties for visibility
-                # Build a more detailed summary including raw units and raw values when available
-                summary_parts = []
-                def add_part(key, pretty):
-                    val = connection_data.get(key)
-                    raw = connection_data.get(f"{key}_raw")
-                    raw_unit = connection_data.get(f"{key}_raw_unit")
-                    unit = connection_data.get(f"{key}_unit")
-                    if val is None and raw is None:
-                        summary_parts.append(f"{pretty}=None")
+                elif key not in connection_data:
+                    connection_data[key] = None
+                    connection_data[f"{key}_unit"] = None
+                if key not in connection_data or connection_data.get(f"{key}_raw") is None:
+                    connection_data[f"{key}_raw"] = None
+                    connection_data[f"{key}_raw_unit"] = None
+
+            # Log parsed properties for visibility
+            # Build a more detailed summary including raw units and raw values when available
+            summary_parts = []
+            def add_part(key, pretty):
+                val = connection_data.get(key)
+                raw = connection_data.get(f"{key}_raw")
+                raw_unit = connection_data.get(f"{key}_raw_unit")
+                unit = connection_data.get(f"{key}_unit")
+                if val is None and raw is None:
+                    summary_parts.append(f"{pretty}=None")
+                else:
+                    if raw is not None and raw_unit is not None:
+                        summary_parts.append(f"{pretty}={val} (raw={raw} {raw_unit})")
+                    elif raw is not None:
+                        summary_parts.append(f"{pretty}={val} (raw={raw})")
                     else:
-                        if raw is not None and raw_unit is not None:
-                            summary_parts.append(f"{pretty}={val} (raw={raw} {raw_unit})")
-                        elif raw is not None:
-                            summary_parts.append(f"{pretty}={val} (raw={raw})")
-                        else:
-                            summary_parts.append(f"{pretty}={val}")
-
-                add_part("lf", "lf")
-                add_part("vf", "vf")
-                add_part("vstd", "vstd")
-                add_part("mfn2", "mfn2")
-                add_part("mfo2", "mfo2")
-                add_part("mfar", "mfar")
-                add_part("mfco", "mfco")
-                add_part("mfho", "mfho")
-                add_part("hmx", "hmx")
-                add_part("smx", "smx")
-                add_part("e_CH", "e_CH")
-                add_part("e_M", "e_M")
-                add_part("e_PH", "e_PH")
-                add_part("e_T", "e_T")
-
-                logging.warning(f"Parsed stream {stream_name}: " + ", ".join(summary_parts))
-
-            # Store connection data
-            self.connections_data[stream_name] = connection_data
+                        summary_parts.append(f"{pretty}={val}")
+
+            add_part("lf", "lf")
+            add_part("vf", "vf")
+            add_part("vstd", "vstd")
+            add_part("mfn2", "mfn2")
+            add_part("mfo2", "mfo2")
+            add_part("mfar", "mfar")
+            add_part("mfco", "mfco")
+            add_part("mfho", "mfho")
+            add_part("hmx", "hmx")
+            add_part("smx", "smx")
+            add_part("e_CH", "e_CH")
+            add_part("e_M", "e_M")
+            add_part("e_PH", "e_PH")
+            add_part("e_T", "e_T")
+
+            logging.warning(f"Parsed stream {stream_name}: " + ", ".join(summary_parts))
+
+        return connection_data
 
     def parse_blocks(self):
         """
@@ -1133,7 +1205,7 @@ class AspenModelParser:
             raise
 
 
-def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
+def run_aspen(model_path, output_dir=None, split_physical_exergy=True, record_path=None, n_workers=1):
     """
     Main function to process the Aspen model and return parsed data.
     Optionally writes the parsed data to a JSON file.
@@ -1142,6 +1214,9 @@ def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
         model_path (str): Path to the Aspen model file.
         output_dir (str): Optional path where the parsed data should be saved as a JSON file.
         split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+        record_path (str): Optional path where a COM recording of the parse is saved for replaying it
+            without Aspen Plus, see exerpy.parser.com_recording.
+        n_workers (int): Number of worker threads for parsing the streams, see AspenModelParser.
 
     Returns:
         dict: Parsed data in dictionary format.
@@ -1151,14 +1226,20 @@ def run_aspen(model_path, output_dir=None, split_physical_exergy=True):
         logging.error(error_msg)
         raise FileNotFoundError(error_msg)
 
-    parser = AspenModelParser(model_path, split_physical_exergy=split_physical_exergy)
+    parser = AspenModelParser(model_path, split_physical_exergy=split_physical_exergy, n_workers=n_workers)
 
     try:
         parser.initialize_model()
+        recorder = parser.start_recording() if record_path is not None else None
         parser.parse_model()
+        if recorder is not None:
+            recorder.save(record_path)
     except Exception as e:
         logging.error(f"An error occurred: {e}")
         raise RuntimeError(f"An error occurred: {e}")
+    finally:
+        # Write the units observed during this parse if unit auditing is enabled
+        flush_unit_audit()
 
     parsed_data = parser.get_sorted_data()
 
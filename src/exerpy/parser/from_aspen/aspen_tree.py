@@ -0,0 +1,213 @@
+class CachedNode:
+    r"""
+    Node of the Aspen Plus tree whose attributes are read only once.
+
+    Every attribute access on a COM node, e.g. ``node.Value`` or
+    ``node.UnitString``, is a cross-process call. The wrapper reads an
+    attribute on first access and keeps its value, so checking a node for a
+    value and then converting it does not query Aspen several times.
+
+    Parameters
+    ----------
+    node : object
+        Node of the Aspen COM tree.
+    """
+
+    __slots__ = ("_node", "_attributes")
+
+    def __init__(self, node):
+        self._node = node
+        self._attributes = {}
+
+    def __getattr__(self, name):
+        attributes = self._attributes
+        if name not in attributes:
+            attributes[name] = getattr(self._node, name)
+        return attributes[name]
+
+
+class CachedTree:
+    r"""
+    Handle cache for lookups in the Aspen Plus tree.
+
+    :meth:`FindNode` resolves a path with one COM call and keeps the result,
+    including missing nodes, so repeated lookups of the same path are
+    answered from the cache. Found nodes are wrapped in :class:`CachedNode`,
+    so their values and units are read once as well.
+
+    The parser creates one cache per stream, so the handles of a stream are
+    released once it has been parsed.
+
+    Parameters
+    ----------
+    tree : object
+        Aspen COM tree, i.e. ``Apwn.Document.Tree``, or any object with a
+        ``FindNode(path)`` method.
+
+    Attributes
+    ----------
+    lookups : int
+        Number of ``FindNode`` calls forwarded to the tree.
+    """
+
+    def __init__(self, tree):
+        self._tree = tree
+        self._nodes = {}
+        self.lookups = 0
+
+    def FindNode(self, path):
+        r"""
+        Return the node at a path, None if it does not exist.
+
+        Parameters
+        ----------
+        path : str
+            Absolute path, e.g. ``r"\Data\Streams\S1\Output\TEMP_OUT\MIXED"``.
+
+        Returns
+        -------
+        CachedNode or None
+            Cached node.
+        """
+        if path not in self._nodes:
+            self.lookups += 1
+            node = self._tree.FindNode(path)
+            self._nodes[path] = None if node is None else CachedNode(node)
+        return self._nodes[path]
+
+
+#: Output nodes of material streams read by the parser, relative to ``\Data\Streams\<name>\Output``.
+MATERIAL_OUTPUT_NODES = (
+    r"HMX_FLOW\MIXED",
+    r"TEMP_OUT\MIXED",
+    r"PRES_OUT\MIXED",
+    r"HMX_MASS\MIXED",
+    r"SMX_MASS\MIXED",
+    r"MASSFLMX\MIXED",
+    r"STRM_UPP\EXERGYMS\MIXED\TOTAL",
+    "TOT_FLOW",
+    r"LFRAC\MIXED",
+    r"VFRAC_OUT\MIXED",
+    "VLSTD",
+    r"HMX\MIXED",
+    r"SMX\MIXED",
+    r"STRM_UPP\USRECH\MIXED\TOTAL",
+    r"STRM_UPP\USREME\MIXED\TOTAL",
+    r"STRM_UPP\USREPH\MIXED\TOTAL",
+    r"STRM_UPP\USRETH\MIXED\TOTAL",
+)
+
+#: Species whose mole fractions are always looked up.
+MOLE_FRACTION_SPECIES = ("N2", "O2", "AR", "CO2", "H2O")
+
+
+class SnapshotElements(list):
+    """Child list of a :class:`NodeSnapshot` with the ``Count`` and call surface of a COM collection."""
+
+    @property
+    def Count(self):
+        return len(self)
+
+    def __call__(self, index):
+        return self[index]
+
+
+class NodeSnapshot:
+    """
+    Plain-data copy of an Aspen Plus tree node.
+
+    Parameters
+    ----------
+    Name : str
+        Name of the node.
+    Value : object, optional
+        Value of the node.
+    UnitString : str, optional
+        Unit of the value, only read if the node has a value.
+    Elements : SnapshotElements, optional
+        Children (names only), None if they were not fetched.
+    """
+
+    __slots__ = ("Name", "Value", "UnitString", "Elements")
+
+    def __init__(self, Name, Value=None, UnitString=None, Elements=None):
+        self.Name = Name
+        self.Value = Value
+        self.UnitString = UnitString
+        self.Elements = Elements
+
+    @classmethod
+    def copy(cls, node, elements=False):
+        """Copy a COM node, with the names of its children if ``elements`` is True."""
+        value = node.Value
+        unit = node.UnitString if value is not None else None
+        children = SnapshotElements(cls(child.Name) for child in node.Elements) if elements else None
+        return cls(node.Name, value, unit, children)
+
+
+class StreamSnapshot:
+    r"""
+    Plain-data copy of the nodes of one stream, fetched on the COM thread.
+
+    :meth:`fetch` reads the nodes the parser uses for a stream, following
+    the same branches (power, heat or material stream), so a snapshot can be
+    parsed in a worker thread without touching COM. Looking up a node that
+    was not fetched raises a LookupError instead of silently returning None.
+
+    Parameters
+    ----------
+    nodes : dict
+        ``{path: NodeSnapshot or None}``.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    @classmethod
+    def fetch(cls, tree, stream_name):
+        """
+        Fetch the nodes of a stream.
+
+        Parameters
+        ----------
+        tree : object
+            Aspen COM tree with a ``FindNode(path)`` method.
+        stream_name : str
+            Name of the stream.
+
+        Returns
+        -------
+        StreamSnapshot
+            Snapshot of the stream.
+        """
+        root = rf"\Data\Streams\{stream_name}"
+        nodes = {}
+
+        def get(path, elements=False):
+            node = tree.FindNode(path)
+            nodes[path] = None if node is None else NodeSnapshot.copy(node, elements)
+            return nodes[path]
+
+        get(rf"{root}\Ports\SOURCE", elements=True)
+        get(rf"{root}\Ports\DEST", elements=True)
+        if get(rf"{root}\Input\WORK") is not None:
+            get(rf"{root}\Output\POWER_OUT")
+        elif get(rf"{root}\Input\HEAT") is not None:
+            get(rf"{root}\Output\QCALC")
+        else:
+            for path in MATERIAL_OUTPUT_NODES:
+                get(rf"{root}\Output\{path}")
+            for fraction, species in (("MOLEFRAC", MOLE_FRACTION_SPECIES), ("MASSFRAC", ())):
+                parent = get(rf"{root}\Output\{fraction}\MIXED", elements=True)
+                names = [child.Name for child in parent.Elements] if parent is not None else []
+                for name in dict.fromkeys([*names, *species]):
+                    get(rf"{root}\Output\{fraction}\MIXED\{name}")
+        return cls(nodes)
+
+    def FindNode(self, path):
+        """Return the fetched node at a path, None if it does not exist."""
+        try:
+            return self.nodes[path]
+        except KeyError:
+            msg = f"Node {path} was not fetched for the stream."
+            raise LookupError(msg) from None
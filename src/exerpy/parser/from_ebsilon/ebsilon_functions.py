@@ -119,8 +119,96 @@ def calc_X_from_PT(app: Any, pipe: Any, property: str, pressure: float, temperat
         return None
 
 
+class ReferenceStateCache:
+    """
+    Per-parse cache of the dead-state properties of the streams.
+
+    The thermal exergy of a stream needs the enthalpy and entropy of its fluid
+    at the stream pressure and ambient temperature, two Ebsilon property
+    evaluations per stream. The cache keeps them per fluid signature (fluid
+    type and medium or gas composition), pressure and ambient temperature,
+    so streams of the same fluid at the same pressure, and repeated requests
+    for one stream, are evaluated once.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requests answered from the cache.
+    misses : int
+        Number of requests that evaluated the properties.
+    """
+
+    def __init__(self):
+        self._states = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._states)
+
+    @staticmethod
+    def fluid_signature(pipe: Any) -> tuple:
+        """
+        Return the properties of a stream that determine its fluid in :func:`calc_X_from_PT`.
+
+        Parameters
+        ----------
+        pipe : Stream object
+            The stream object containing fluid and composition information.
+
+        Returns
+        -------
+        tuple
+            Fluid type, followed by the medium (two-phase and thermo liquids) or
+            the substance fractions (gases).
+        """
+        fluid_type = pipe.Kind - 1000
+        if fluid_type in (3, 4):  # steam or water, the phase follows from pressure and temperature
+            return (3,)
+        if fluid_type in (15, 16, 17, 20):
+            return (fluid_type, pipe.FMED.Value)
+        return (fluid_type, *(getattr(pipe, substance_key).Value for substance_key in substance_mapping))
+
+    def get(self, app: Any, pipe: Any, pressure: float, Tamb: float) -> tuple[float, float]:
+        """
+        Return the enthalpy and entropy of a stream's fluid at the dead state.
+
+        Parameters
+        ----------
+        app : Ebsilon application instance
+            The Ebsilon application used for the property evaluations.
+        pipe : Stream object
+            The stream object containing fluid and composition information.
+        pressure : float
+            The pressure value (in Pa).
+        Tamb : float
+            The ambient temperature (in K).
+
+        Returns
+        -------
+        tuple of float
+            Enthalpy (in J/kg) and entropy (in J/kgK).
+        """
+        key = (self.fluid_signature(pipe), pressure, Tamb)
+        state = self._states.get(key)
+        if state is None:
+            self.misses += 1
+            state = (calc_X_from_PT(app, pipe, "H", pressure, Tamb), calc_X_from_PT(app, pipe, "S", pressure, Tamb))
+            self._states[key] = state
+        else:
+            self.hits += 1
+        return state
+
+
 @require_ebsilon
-def calc_eT(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> float:
+def calc_eT(
+    app: Any,
+    pipe: Any,
+    pressure: float,
+    Tamb: float,
+    pamb: float,
+    reference_states: ReferenceStateCache | None = None,
+) -> float:
     """
     Calculate the thermal component of physical exergy.
 
@@ -136,6 +224,8 @@ def calc_eT(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> f
         The ambient temperature (in K).
     pamb : float
         The ambient pressure (in Pa).
+    reference_states : ReferenceStateCache, optional
+        Cache of the dead-state properties. Without a cache, they are evaluated on every call.
 
     Returns
     -------
@@ -144,8 +234,11 @@ def calc_eT(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> f
     """
     h_i = convert_to_SI("h", pipe.H.Value, unit_id_to_string.get(pipe.H.Dimension, "Unknown"))  # in SI unit [J / kg]
     s_i = convert_to_SI("s", pipe.S.Value, unit_id_to_string.get(pipe.S.Dimension, "Unknown"))  # in SI unit [J / kgK]
-    h_A = calc_X_from_PT(app, pipe, "H", pressure, Tamb)  # in SI unit [J / kg]
-    s_A = calc_X_from_PT(app, pipe, "S", pressure, Tamb)  # in SI unit [J / kgK]
+    if reference_states is None:
+        h_A = calc_X_from_PT(app, pipe, "H", pressure, Tamb)  # in SI unit [J / kg]
+        s_A = calc_X_from_PT(app, pipe, "S", pressure, Tamb)  # in SI unit [J / kgK]
+    else:
+        h_A, s_A = reference_states.get(app, pipe, pressure, Tamb)
     eT = h_i - h_A - Tamb * (s_i - s_A)  # in SI unit [J / kg]
 
     return eT
@@ -181,6 +274,43 @@ def calc_eM(app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float) -> f
     return eM
 
 
+@require_ebsilon
+def calc_physical_split(
+    app: Any, pipe: Any, pressure: float, Tamb: float, pamb: float, reference_states: ReferenceStateCache | None = None
+) -> tuple[float, float, float]:
+    """
+    Calculate the thermal, mechanical and total physical exergy of a stream.
+
+    The dead-state properties are evaluated once for all three values,
+    whereas :func:`calc_eT` and :func:`calc_eM` evaluate them on every call.
+
+    Parameters
+    ----------
+    app : Ebsilon application instance
+        The Ebsilon application instance.
+    pipe : Stream object
+        The stream object containing thermodynamic properties.
+    pressure : float
+        The pressure value (in Pa).
+    Tamb : float
+        The ambient temperature (in K).
+    pamb : float
+        The ambient pressure (in Pa).
+    reference_states : ReferenceStateCache, optional
+        Cache of the dead-state properties, shared by the streams of a parse.
+
+    Returns
+    -------
+    tuple of float
+        Thermal, mechanical and physical exergy ``(e_T, e_M, e_PH)`` (in J/kg).
+    """
+    if reference_states is None:
+        reference_states = ReferenceStateCache()
+    e_PH = convert_to_SI("e", pipe.E.Value, unit_id_to_string.get(pipe.E.Dimension, "Unknown"))
+    e_T = calc_eT(app, pipe, pressure, Tamb, pamb, reference_states)
+    return e_T, e_PH - e_T, e_PH
+
+
 def calc_eph_from_min(pipe: Any, Tamb: float) -> float | None:
     """
     Calculate physical exergy using the minimum-valid-temperature reference state.
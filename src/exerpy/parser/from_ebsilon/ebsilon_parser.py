@@ -11,9 +11,11 @@ import os
 from typing import Any
 
 from exerpy.functions import convert_to_SI, fluid_property_data
+from exerpy.units import flush_unit_audit
 
+from ..com_recording import ComRecorder, ComRecording
 from . import __ebsilon_available__, is_ebsilon_available
-from .ebsilon_functions import calc_eph_from_min
+from .ebsilon_functions import ReferenceStateCache, calc_eph_from_min
 from .utils import EpCalculationResultStatus2Stub, EpFluidTypeStub, EpGasTableStub, EpSteamTableStub, require_ebsilon
 
 # Import Ebsilon classes if available
@@ -37,6 +39,9 @@ from .ebsilon_config import (
     unit_id_to_string,
 )
 
+#: Version of the parsed data layout, part of the parse cache key. Bump it when the parser output changes.
+PARSER_VERSION = "1"
+
 # Configure logging to display info-level messages
 logging.basicConfig(level=logging.ERROR)
 
@@ -46,19 +51,25 @@ class EbsilonModelParser:
     A class to parse Ebsilon models, simulate them, extract data, and write to JSON.
     """
 
-    def __init__(self, model_path: str, split_physical_exergy: bool = True):
+    def __init__(
+        self, model_path: str, split_physical_exergy: bool = True, recording: ComRecording | str | None = None
+    ):
         """
         Initializes the parser with the given model path.
 
         Parameters:
             model_path (str): Path to the Ebsilon model file.
             split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+            recording (ComRecording or str): Optional COM recording (or path to one) to replay instead of
+                running Ebsilon, see exerpy.parser.com_recording. Replaying does not require Ebsilon.
 
         Raises:
             RuntimeError: If Ebsilon is not available but is required for parsing.
         """
+        self.recording = ComRecording.load(recording) if isinstance(recording, str) else recording
+
         # Check if Ebsilon is available
-        if not is_ebsilon_available():
+        if self.recording is None and not is_ebsilon_available():
             logging.warning(
                 "EbsilonModelParser initialized without Ebsilon support. "
                 "EBS environment variable is not set or EbsOpen could not be imported; "
@@ -79,6 +90,7 @@ class EbsilonModelParser:
         self.connections_data: dict[str, dict[str, Any]] = {}  # Dictionary to store connection data
         self.Tamb: float | None = None  # Ambient temperature
         self.pamb: float | None = None  # Ambient pressure
+        self.reference_states = ReferenceStateCache()  # Dead-state properties of the parsed streams
 
         self._storages_to_postprocess: list[dict[str, Any]] = []
 
@@ -86,11 +98,19 @@ class EbsilonModelParser:
     def initialize_model(self):
         """
         Initializes the Ebsilon application and opens the specified model.
+        With a COM recording, the recorded application, model and ObjectCaster are replayed instead.
 
         Raises:
             FileNotFoundError: If the model file cannot be opened.
             RuntimeError: If the COM server cannot be started or ObjectCaster cannot be obtained.
         """
+        if self.recording is not None:
+            self.app = self.recording.root("app")
+            self.model = self.recording.root("model")
+            self.oc = self.recording.root("oc")
+            logging.info(f"Replaying recorded model: {self.model_path}")
+            return
+
         # 1) start the COM server
         try:
             self.app = Dispatch("EbsOpen.Application")
@@ -114,6 +134,19 @@ class EbsilonModelParser:
 
         logging.info(f"Model opened successfully: {self.model_path}")
 
+    def start_recording(self) -> ComRecorder:
+        """
+        Record all accesses to the Ebsilon application, model and ObjectCaster from now on.
+
+        Returns:
+            ComRecorder: Recorder to save with ComRecorder.save once the model is parsed.
+        """
+        recorder = ComRecorder()
+        self.app = recorder.wrap("app", self.app)
+        self.model = recorder.wrap("model", self.model)
+        self.oc = recorder.wrap("oc", self.oc)
+        return recorder
+
     @require_ebsilon
     def simulate_model(self):
         """
@@ -147,6 +180,8 @@ class EbsilonModelParser:
             ValueError: If ambient conditions are not set.
             Exception: If model parsing fails.
         """
+        # The dead-state properties depend on the simulated model, so they are cached per parse
+        self.reference_states = ReferenceStateCache()
         try:
             total_objects = self.model.Objects.Count
             logging.info(f"Parsing {total_objects} objects from the model")
@@ -189,7 +224,7 @@ class EbsilonModelParser:
         Parameters:
             obj: The Ebsilon component object whose connections are to be parsed.
         """
-        from .ebsilon_functions import calc_eM, calc_eT
+        from .ebsilon_functions import calc_physical_split
 
         # Cast the pipe to the correct type
         pipe_cast = self.oc.CastToPipe(obj)
@@ -336,8 +371,9 @@ class EbsilonModelParser:
 
                 # Add the mechanical and thermal specific exergies unless the flag is set to False
                 if self.split_physical_exergy:
-                    e_T_value = calc_eT(self.app, pipe_cast, connection_data["p"], self.Tamb, self.pamb)
-                    e_M_value = calc_eM(self.app, pipe_cast, connection_data["p"], self.Tamb, self.pamb)
+                    e_T_value, e_M_value, _ = calc_physical_split(
+                        self.app, pipe_cast, connection_data["p"], self.Tamb, self.pamb, self.reference_states
+                    )
 
                     connection_data.update(
                         {
@@ -711,7 +747,12 @@ class EbsilonModelParser:
             raise
 
 
-def run_ebsilon(model_path: str, output_dir: str | None = None, split_physical_exergy: bool = True) -> dict[str, Any]:
+def run_ebsilon(
+    model_path: str,
+    output_dir: str | None = None,
+    split_physical_exergy: bool = True,
+    record_path: str | None = None,
+) -> dict[str, Any]:
     """
     Main function to process the Ebsilon model and return parsed data.
     Optionally writes the parsed data to a JSON file.
@@ -720,6 +761,8 @@ def run_ebsilon(model_path: str, output_dir: str | None = None, split_physical_e
         model_path (str): Path to the Ebsilon model file.
         output_dir (str): Optional path where the parsed data should be saved as a JSON file.
         split_physical_exergy (bool): Flag to split physical exergy into thermal and mechanical components.
+        record_path (str): Optional path where a COM recording of the simulation and parse is saved
+            for replaying it without Ebsilon, see exerpy.parser.com_recording.
 
     Returns:
         dict: Parsed data in dictionary format.
@@ -761,6 +804,8 @@ def run_ebsilon(model_path: str, output_dir: str | None = None, split_physical_e
         logging.error(error_msg)
         raise RuntimeError(error_msg)
 
+    recorder = parser.start_recording() if record_path is not None else None
+
     try:
         # Simulate the Ebsilon model
         parser.simulate_model()
@@ -778,6 +823,12 @@ def run_ebsilon(model_path: str, output_dir: str | None = None, split_physical_e
         error_msg = f"An error occurred during model parsing: {e}"
         logging.error(error_msg)
         raise RuntimeError(error_msg)
+    finally:
+        # Write the units observed during this parse if unit auditing is enabled
+        flush_unit_audit()
+
+    if recorder is not None:
+        recorder.save(record_path)
 
     # Get the parsed and sorted data
     parsed_data = parser.get_sorted_data()
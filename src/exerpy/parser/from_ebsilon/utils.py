@@ -2,6 +2,7 @@ import functools
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
+from exerpy.parser.com_recording import is_replay
 from exerpy.parser.from_ebsilon import __ebsilon_available__
 
 # Type variable for the decorated function
@@ -12,6 +13,9 @@ def require_ebsilon(func: F) -> F:
     """
     Decorator to ensure that Ebsilon functionality is available.
 
+    Calls on a replayed COM recording (a parser with a recording or a replayed
+    Ebsilon object as first argument) do not need Ebsilon.
+
     Args:
         func: The function that requires Ebsilon functionality
 
@@ -24,7 +28,7 @@ def require_ebsilon(func: F) -> F:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not __ebsilon_available__:
+        if not __ebsilon_available__ and not _replaying(args):
             error_msg = (
                 "Ebsilon functionality is not available because the 'EBS' "
                 "environment variable is not set or EbsOpen could not be imported. "
@@ -36,6 +40,12 @@ def require_ebsilon(func: F) -> F:
     return cast(F, wrapper)
 
 
+def _replaying(args: tuple) -> bool:
+    if not args:
+        return False
+    return is_replay(args[0]) or getattr(args[0], "recording", None) is not None
+
+
 # Stub classes for when Ebsilon isn't available
 class EpSubstanceStub:
     """Stub class for EpSubstance when Ebsilon is not available."""
@@ -0,0 +1,215 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .analyses import EconomicAnalysis, ExergoeconomicAnalysis, ExergyAnalysis
+
+#: Scenario parameters that are passed to :class:`~exerpy.EconomicAnalysis`.
+ECONOMIC_PARAMETERS = ("tau", "i_eff", "n", "r_n")
+
+#: Columns of the tidy results DataFrame returned by :meth:`ScenarioBatch.run`.
+RESULT_COLUMNS = ("Scenario", "Type", "Object", "Variable", "Value", "Unit")
+
+
+class ScenarioBatch:
+    r"""
+    Run many exergoeconomic scenarios on a model that is parsed and analysed once.
+
+    Sensitivity studies used to reload the model with
+    :meth:`ExergyAnalysis.from_json` for every price or full load hour
+    combination, which re-reads the file, recomputes the chemical exergy and
+    rebuilds the components each time. A batch keeps one analysed
+    :class:`~exerpy.ExergyAnalysis` and only re-solves the cost equations
+    per scenario, using :meth:`ExergoeconomicAnalysis.solve_many`.
+
+    Each scenario is a dictionary of parameters:
+
+    - entries in the format of ``Exe_Eco_Costs`` (``"<component>_Z"`` in
+      currency/h, ``"<connection>_c"`` in currency/GJ) are used as costs,
+    - the economic parameters ``tau``, ``i_eff``, ``n`` and ``r_n`` are passed
+      to :class:`~exerpy.EconomicAnalysis`, which computes the ``_Z`` cost rates
+      from the purchased equipment costs ``PEC`` of the batch.
+
+    Parameters
+    ----------
+    exergy_analysis : ExergyAnalysis
+        Exergy analysis on which :meth:`ExergyAnalysis.analyse` has been called.
+    base_costs : dict, optional
+        Costs shared by all scenarios; scenario entries take precedence.
+    PEC : dict, optional
+        Purchased equipment cost per component, ``{component_name: PEC}``,
+        required for scenarios with economic parameters.
+    OMC_relative : float or dict, optional
+        First-year operation and maintenance costs as fraction of the PEC,
+        for all components or per component (default is 0).
+    currency : str, optional
+        Currency symbol (default is ``"EUR"``).
+    solver : str, optional
+        Backend of the cost equation system, see :class:`~exerpy.ExergoeconomicAnalysis`.
+
+    Attributes
+    ----------
+    exergy_analysis : ExergyAnalysis
+        The analysed model shared by all scenarios.
+    """
+
+    def __init__(self, exergy_analysis, base_costs=None, PEC=None, OMC_relative=0.0, currency="EUR", solver="auto"):
+        if not hasattr(exergy_analysis, "E_F_dict"):
+            msg = "The exergy analysis must be analysed before running scenarios."
+            raise ValueError(msg)
+        self.exergy_analysis = exergy_analysis
+        self.base_costs = dict(base_costs or {})
+        self.PEC = dict(PEC or {})
+        self.OMC_relative = OMC_relative
+        self.currency = currency
+        self.solver = solver
+
+    @classmethod
+    def from_json(
+        cls, json_path, E_F, E_P, E_L=None, Tamb=None, pamb=None, chemExLib=None, split_physical_exergy=True, **kwargs
+    ):
+        """
+        Parse a JSON model and run its exergy analysis once.
+
+        Parameters
+        ----------
+        json_path : str
+            Path to the JSON file.
+        E_F, E_P, E_L : dict
+            Fuel, product and loss definitions passed to :meth:`ExergyAnalysis.analyse`.
+        Tamb, pamb, chemExLib, split_physical_exergy
+            Passed to :meth:`ExergyAnalysis.from_json`.
+        **kwargs
+            Passed to :class:`ScenarioBatch`.
+
+        Returns
+        -------
+        ScenarioBatch
+            Batch on the analysed model.
+        """
+        ean = ExergyAnalysis.from_json(
+            json_path, Tamb=Tamb, pamb=pamb, chemExLib=chemExLib, split_physical_exergy=split_physical_exergy
+        )
+        ean.analyse(E_F=E_F, E_P=E_P, E_L=E_L)
+        return cls(ean, **kwargs)
+
+    def costs(self, parameters):
+        """
+        Build the ``Exe_Eco_Costs`` dictionary of one scenario.
+
+        Parameters
+        ----------
+        parameters : dict
+            Scenario parameters.
+
+        Returns
+        -------
+        dict
+            Cost assignments for :meth:`ExergoeconomicAnalysis.run`.
+
+        Raises
+        ------
+        ValueError
+            If only some economic parameters are given or no ``PEC`` are defined.
+        """
+        costs = dict(self.base_costs)
+        economic = {key: parameters[key] for key in ECONOMIC_PARAMETERS if key in parameters}
+        if economic:
+            missing = [key for key in ECONOMIC_PARAMETERS if key not in economic]
+            if missing:
+                msg = f"Economic scenario parameters {missing} are missing."
+                raise ValueError(msg)
+            if not self.PEC:
+                msg = "Scenarios with economic parameters require the PEC of the components."
+                raise ValueError(msg)
+            names = list(self.PEC)
+            if isinstance(self.OMC_relative, dict):
+                omc = [self.OMC_relative.get(name, 0.0) for name in names]
+            else:
+                omc = [self.OMC_relative] * len(names)
+            _, _, Z_total = EconomicAnalysis(economic).compute_component_costs([self.PEC[name] for name in names], omc)
+            costs.update({f"{name}_Z": Z for name, Z in zip(names, Z_total, strict=True)})
+        costs.update({key: value for key, value in parameters.items() if key not in ECONOMIC_PARAMETERS})
+        return costs
+
+    def run(self, scenarios, n_jobs=1):
+        """
+        Solve all scenarios and collect the results in one tidy DataFrame.
+
+        Parameters
+        ----------
+        scenarios : list of dict, dict of dict or pandas.DataFrame
+            Scenario parameters. Scenarios are labelled by their list
+            position, dictionary key or DataFrame index; DataFrame columns are
+            the parameters.
+        n_jobs : int, optional
+            Number of worker processes. With 1 (default), all scenarios are
+            solved in this process with one batched solve.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per scenario and result with the columns
+            :data:`RESULT_COLUMNS`. ``Type`` is ``"system"``, ``"component"``
+            or ``"connection"``; the system row has the ``Object`` ``"TOT"``.
+
+        Notes
+        -----
+        With ``n_jobs=1`` the connections and components of the exergy
+        analysis hold the results of the last scenario afterwards. Worker
+        processes solve copies, so the exergy analysis is left unchanged.
+        """
+        labels, parameters = _split_scenarios(scenarios)
+        costs = [self.costs(params) for params in parameters]
+
+        if n_jobs > 1 and len(costs) > 1:
+            chunks = np.array_split(np.arange(len(costs)), min(n_jobs, len(costs)))
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                futures = [
+                    pool.submit(
+                        _solve_scenarios,
+                        self.exergy_analysis,
+                        [costs[i] for i in chunk],
+                        self.currency,
+                        self.solver,
+                    )
+                    for chunk in chunks
+                ]
+                results = [result for future in futures for result in future.result()]
+        else:
+            results = _solve_scenarios(self.exergy_analysis, costs, self.currency, self.solver)
+        logging.info(f"Solved {len(results)} exergoeconomic scenarios.")
+
+        rows = []
+        for label, result in zip(labels, results, strict=True):
+            rows.extend(_tidy_rows(label, result, self.currency))
+        return pd.DataFrame(rows, columns=list(RESULT_COLUMNS))
+
+
+def _split_scenarios(scenarios):
+    if isinstance(scenarios, pd.DataFrame):
+        return list(scenarios.index), [row.dropna().to_dict() for _, row in scenarios.iterrows()]
+    if isinstance(scenarios, dict):
+        return list(scenarios), list(scenarios.values())
+    scenarios = list(scenarios)
+    return list(range(len(scenarios))), scenarios
+
+
+def _solve_scenarios(exergy_analysis, costs, currency, solver):
+    exa = ExergoeconomicAnalysis(exergy_analysis, currency=currency, solver=solver)
+    return exa.solve_many(costs, exergy_analysis.Tamb)
+
+
+def _tidy_rows(label, result, currency):
+    cost_unit = f"{currency}/h"
+    for variable, value in result["system_costs"].items():
+        yield label, "system", "TOT", variable, value, cost_unit
+    for name, values in result["components"].items():
+        for variable, value in values.items():
+            unit = "-" if variable in ("f", "r") else cost_unit
+            yield label, "component", name, variable, value, unit
+    for name, values in result["connections"].items():
+        yield label, "connection", name, "C_TOT", values["C_TOT"], cost_unit
+        yield label, "connection", name, "c_TOT", values["c_TOT"], f"{currency}/GJ"
@@ -0,0 +1,324 @@
+from collections.abc import MutableMapping
+
+import numpy as np
+import pandas as pd
+
+#: Numeric stream properties held as columns of a :class:`StreamTable`.
+STREAM_FIELDS = (
+    "m",
+    "T",
+    "p",
+    "h",
+    "s",
+    "e_PH",
+    "e_T",
+    "e_M",
+    "e_CH",
+    "E",
+    "E_PH",
+    "E_T",
+    "E_M",
+    "E_CH",
+    "energy_flow",
+)
+
+#: Cost properties held as columns of a :class:`StreamTable`.
+COST_FIELDS = (
+    "C_PH",
+    "C_T",
+    "C_M",
+    "C_CH",
+    "C_TOT",
+    "c_PH",
+    "c_T",
+    "c_M",
+    "c_CH",
+    "c_TOT",
+)
+
+
+class StreamRow(dict):
+    """
+    Connection dictionary of a :class:`StreamTable`.
+
+    A plain dictionary that counts the writes to any row in
+    :attr:`writes`, so the tables know when their cached columns are out of
+    date.
+    """
+
+    #: Number of writes to all stream rows.
+    writes = 0
+
+    def __setitem__(self, key, value):
+        StreamRow.writes += 1
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        StreamRow.writes += 1
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        StreamRow.writes += 1
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        StreamRow.writes += 1
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            StreamRow.writes += 1
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        StreamRow.writes += 1
+        return super().pop(key, *args)
+
+    def popitem(self):
+        StreamRow.writes += 1
+        return super().popitem()
+
+    def clear(self):
+        StreamRow.writes += 1
+        super().clear()
+
+
+class StreamTable(MutableMapping):
+    r"""
+    Columnar (struct-of-arrays) view of the streams of a plant.
+
+    The table wraps the connection dictionary of a model and provides the
+    numeric stream properties as NumPy arrays with one entry per connection,
+    ordered by an integer id map. Missing or undefined values are stored as
+    ``NaN``. System totals and result tables can then be evaluated as array
+    operations instead of iterating over the connection dictionaries.
+
+    For backward compatibility the table behaves like the wrapped dictionary:
+    ``table[name]`` returns the connection dictionary itself, and iteration,
+    ``items()``, ``values()`` and ``get()`` work as before.
+
+    The connection dictionaries are the storage, the columns are a cache
+    built from them. To notice changes, the table replaces the connection
+    dictionaries in ``connection_data`` by :class:`StreamRow` copies, which
+    count every write; a column is rebuilt when any row was written since it
+    was cached. References to the original connection dictionaries taken
+    before the table was created are therefore no longer part of the data.
+
+    Parameters
+    ----------
+    connection_data : dict
+        Dictionary of connections, ``{connection_name: connection_info}``.
+        The dictionary is wrapped, not copied.
+
+    Attributes
+    ----------
+    rows : dict
+        The wrapped connection data.
+    ids : dict
+        ``{connection_name: row_index}`` of the columns.
+
+    Notes
+    -----
+    Columns are materialised on first access and cached until the next write
+    to a connection dictionary. Values written with :meth:`set_column` update
+    both the dictionaries and the cached column. Connections added to or
+    removed from ``connection_data`` directly, rather than through the
+    table, are picked up after calling :meth:`refresh`.
+    """
+
+    def __init__(self, connection_data):
+        self.rows = connection_data
+        self._columns = {}
+        self._reindex()
+
+    def _reindex(self):
+        for name, connection_info in list(self.rows.items()):
+            if not isinstance(connection_info, StreamRow):
+                self.rows[name] = StreamRow(connection_info)
+        self.names = list(self.rows)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self._row_ids = {id(self.rows[name]): i for i, name in enumerate(self.names)}
+        self._columns.clear()
+        self._writes = StreamRow.writes
+
+    def _cached(self, field):
+        """Return a cached column, dropping all of them if a row was written since they were built."""
+        if self._writes != StreamRow.writes:
+            self._columns.clear()
+            self._writes = StreamRow.writes
+        return self._columns.get(field)
+
+    # Mapping interface (dict-like view of the connection data)
+    def __getitem__(self, name):
+        return self.rows[name]
+
+    def __setitem__(self, name, connection_info):
+        self.rows[name] = connection_info
+        self._reindex()
+
+    def __delitem__(self, name):
+        del self.rows[name]
+        self._reindex()
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def __repr__(self):
+        return f"StreamTable({len(self)} streams)"
+
+    def refresh(self):
+        """Re-index the table and drop the cached columns after connections were added or removed directly."""
+        self._reindex()
+
+    def column(self, field):
+        """
+        Return a property of all streams as a float array.
+
+        Parameters
+        ----------
+        field : str
+            Name of the property, e.g. ``"m"`` or ``"e_PH"``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values in id order, ``NaN`` where the property is missing or None.
+        """
+        values = self._cached(field)
+        if values is None:
+            values = np.array([_as_float(self.rows[name].get(field)) for name in self.names], dtype=float)
+            self._columns[field] = values
+        return values
+
+    @property
+    def kind(self):
+        """Array of connection kinds (``"material"``, ``"power"``, ``"heat"``, ...) in id order."""
+        values = self._cached("kind")
+        if values is None:
+            values = np.array([self.rows[name].get("kind") for name in self.names], dtype=object)
+            self._columns["kind"] = values
+        return values
+
+    def index(self, names):
+        """Return the row indices of the given connections as an integer array."""
+        return np.fromiter((self.ids[name] for name in names), dtype=np.intp)
+
+    def locate(self, connection_dicts):
+        """
+        Return the row indices of connection dictionaries, e.g. ``component.inl[0]``.
+
+        Parameters
+        ----------
+        connection_dicts : iterable of dict or None
+            Connection dictionaries as assigned to the components.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer row indices, -1 for None or dictionaries not in the table.
+        """
+        return np.fromiter(
+            (self._row_ids.get(id(conn), -1) if conn is not None else -1 for conn in connection_dicts), dtype=np.intp
+        )
+
+    def take(self, field, rows):
+        """
+        Return a property for the given row indices.
+
+        Parameters
+        ----------
+        field : str
+            Name of the property.
+        rows : numpy.ndarray
+            Row indices as returned by :meth:`locate`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values of the property, ``NaN`` for rows equal to -1.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if len(self.names) == 0:
+            return np.full(rows.shape, np.nan)
+        values = self.column(field)[rows]
+        values[rows < 0] = np.nan
+        return values
+
+    def total(self, field, names):
+        """
+        Sum a property over the given connections, skipping undefined values.
+
+        Parameters
+        ----------
+        field : str
+            Name of the property.
+        names : iterable of str
+            Connection names.
+
+        Returns
+        -------
+        float
+            Sum of the defined values (0.0 if none are defined).
+        """
+        return float(np.nansum(self.column(field)[self.index(names)]))
+
+    def set_column(self, field, values, names=None):
+        """
+        Write a property for all (or the given) streams.
+
+        ``NaN`` entries are written to the connection dictionaries as None.
+
+        Parameters
+        ----------
+        field : str
+            Name of the property.
+        values : array_like
+            New values, in id order or in the order of ``names``.
+        names : iterable of str, optional
+            Connections to write. Defaults to all connections.
+        """
+        values = np.asarray(values, dtype=float)
+        names = self.names if names is None else list(names)
+        column = self.column(field).copy()
+        for name, value in zip(names, values, strict=True):
+            self.rows[name][field] = None if np.isnan(value) else float(value)
+            column[self.ids[name]] = value
+        # The other cached columns are still valid if these were the only writes since they were built
+        self._writes += len(names)
+        if self._writes != StreamRow.writes:
+            self._columns.clear()
+            self._writes = StreamRow.writes
+        self._columns[field] = column
+
+    def to_dataframe(self, fields=STREAM_FIELDS):
+        """
+        Return the given columns as a DataFrame indexed by connection name.
+
+        Parameters
+        ----------
+        fields : iterable of str, optional
+            Columns to include (default is :data:`STREAM_FIELDS`).
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per connection with a ``kind`` column followed by ``fields``.
+        """
+        data = {"kind": self.kind}
+        data.update({field: self.column(field) for field in fields})
+        return pd.DataFrame(data, index=pd.Index(self.names, name="Connection"))
+
+
+def _as_float(value):
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
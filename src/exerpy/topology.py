@@ -0,0 +1,112 @@
+from collections import defaultdict
+
+
+class ConnectionGraph:
+    r"""
+    Topology index of the connections of a plant.
+
+    The index is built once from the connection data in a single pass and maps
+    every component to the connections entering and leaving it, keyed by the
+    connector index. All lookups used while wiring components and assembling
+    the exergoeconomic equations are answered from these maps instead of
+    rescanning the full connection dictionary for every component.
+
+    Parameters
+    ----------
+    connection_data : dict
+        Dictionary of connections, ``{connection_name: connection_info}``.
+        Each connection provides ``source_component``, ``source_connector``,
+        ``target_component``, ``target_connector`` and ``kind``.
+
+    Attributes
+    ----------
+    connections : dict
+        The indexed connection data (not copied).
+    inlets : dict
+        ``{component_name: {target_connector: connection_name}}``.
+    outlets : dict
+        ``{component_name: {source_connector: connection_name}}``.
+    by_target : dict
+        ``{component_name: [connection_name, ...]}`` in connection order.
+    by_source : dict
+        ``{component_name: [connection_name, ...]}`` in connection order.
+    by_kind : dict
+        ``{kind: [connection_name, ...]}`` in connection order.
+
+    Notes
+    -----
+    If several connections use the same connector of a component, the
+    connector maps keep the last one, which reproduces the behaviour of
+    assigning streams to ``component.inl``/``component.outl`` in connection
+    order. The lists in ``by_target`` and ``by_source`` keep all of them.
+    """
+
+    def __init__(self, connection_data):
+        self.connections = connection_data
+        self.inlets = defaultdict(dict)
+        self.outlets = defaultdict(dict)
+        self.by_target = defaultdict(list)
+        self.by_source = defaultdict(list)
+        self.by_kind = defaultdict(list)
+
+        for conn_name, conn_info in connection_data.items():
+            target = conn_info.get("target_component")
+            source = conn_info.get("source_component")
+            if target is not None:
+                self.by_target[target].append(conn_name)
+                self.inlets[target][conn_info.get("target_connector")] = conn_name
+            if source is not None:
+                self.by_source[source].append(conn_name)
+                self.outlets[source][conn_info.get("source_connector")] = conn_name
+            self.by_kind[conn_info.get("kind")].append(conn_name)
+
+    def __len__(self):
+        return len(self.connections)
+
+    def __contains__(self, conn_name):
+        return conn_name in self.connections
+
+    def inlet_connections(self, component_name, kind=None):
+        """
+        Return the connections entering a component.
+
+        Parameters
+        ----------
+        component_name : str
+            Name of the component.
+        kind : str, optional
+            Only return connections of this kind (e.g. ``"material"``).
+
+        Returns
+        -------
+        list of dict
+            Connection data in connection order.
+        """
+        return self._select(self.by_target.get(component_name, ()), kind)
+
+    def outlet_connections(self, component_name, kind=None):
+        """
+        Return the connections leaving a component.
+
+        Parameters
+        ----------
+        component_name : str
+            Name of the component.
+        kind : str, optional
+            Only return connections of this kind (e.g. ``"material"``).
+
+        Returns
+        -------
+        list of dict
+            Connection data in connection order.
+        """
+        return self._select(self.by_source.get(component_name, ()), kind)
+
+    def connections_of_kind(self, kind):
+        """Return the data of all connections of the given kind in connection order."""
+        return [self.connections[name] for name in self.by_kind.get(kind, ())]
+
+    def _select(self, names, kind):
+        if kind is None:
+            return [self.connections[name] for name in names]
+        return [self.connections[name] for name in names if self.connections[name].get("kind") == kind]
@@ -0,0 +1,366 @@
+import re
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from queue import Empty
+
+#: Human-readable unit names (after :func:`normalize_unit`) mapped to the unit keys of ``fluid_property_data``.
+UNIT_ALIASES = {
+    # power / heat (normalized keys)
+    "watt": "W",
+    "w": "W",
+    "wat": "W",
+    "kilowatt": "kW",
+    "kw": "kW",
+    "megawatt": "MW",
+    "mw": "MW",
+    # thermal conductance variants
+    "w / k": "W / K",
+    "w/k": "W / K",
+    # plural handlings (already normalized, but keep entries)
+    "watts": "W",
+    # pressure unit variants -> Pascal
+    "n/sqm": "Pa",
+    "n/sq m": "Pa",
+    "n/m2": "Pa",
+    "n / m2": "Pa",
+    "newton/m2": "Pa",
+    "newton/sqm": "Pa",
+    "newton/sq m": "Pa",
+    "pa": "Pa",
+}
+
+_PER = re.compile(r"\bper\b")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_unit(unit):
+    """
+    Normalise a unit string to handle common synonyms coming from external parsers.
+
+    The string is lower-cased, degree symbols, dashes and middle dots become
+    spaces, commas and dots are removed, ``per`` becomes ``/`` and a trailing
+    plural ``s`` of purely alphabetic units is dropped.
+
+    Parameters
+    ----------
+    unit : str
+        Unit string, e.g. ``"kJ/kg-K"`` or ``"Watts"``. Other types are returned unchanged.
+
+    Returns
+    -------
+    str
+        Normalised unit string.
+    """
+    if not isinstance(unit, str):
+        return unit
+    s = unit.strip().lower()
+    s = s.replace("°", " ").replace("-", " ").replace("·", " ")
+    s = s.replace(",", "").replace(".", "")
+    s = _PER.sub("/", s)
+    s = _SPACES.sub(" ", s).strip()
+    if s.isalpha() and s.endswith("s") and len(s) > 2:
+        s = s[:-1]
+    return s
+
+
+class UnitNotFoundError(ValueError):
+    """Raised if a unit is not known for a property."""
+
+
+class UnitRegistry:
+    r"""
+    Precompiled unit conversion table.
+
+    The table is built once from the property data: for every property, each
+    unit key and its normalised form are mapped to an ``(offset, factor)``
+    pair, so that ``SI_value = (value + offset) * factor``. Offsets are only
+    non-zero for temperatures. Resolving a raw unit string (normalising it,
+    applying :data:`UNIT_ALIASES` and looking it up) is memoised in an LRU
+    cache, so repeated units cost a single dictionary lookup.
+
+    Parameters
+    ----------
+    property_data : dict
+        Property definitions with a ``"units"`` table per property, e.g.
+        :data:`exerpy.functions.fluid_property_data`. Temperature units
+        (property ``"T"``) are given as ``[offset, factor]``.
+    maxsize : int, optional
+        Size of the LRU cache of resolved unit strings (default is 1024).
+
+    Attributes
+    ----------
+    tables : dict
+        ``{property: {unit: (offset, factor)}}`` with the unit keys of the property data.
+    """
+
+    def __init__(self, property_data, maxsize=1024):
+        self.tables = {}
+        self._normalised = {}
+        for prop, data in property_data.items():
+            table = {}
+            normalised = {}
+            for unit, conversion in data.get("units", {}).items():
+                if prop == "T":
+                    offset, factor = conversion[0], conversion[1]
+                else:
+                    offset, factor = 0, conversion
+                table[unit] = (offset, factor)
+                # The first unit with a given normalised form wins, like a scan in definition order
+                normalised.setdefault(normalize_unit(unit), (unit, offset, factor))
+            self.tables[prop] = table
+            self._normalised[prop] = normalised
+        self._resolve_cached = lru_cache(maxsize=maxsize)(self._resolve)
+
+    def __contains__(self, prop):
+        return prop in self.tables
+
+    def canonical(self, prop, unit):
+        """
+        Apply the normalisation and alias map used before looking up a unit.
+
+        Parameters
+        ----------
+        prop : str
+            Property name.
+        unit : str
+            Raw unit string.
+
+        Returns
+        -------
+        str
+            Unit key candidate.
+        """
+        if not isinstance(unit, str):
+            return unit
+        unit_norm = normalize_unit(unit)
+        unit = UNIT_ALIASES.get(unit_norm, unit_norm)
+        if prop == "T":
+            unit = unit.upper()
+        return unit
+
+    def _resolve(self, prop, unit):
+        if isinstance(unit, str) and normalize_unit(unit) == "unknown":
+            return None
+        candidate = self.canonical(prop, unit)
+        if candidate in self.tables[prop]:
+            return (candidate, *self.tables[prop][candidate])
+        match = self._normalised[prop].get(normalize_unit(candidate))
+        if match is None:
+            raise UnitNotFoundError(candidate)
+        return match
+
+    def resolve(self, prop, unit):
+        """
+        Return the unit key and conversion of a raw unit string.
+
+        Parameters
+        ----------
+        prop : str
+            Property name, must be in the registry.
+        unit : str
+            Raw unit string.
+
+        Returns
+        -------
+        tuple or None
+            ``(unit_key, offset, factor)``, None if the unit is ``"unknown"``.
+
+        Raises
+        ------
+        UnitNotFoundError
+            If the unit is not known for the property; the exception argument
+            is the normalised unit.
+        """
+        try:
+            return self._resolve_cached(prop, unit)
+        except TypeError:  # unhashable unit
+            return self._resolve(prop, unit)
+
+    def cache_info(self):
+        """Return the statistics of the LRU cache of resolved unit strings."""
+        return self._resolve_cached.cache_info()
+
+
+#: One deduplicated unit observation of a :class:`UnitAuditSink`.
+UnitObservation = namedtuple("UnitObservation", ["kind", "property", "raw_unit", "unit", "context", "count"])
+
+
+class UnitAuditSink:
+    r"""
+    In-memory collector of the units seen while converting parser output.
+
+    Unit observations used to be appended to ``seen_units.txt`` and
+    ``detected_units.txt`` next to the repository on every conversion. The
+    sink collects them in memory instead, deduplicated by kind, property,
+    raw and normalised unit (keeping the first context and a count), and
+    writes them out once per parse when :meth:`flush` is called.
+
+    Auditing is disabled by default; activate a sink with
+    :func:`set_unit_audit_sink`. The kinds of observations are ``"seen"``
+    (every converted unit) and ``"unknown"`` (units missing in the
+    conversion table).
+
+    Parameters
+    ----------
+    path : str, optional
+        Tab-separated file the observations are appended to on :meth:`flush`.
+    queue : queue.Queue or multiprocessing.Queue, optional
+        Queue the observations are put on (as one list per flush), e.g. in
+        worker processes. The main process merges them with :meth:`collect`.
+        Takes precedence over ``path``.
+
+    Notes
+    -----
+    Without ``path`` and ``queue`` the observations stay in memory and are
+    available through :meth:`observations`. Recording is thread-safe, so the
+    sink can be shared by parser worker threads.
+    """
+
+    def __init__(self, path=None, queue=None):
+        self.path = path
+        self.queue = queue
+        self._observations = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._observations)
+
+    def record(self, kind, prop, raw_unit, unit, context=None, count=1):
+        """
+        Add an observation.
+
+        Parameters
+        ----------
+        kind : str
+            ``"seen"`` or ``"unknown"``.
+        prop : str
+            Property of the converted value.
+        raw_unit : str
+            Unit string as provided by the parser.
+        unit : str
+            Unit after normalisation and alias mapping.
+        context : str, optional
+            Where the value came from, e.g. ``"stream:S1:TEMP_OUT"``.
+        count : int, optional
+            Number of occurrences (default is 1).
+        """
+        key = (kind, prop, raw_unit, unit)
+        with self._lock:
+            observation = self._observations.get(key)
+            if observation is None:
+                self._observations[key] = UnitObservation(kind, prop, raw_unit, unit, context, count)
+            else:
+                self._observations[key] = observation._replace(count=observation.count + count)
+
+    def observations(self):
+        """Return the collected observations in the order they were first seen."""
+        return list(self._observations.values())
+
+    def flush(self):
+        """
+        Write the collected observations to the queue or file and clear them.
+
+        Does nothing if neither a queue nor a path is set.
+
+        Returns
+        -------
+        list of UnitObservation
+            The observations written.
+        """
+        if not self._observations or (self.queue is None and self.path is None):
+            return []
+        observations = self.observations()
+        if self.queue is not None:
+            self.queue.put(observations)
+        else:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for observation in observations:
+                    f.write("\t".join(str(value) for value in observation) + "\n")
+        self._observations.clear()
+        return observations
+
+    def collect(self, queue=None):
+        """
+        Merge the observations that worker processes put on a queue.
+
+        Parameters
+        ----------
+        queue : queue.Queue or multiprocessing.Queue, optional
+            Queue to drain (default is the queue of this sink).
+
+        Returns
+        -------
+        int
+            Number of observations merged.
+        """
+        queue = self.queue if queue is None else queue
+        merged = 0
+        while True:
+            try:
+                observations = queue.get_nowait()
+            except Empty:
+                return merged
+            for observation in observations:
+                self.record(*observation)
+                merged += 1
+
+    @staticmethod
+    def read(path):
+        """
+        Read observations written by :meth:`flush`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the audit file.
+
+        Returns
+        -------
+        list of UnitObservation
+            Observations in file order (not deduplicated across flushes).
+        """
+        observations = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) != len(UnitObservation._fields):
+                    continue
+                kind, prop, raw_unit, unit, context, count = fields
+                context = None if context == "None" else context
+                observations.append(UnitObservation(kind, prop, raw_unit, unit, context, int(count)))
+        return observations
+
+
+_audit_sink = None
+
+
+def set_unit_audit_sink(sink):
+    """
+    Activate a unit audit sink for all unit conversions of this process.
+
+    Parameters
+    ----------
+    sink : UnitAuditSink or None
+        Sink to use, None disables auditing (the default).
+
+    Returns
+    -------
+    UnitAuditSink or None
+        The previously active sink.
+    """
+    global _audit_sink
+    previous = _audit_sink
+    _audit_sink = sink
+    return previous
+
+
+def get_unit_audit_sink():
+    """Return the active unit audit sink, None if auditing is disabled."""
+    return _audit_sink
+
+
+def flush_unit_audit():
+    """Flush the active unit audit sink, if any. Called by the parsers once per parse."""
+    if _audit_sink is not None:
+        _audit_sink.flush()
@@ -13,14 +13,16 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from exerpy.analyses import ExergyAnalysis, _construct_components, _load_json
+from exerpy.analyses import ExergyAnalysis, _construct_components, _load_json, normalise_exergy_flows
 from exerpy.components.component import Component, component_registry
 from exerpy.components.heat_exchanger.mheatx import MHeatX
 from exerpy.components.helpers.cycle_closer import CycleCloser
 from exerpy.components.nodes.flash2 import Flash2
 from exerpy.components.nodes.radfrac import RadFrac
 from exerpy.components.nodes.sep import Sep
+from exerpy.diagnostics import DiagnosticsReport
 from exerpy.parser.from_ebsilon import __ebsilon_path__
+from exerpy.topology import ConnectionGraph
 
 
 # Basic component classes for testing
@@ -116,6 +118,54 @@ def exergy_analysis(mock_component_data, mock_connection_data):
     return ExergyAnalysis(mock_component_data, mock_connection_data, 298.15, 101325)
 
 
+def test_connection_graph_index(exergy_analysis, mock_connection_data):
+    """Test that the topology index maps components to their connections."""
+    graph = exergy_analysis.graph
+    assert isinstance(graph, ConnectionGraph)
+    assert len(graph) == len(mock_connection_data)
+    assert graph.inlets["C1"] == {0: "1"}
+    assert graph.outlets["C1"] == {0: "2"}
+    assert graph.outlets["T1"] == {1: "3"}
+    assert graph.by_target["T1"] == ["2"]
+    assert [c["kind"] for c in graph.outlet_connections("T1", kind="power")] == ["power"]
+    assert graph.outlet_connections("T1", kind="material") == []
+    assert graph.inlet_connections("unknown") == []
+    assert graph.connections_of_kind("power") == [mock_connection_data["3"]]
+    # The index shares the connection data instead of copying it
+    assert graph.connections is exergy_analysis.connections.rows
+
+
+def test_normalise_exergy_flows_idempotent(mock_component_data, mock_connection_data):
+    """Test that repeated conversions of the parser totals do not change the specific exergies."""
+    mock_connection_data["2"].update({"eph": 20000.0, "eth": 15000.0, "em": 5000.0})
+    mock_connection_data["1"]["e_PH"] = 42.0
+
+    ExergyAnalysis(mock_component_data, mock_connection_data, 298.15, 101325)
+    first = {name: dict(conn) for name, conn in mock_connection_data.items()}
+    assert mock_connection_data["2"]["e_PH"] == pytest.approx(200.0)
+    assert mock_connection_data["2"]["e_T"] == pytest.approx(150.0)
+    assert mock_connection_data["2"]["e_M"] == pytest.approx(50.0)
+    # Specific exergies without a parser total are kept
+    assert mock_connection_data["1"]["e_PH"] == 42.0
+    # No marker is left in the connection data
+    assert not any("exergy_normalised" in conn for conn in mock_connection_data.values())
+
+    # A second analysis of the same data repeats the pass without changing the values
+    ExergyAnalysis(mock_component_data, mock_connection_data, 298.15, 101325)
+    assert mock_connection_data == first
+    normalise_exergy_flows(mock_connection_data)
+    assert mock_connection_data == first
+
+
+def test_normalise_exergy_flows_without_mass_flow(caplog):
+    """Test that totals cannot be converted without a valid mass flow."""
+    connections = {"a": {"kind": "material", "m": 0.0, "eph": 100.0}, "b": {"kind": "power", "energy_flow": 10.0}}
+    normalise_exergy_flows(connections)
+    assert connections["a"]["e_PH"] is None
+    assert "cannot convert eph" in caplog.text
+    assert connections["b"]["e_PH"] is None
+
+
 # Test component construction
 def test_component_construction(mock_component_data, mock_connection_data):
     """Test proper component construction and connection assignment."""
@@ -264,6 +314,46 @@ def test_analyse_basic(exergy_analysis):
     assert exergy_analysis.epsilon == pytest.approx(0.7, rel=1e-2)
 
 
+def test_analyse_diagnostics_off(exergy_analysis, capsys):
+    """Test that no diagnostics are collected or printed by default."""
+    exergy_analysis.analyse(E_F={"inputs": ["1"]}, E_P={"inputs": ["3"]})
+    assert isinstance(exergy_analysis.diagnostics, DiagnosticsReport)
+    assert not exergy_analysis.diagnostics.enabled
+    assert len(exergy_analysis.diagnostics) == 0
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("mode", ["summary", "full"])
+def test_analyse_diagnostics_report(exergy_analysis, mode):
+    """Test that diagnostics are collected into a queryable report."""
+    exergy_analysis.analyse(E_F={"inputs": ["1"]}, E_P={"inputs": ["3"]}, diagnostics=mode)
+    report = exergy_analysis.diagnostics
+    assert report.mode == mode
+    assert set(report.records) == {"T1", "C1"}
+    assert report["T1"]["n_inlets"] == 1
+    assert report["T1"]["power"] == {"out_1": 85000}
+    assert report.issues() == {"T1": ["in_0"], "C1": ["in_0", "out_0"]}
+    assert ("inlets" in report["C1"]) == (mode == "full")
+    df = report.to_dataframe()
+    assert list(df["Component"]) == list(report.records)
+
+
+def test_analyse_invalid_diagnostics_mode(exergy_analysis):
+    """Test that an unknown diagnostics mode raises a ValueError."""
+    with pytest.raises(ValueError, match="Invalid diagnostics mode"):
+        exergy_analysis.analyse(E_F={"inputs": ["1"]}, E_P={"inputs": ["3"]}, diagnostics="verbose")
+
+
+def test_analyse_batched(mock_component_data, mock_connection_data):
+    """Test that the batched engine gives the same results as the per-component loop."""
+    results = []
+    for batched in (False, True):
+        ean = ExergyAnalysis(mock_component_data, mock_connection_data, 298.15, 101325)
+        ean.analyse(E_F={"inputs": ["1"]}, E_P={"inputs": ["3"]}, batched=batched)
+        results.append({name: (comp.E_F, comp.E_P, comp.E_D, comp.y) for name, comp in ean.components.items()})
+    assert results[0] == results[1]
+
+
 def test_analyse_with_losses(exergy_analysis):
     """Test exergy analysis with loss accounting."""
     E_F = {"inputs": ["1"]}
@@ -310,6 +400,8 @@ def test_exergy_results(exergy_analysis):
     assert isinstance(non_material_results, pd.DataFrame)
     assert "T [°C]" in material_results.columns
     assert "Energy Flow [kW]" in non_material_results.columns
+    # Properties no connection has are shown as None, not NaN
+    assert all(value is None for value in material_results["e^CH [kJ/kg]"])
 
 
 @pytest.mark.skipif(__ebsilon_path__ is None, reason="Test skipped due to missing ebsilon dependency.")
@@ -0,0 +1,105 @@
+"""
+Tests for the memory-mapped results archive.
+"""
+
+import copy
+import os
+
+import numpy as np
+import pytest
+
+from exerpy import ExergyAnalysis
+from exerpy.archive import ResultsArchive, TopologyResults, topology_hash
+
+MODEL_JSON = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "ccpp", "ccpp_ebs.json")
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    ean = ExergyAnalysis.from_json(MODEL_JSON, chemExLib="Ahrendts", split_physical_exergy=False)
+    ean.analyse(
+        E_F={"inputs": ["1", "3"], "outputs": []},
+        E_P={"inputs": ["ETOT", "H1"], "outputs": []},
+        E_L={"inputs": ["8", "15"], "outputs": ["14"]},
+    )
+    return ean
+
+
+def test_append_and_series(analysis, tmp_path):
+    archive = ResultsArchive(tmp_path)
+    key = archive.append(analysis, case="winter")
+    assert archive.append(analysis) == key
+
+    results = archive.topology()
+    assert archive.topologies() == [key]
+    assert results.cases == ["winter", 1]
+    assert results.column("connections", "E").shape == (2, len(analysis.connections))
+    np.testing.assert_allclose(archive.series("components", "E_D", "CC"), [analysis.components["CC"].E_D] * 2)
+    np.testing.assert_allclose(archive.series("connections", "m", "1"), [analysis.connections["1"]["m"]] * 2)
+    np.testing.assert_allclose(archive.series("system", "epsilon", "system"), [analysis.epsilon] * 2)
+
+
+def test_topology_hash():
+    data = {
+        "components": {"Pump": {"P1": {"eta": 0.8}}, "Valve": {"V1": {}}},
+        "connections": {
+            "1": {"kind": "material", "source_component": "P1", "target_component": "V1", "m": 1.0},
+            "2": {"kind": "material", "source_component": "V1", "target_component": None, "m": 1.0},
+        },
+    }
+    reordered = {
+        "components": {"Valve": {"V1": {}}, "Pump": {"P1": {"eta": 0.7}}},
+        "connections": {name: {**data["connections"][name], "m": 2.0} for name in ("2", "1")},
+    }
+    assert topology_hash(data) == topology_hash(reordered)
+
+    data["connections"]["2"]["target_component"] = "P1"
+    assert topology_hash(data) != topology_hash(reordered)
+
+
+def test_several_topologies(analysis, tmp_path):
+    other = copy.deepcopy(analysis)
+    other.connections["1a"] = other.connections.pop("1")
+    archive = ResultsArchive(tmp_path)
+    key = archive.append(analysis)
+    other_key = archive.append(other)
+
+    assert other_key != key
+    assert archive.topologies() == sorted([key, other_key])
+    with pytest.raises(ValueError, match="2 topologies"):
+        archive.topology()
+    assert archive.topology(other_key).names("connections")[-1] == "1a"
+    with pytest.raises(KeyError):
+        archive.series("connections", "m", "1", topology=other_key)
+    with pytest.raises(KeyError):
+        archive.series("components", "eta", "CC", topology=key)
+
+
+def test_interrupted_append(analysis, tmp_path):
+    archive = ResultsArchive(tmp_path)
+    archive.append(analysis, case="first")
+    results = archive.topology()
+    # An append interrupted after the first field leaves a row without a case label
+    with open(results._path("components", "E_F"), "ab") as f:
+        f.write(np.zeros(len(results.names("components"))).tobytes())
+    assert results.cases == ["first"]
+
+    archive.append(analysis, case="second")
+    assert results.cases == ["first", "second"]
+    np.testing.assert_allclose(archive.series("components", "E_F", "CC"), [analysis.components["CC"].E_F] * 2)
+
+
+def test_case_count(analysis, tmp_path, monkeypatch):
+    archive = ResultsArchive(tmp_path)
+    key = archive.append(analysis)
+    reader = TopologyResults(os.path.join(tmp_path, key))
+    assert len(reader) == 1
+
+    # Appending neither parses the case labels nor reopens the topology
+    monkeypatch.setattr(TopologyResults, "cases", property(lambda self: pytest.fail("case labels parsed")))
+    monkeypatch.setattr(TopologyResults, "__init__", lambda self, directory: pytest.fail("topology reopened"))
+    for _ in range(3):
+        archive.append(analysis)
+    assert len(archive.topology()) == 4
+    # Readers count the cases appended since their last count
+    assert reader.column("system", "E_F").shape == (4, 1)
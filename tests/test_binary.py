@@ -0,0 +1,71 @@
+"""
+Tests for the compact binary model format.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from exerpy import ExergyAnalysis
+from exerpy.binary import read_binary, write_binary
+
+MODEL_JSON = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "ccpp", "ccpp_ebs.json")
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    return ExergyAnalysis.from_json(MODEL_JSON, chemExLib="Ahrendts")
+
+
+@pytest.mark.parametrize("mmap, compress", [(True, False), (False, False), (True, True)])
+def test_binary_matches_json_export(analysis, tmp_path, mmap, compress):
+    json_path = tmp_path / "model.json"
+    analysis.export_to_json(str(json_path))
+    binary_path = str(tmp_path / "model.npz")
+    write_binary(binary_path, analysis._serialize(), compress=compress)
+
+    with open(json_path) as f:
+        expected = json.load(f)
+    data = read_binary(binary_path, mmap=mmap).to_dict()
+
+    assert json.loads(json.dumps(data)) == expected
+    assert list(data["connections"]) == list(expected["connections"])
+
+
+def test_from_binary(analysis, tmp_path):
+    path = str(tmp_path / "model.npz")
+    analysis.export_binary(path)
+    loaded = ExergyAnalysis.from_binary(path)
+
+    assert (loaded.Tamb, loaded.pamb, loaded.chemExLib) == (analysis.Tamb, analysis.pamb, analysis.chemExLib)
+    assert list(loaded.components) == list(analysis.components)
+    assert loaded.connections == analysis.connections
+
+
+def test_cell_types_and_columns(tmp_path):
+    data = {
+        "components": {"Pump": {"P1": {"name": "P1", "eta": 0.8}}, "Valve": {}},
+        "connections": {
+            "1": {"kind": "material", "m": 2, "T": 300.5, "source_connector": 0, "x": {"N2": 1.0}, "ok": True},
+            "2": {"kind": "power", "m": None, "T": 310.0, "source_connector": 1, "note": "ü"},
+            "3": {"kind": "heat", "m": 1.5, "T": float("nan"), "source_connector": None, "big": 2**70},
+        },
+        "ambient_conditions": {"Tamb": 298.15, "pamb": 101325},
+    }
+    path = str(tmp_path / "model.npz")
+    write_binary(path, data)
+    model = read_binary(path)
+    read = model.to_dict()
+
+    assert read["components"] == data["components"]
+    assert read["connections"]["1"] == data["connections"]["1"]
+    assert read["connections"]["2"] == data["connections"]["2"]
+    assert type(read["connections"]["1"]["m"]) is int
+    assert read["connections"]["3"]["big"] == 2**70
+    assert np.isnan(read["connections"]["3"]["T"])
+    assert model.names("connections") == ["1", "2", "3"]
+    np.testing.assert_array_equal(model.column("connections", "m"), [2.0, np.nan, 1.5])
+    with pytest.raises(KeyError):
+        model.column("connections", "E")
@@ -0,0 +1,90 @@
+"""
+Tests for the cached chemical exergy library and the composition-keyed result cache.
+"""
+
+import builtins
+
+import pytest
+
+from exerpy.chemex import CHEMICAL_EXERGY_CACHE, ChemExLibrary, ChemicalExergyCache
+from exerpy.functions import add_chemical_exergy, calc_chemical_exergy
+
+
+def test_library_is_loaded_once(monkeypatch):
+    ChemExLibrary.clear_cache()
+    library = ChemExLibrary.load("Ahrendts")
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("The library file must not be read again.")
+
+    monkeypatch.setattr(builtins, "open", fail_open)
+    assert ChemExLibrary.load("Ahrendts") is library
+    stream_data = {"molar_composition": {"N2": 0.79, "O2": 0.21}}
+    assert isinstance(calc_chemical_exergy(stream_data, 298.15, 101325, "Ahrendts"), float)
+
+
+def test_clear_cache_clears_results():
+    stream_data = {"molar_composition": {"N2": 0.79, "O2": 0.21}}
+    CHEMICAL_EXERGY_CACHE.get(stream_data, 298.15, 101325, "Ahrendts", calc_chemical_exergy)
+    assert len(CHEMICAL_EXERGY_CACHE) > 0
+    ChemExLibrary.clear_cache()
+    assert len(CHEMICAL_EXERGY_CACHE) == 0
+
+
+def test_alias_map_and_molar_masses():
+    library = ChemExLibrary.load("Ahrendts")
+    assert library.key("O2") == library.key("oxygen") == "OXYGEN"
+    assert library.key("R134a") is None
+    assert library.is_water("h2o")
+    assert not library.is_water("N2")
+    assert library.entry("Water") is library.data["WATER"]
+    assert library.molar_mass("O2") == pytest.approx(0.0319988)
+    assert "O2" in library.molar_masses
+
+
+def test_missing_entry_raises():
+    library = ChemExLibrary.load("Ahrendts")
+    with pytest.raises(KeyError, match="No matching alias found for R134a"):
+        library.entry("R134a")
+
+
+def test_missing_library_is_not_cached():
+    with pytest.raises(FileNotFoundError, match="Please ensure the file exists"):
+        ChemExLibrary.load("InvalidLibrary")
+    assert "InvalidLibrary" not in ChemExLibrary._cache
+
+
+def test_chemical_exergy_cache_hits_for_identical_compositions():
+    cache = ChemicalExergyCache()
+    air = {"molar_composition": {"N2": 0.79, "O2": 0.21}}
+    connections = {
+        "1": {"kind": "material", "molar_composition": {"N2": 0.79, "O2": 0.21}},
+        "2": {"kind": "material", "molar_composition": {"O2": 0.21, "N2": 0.79}},
+        "3": {"kind": "material", "mass_composition": {"O2": 1.0}},
+    }
+    add_chemical_exergy({"connections": connections}, 298.15, 101325, "Ahrendts", cache=cache)
+    assert cache.info() == (1, 2, 1024, 2)
+    assert connections["1"]["e_CH"] == connections["2"]["e_CH"]
+    assert connections["1"]["e_CH"] == calc_chemical_exergy(air, 298.15, 101325, "Ahrendts")
+
+    # The ambient state is part of the key
+    cache.get(air, 288.15, 101325, "Ahrendts", calc_chemical_exergy)
+    assert cache.misses == 3
+
+
+def test_chemical_exergy_cache_evicts_least_recently_used():
+    cache = ChemicalExergyCache(maxsize=2)
+    calls = []
+
+    def calculate(stream_data, Tamb, pamb, chemExLib):
+        calls.append(stream_data["mass_composition"])
+        return 1.0
+
+    a, b, c = ({"mass_composition": {name: 1.0}} for name in ("N2", "O2", "CO2"))
+    for stream in (a, b, a, c, a, b):
+        cache.get(stream, 298.15, 101325, "Ahrendts", calculate)
+    # b was evicted by c, since a was used more recently
+    assert [next(iter(composition)) for composition in calls] == ["N2", "O2", "CO2", "O2"]
+    assert len(cache) == 2
+    cache.clear()
+    assert cache.info() == (0, 0, 2, 0)
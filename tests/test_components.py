@@ -28,6 +28,7 @@ from exerpy.components.power_machines.motor import Motor
 from exerpy.components.turbomachinery.compressor import Compressor
 from exerpy.components.turbomachinery.pump import Pump
 from exerpy.components.turbomachinery.turbine import Turbine
+from exerpy.streams import StreamTable
 from exerpy.components.component import component_registry
 
 
@@ -1068,6 +1069,126 @@ def test_pump_invalid_case(pump):
     assert np.isnan(pump.E_F), "E_F should be NaN for invalid case."
 
 
+def _batch_streams(cls, cases, prefix, **kwargs):
+    """Create one instance of ``cls`` per (inlets, outlets) case and a matching stream table."""
+    connections = {}
+    components = []
+    for i, (inlets, outlets) in enumerate(cases):
+        component = cls(name=f"{prefix}{i}", **kwargs)
+        for side, streams in (("inl", inlets), ("outl", outlets)):
+            streams = [streams] if isinstance(streams, dict) else streams
+            for j, stream in enumerate(streams):
+                connections[f"{prefix}{i}_{side}{j}"] = dict(stream)
+            setattr(component, side, {j: connections[f"{prefix}{i}_{side}{j}"] for j in range(len(streams))})
+        components.append(component)
+    return components, StreamTable(connections)
+
+
+def _assert_batch_matches_scalar(cls, cases, split_physical_exergy, **kwargs):
+    T0 = 300
+    p0 = 101325
+    batch, streams = _batch_streams(cls, cases, "B", **kwargs)
+    scalar, _ = _batch_streams(cls, cases, "S", **kwargs)
+
+    cls.calc_exergy_balance_batch(batch, streams, T0, p0, split_physical_exergy)
+    for component in scalar:
+        component.calc_exergy_balance(T0, p0, split_physical_exergy)
+
+    for b, s in zip(batch, scalar, strict=True):
+        for attr in ("E_F", "E_P", "E_D", "epsilon"):
+            np.testing.assert_allclose(getattr(b, attr), getattr(s, attr), equal_nan=True)
+
+
+@pytest.mark.parametrize("cls", [Pump, Compressor, Valve, Turbine, Motor, Generator])
+@pytest.mark.parametrize("split_physical_exergy", [True, False])
+def test_batch_kernel_matches_scalar(cls, split_physical_exergy):
+    """The vectorised kernel gives the same results as the scalar exergy balance."""
+    cases = [
+        (
+            {"T": 310, "p": 1e5, "m": 5, "h": 500, "e_PH": 1000, "e_T": 900, "e_M": 150, "energy_flow": 1000},
+            {"T": 320, "p": 5e5, "m": 5, "h": 600, "e_PH": 1100, "e_T": 950, "e_M": 160, "energy_flow": 950},
+        ),
+        (
+            {"T": 290, "p": 1e5, "m": 5, "h": 500, "e_PH": 1000, "e_T": 300, "e_M": 200, "energy_flow": 950},
+            {"T": 310, "p": 5e5, "m": 5, "h": 600, "e_PH": 1100, "e_T": 350, "e_M": 220, "energy_flow": 1000},
+        ),
+        (
+            {"T": 290, "p": 5e5, "m": 5, "h": 500, "e_PH": 1000, "e_T": 300, "e_M": 200, "energy_flow": 800},
+            {"T": 295, "p": 1e5, "m": 5, "h": 600, "e_PH": 1100, "e_T": 350, "e_M": 220, "energy_flow": 760},
+        ),
+        (
+            {"T": 320, "p": 5e5, "m": 5, "h": 500, "e_PH": 1000, "e_T": 900, "e_M": 150, "energy_flow": 760},
+            {"T": 310, "p": 1e5, "m": 5, "h": 600, "e_PH": 900, "e_T": 850, "e_M": 40, "energy_flow": 800},
+        ),
+        (
+            {"T": 320, "p": 5e5, "m": 2, "h": 500, "e_PH": 1000, "e_T": 900, "e_M": 150, "energy_flow": 500},
+            {"T": 290, "p": 1e5, "m": 2, "h": 500, "e_PH": 700, "e_T": 30, "e_M": 40, "energy_flow": 500},
+        ),
+    ]
+    _assert_batch_matches_scalar(cls, cases, split_physical_exergy)
+
+
+@pytest.mark.parametrize("split_physical_exergy", [True, False])
+def test_turbine_batch_kernel_with_extractions(split_physical_exergy):
+    """Turbines with several outlets and power streams give the same results in the batched kernel."""
+    inlet = {"kind": "material", "T": 500, "m": 10, "h": 3000, "e_PH": 1200, "e_T": 800, "e_M": 400}
+    extraction = {"kind": "material", "T": 400, "m": 3, "h": 2800, "e_PH": 700, "e_T": 450, "e_M": 250}
+    cold_extraction = {"kind": "material", "T": 290, "m": 3, "h": 2500, "e_PH": 300, "e_T": 20, "e_M": 280}
+    outlet = {"kind": "material", "T": 350, "m": 7, "h": 2600, "e_PH": 400, "e_T": 250, "e_M": 150}
+    cold_outlet = {"kind": "material", "T": 280, "m": 7, "h": 2400, "e_PH": 200, "e_T": 30, "e_M": 170}
+    power = {"kind": "power", "energy_flow": 4000}
+    cases = [
+        (inlet, [outlet, extraction]),
+        (inlet, [outlet, extraction, power]),
+        (inlet, [cold_outlet, cold_extraction, power]),
+        ([inlet, dict(power, energy_flow=500)], [outlet, power]),
+        (inlet, [outlet, {"kind": "material", "T": 380, "m": 3}]),  # extraction without exergy
+    ]
+    _assert_batch_matches_scalar(Turbine, cases, split_physical_exergy)
+
+
+@pytest.mark.parametrize("dissipative", [False, True])
+@pytest.mark.parametrize("split_physical_exergy", [True, False])
+def test_heat_exchanger_batch_kernel_matches_scalar(dissipative, split_physical_exergy):
+    """Heat exchangers in all temperature configurations give the same results in the batched kernel."""
+
+    def stream(T, m, e_PH, e_T, e_M):
+        return {"kind": "material", "T": T, "m": m, "e_PH": e_PH, "e_T": e_T, "e_M": e_M}
+
+    hot_in, hot_out = stream(450, 2, 900, 700, 200), stream(350, 2, 500, 320, 180)
+    cold_in, cold_out = stream(310, 3, 150, 40, 110), stream(400, 3, 380, 280, 100)
+    below_in, below_out = stream(280, 3, 160, 50, 110), stream(290, 3, 140, 25, 115)
+    cases = [
+        ([hot_in, cold_in], [hot_out, cold_out]),  # all above ambient
+        ([stream(295, 2, 300, 10, 290), stream(260, 3, 400, 120, 280)], [stream(270, 2, 330, 60, 270), below_out]),
+        ([hot_in, below_in], [stream(290, 2, 250, 40, 210), cold_out]),  # crossing
+        ([hot_in, below_in], [stream(295, 2, 240, 30, 210), below_out]),  # only hot inlet above
+        ([hot_in, below_in], [hot_out, cold_out]),  # only cold inlet below
+        ([hot_in, below_in], [hot_out, below_out]),  # dissipative configuration
+    ]
+    _assert_batch_matches_scalar(HeatExchanger, cases, split_physical_exergy, dissipative=dissipative)
+
+
+@pytest.mark.parametrize("split_physical_exergy", [True, False])
+def test_mixer_batch_kernel_matches_scalar(split_physical_exergy):
+    """Mixers with any number of inlets give the same results in the batched kernel."""
+
+    def stream(T, m, e_PH):
+        return {"kind": "material", "T": T, "m": m, "e_PH": e_PH}
+
+    cases = [
+        ([stream(350, 1, 300), stream(320, 2, 120), stream(290, 1, 20)], stream(330, 4, 150)),
+        ([stream(400, 1, 500), stream(310, 2, 80)], stream(340, 3, 200)),
+        ([stream(310, 1, 30), stream(250, 2, 200), stream(280, 1, 60)], stream(270, 4, 110)),
+        ([stream(310, 1, 30), stream(290, 2, 20)], stream(300, 3, 0)),  # outlet at ambient temperature
+        ([stream(350, 1, 300), stream(320, 2, 120)], [stream(330, 2, 150), stream(330, 1, 150)]),
+        ([stream(350, 1, 300), stream(320, 2, 120)], [stream(330, 2, 150), stream(335, 1, 160)]),
+    ]
+    _assert_batch_matches_scalar(Mixer, cases[:-1], split_physical_exergy)
+    with pytest.raises(ValueError, match="same thermodynamic state"):
+        _assert_batch_matches_scalar(Mixer, cases[-1:], split_physical_exergy)
+
+
 @pytest.fixture
 def turbine():
     """Return a new Turbine instance with a name for logging."""
@@ -0,0 +1,236 @@
+"""
+Tests for the ExergoeconomicAnalysis class based on the heat pump cascade example.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from exerpy import ExergoeconomicAnalysis, ExergyAnalysis
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "hp_cascade", "hp_cascade_ebs.json")
+
+
+def _exergy_analysis():
+    ean = ExergyAnalysis.from_json(MODEL_PATH)
+    ean.analyse(
+        E_F={"inputs": ["E1", "E2"], "outputs": []},
+        E_P={"inputs": ["42"], "outputs": ["41"]},
+        E_L={"inputs": ["12"], "outputs": ["11"]},
+    )
+    return ean
+
+
+@pytest.fixture
+def exergy_analysis():
+    return _exergy_analysis()
+
+
+@pytest.fixture
+def costs(exergy_analysis):
+    costs = {f"{name}_Z": 10.0 + i for i, name in enumerate(sorted(exergy_analysis.components))}
+    costs.update({"11_c": 0.0, "41_c": 0.0, "E1_c": 111.0})
+    return costs
+
+
+def _run(costs, **kwargs):
+    ean = _exergy_analysis()
+    exa = ExergoeconomicAnalysis(ean, **kwargs)
+    exa.run(Exe_Eco_Costs=costs, Tamb=ean.Tamb)
+    return exa
+
+
+def test_sparse_solver_matches_dense(costs):
+    pytest.importorskip("scipy")
+    dense = _run(costs, solver="dense")
+    sparse = _run(costs, solver="sparse")
+    assert isinstance(dense._A, np.ndarray)
+    assert not isinstance(sparse._A, np.ndarray)
+    np.testing.assert_allclose(sparse._A.toarray(), dense._A)
+    for name, conn in dense.connections.items():
+        if conn.get("C_TOT") is not None:
+            assert sparse.connections[name]["C_TOT"] == pytest.approx(conn["C_TOT"], rel=1e-9, abs=1e-9)
+    assert sparse.system_costs == pytest.approx(dense.system_costs)
+
+
+def test_block_solver_matches_dense(costs):
+    dense = _run(costs, solver="dense")
+    block = _run(costs, solver="block")
+    assert sum(block._lu.block_sizes) == block.num_variables
+    for name, conn in dense.connections.items():
+        if conn.get("C_TOT") is not None:
+            assert block.connections[name]["C_TOT"] == pytest.approx(conn["C_TOT"], rel=1e-9, abs=1e-9)
+    assert block.system_costs == pytest.approx(dense.system_costs)
+
+
+def test_invalid_solver(exergy_analysis):
+    with pytest.raises(ValueError, match="Invalid solver"):
+        ExergoeconomicAnalysis(exergy_analysis, solver="iterative")
+
+
+def test_rerun_reuses_factorisation(exergy_analysis, costs):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    first = dict(exa.system_costs)
+    lu = exa._lu
+    exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    assert exa._lu is lu
+    assert exa.system_costs == pytest.approx(first)
+
+
+def test_solve_many_matches_individual_runs(exergy_analysis, costs, monkeypatch):
+    cheap = dict(costs, E1_c=50.0)
+    expensive = {key: value * 2 for key, value in costs.items()}
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    constructed = []
+    construct_matrix = exa.construct_matrix
+    monkeypatch.setattr(exa, "construct_matrix", lambda Tamb: constructed.append(1) or construct_matrix(Tamb))
+    results = exa.solve_many({"base": costs, "cheap": cheap, "expensive": expensive}, Tamb=exergy_analysis.Tamb)
+    assert list(results) == ["base", "cheap", "expensive"]
+    # The scenarios share the matrix, only the right-hand sides are built per scenario
+    assert len(constructed) == 1
+    for label, scenario in (("base", costs), ("cheap", cheap), ("expensive", expensive)):
+        reference = _run(scenario)
+        result = results[label]
+        assert result["system_costs"] == pytest.approx(reference.system_costs)
+        for name, values in result["connections"].items():
+            expected = reference.connections[name].get("C_TOT")
+            assert values["C_TOT"] == pytest.approx(expected * 3600, rel=1e-9, abs=1e-9)
+        assert result["components"]["COMP1"]["C_P"] == pytest.approx(reference.components["COMP1"].C_P * 3600)
+    # The instance holds the results of the last scenario
+    assert exa.system_costs == pytest.approx(results["expensive"]["system_costs"])
+
+
+def test_solve_many_assembles_the_equations_once(exergy_analysis, costs, monkeypatch):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    assembled = []
+    assemble_equations = exa._assemble_equations
+    monkeypatch.setattr(exa, "_assemble_equations", lambda Tamb: assembled.append(1) or assemble_equations(Tamb))
+    scenarios = [dict(costs, E1_c=c, COMP1_Z=z) for c in (10.0, 20.0, 40.0) for z in (1.0, 5.0)]
+    results = exa.solve_many(scenarios, Tamb=exergy_analysis.Tamb)
+    # The right-hand sides are patched from the cost rows, not assembled per scenario
+    assert len(assembled) == 1
+    reference = _run(scenarios[-1])
+    assert results[-1]["system_costs"] == pytest.approx(reference.system_costs)
+    assert exa._b == pytest.approx(reference._b)
+
+
+def test_solve_many_requires_cost_dictionaries(exergy_analysis):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    with pytest.raises(ValueError, match="cost_scenarios"):
+        exa.solve_many([1.0, 2.0], Tamb=exergy_analysis.Tamb)
+
+
+@pytest.mark.parametrize("solve", ["run", "solve_many"])
+def test_update_component_cost_matches_run(exergy_analysis, costs, solve):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    with pytest.raises(ValueError, match="Run the exergoeconomic analysis"):
+        exa.update_component_cost("COMP1", 500.0)
+    if solve == "run":
+        exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    else:
+        exa.solve_many([dict(costs, E1_c=50.0), costs], Tamb=exergy_analysis.Tamb)
+    lu = exa._lu
+
+    exa.update_component_cost("COMP1", 500.0)
+    results = exa.update_component_cost("VAL2", 40.0)  # dissipative component
+
+    reference = _run(dict(costs, COMP1_Z=500.0, VAL2_Z=40.0))
+    assert exa._lu is lu
+    assert exa.system_costs == pytest.approx(reference.system_costs)
+    for name, values in reference._scenario_results()["components"].items():
+        assert results[name] == pytest.approx(values, rel=1e-9, abs=1e-9, nan_ok=True)
+    with pytest.raises(ValueError, match="Unknown component"):
+        exa.update_component_cost("SEP1", 1.0)
+
+
+def test_cost_sensitivities_match_finite_differences(exergy_analysis, costs):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    with pytest.raises(ValueError, match="Run the exergoeconomic analysis"):
+        exa.cost_sensitivities()
+    exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    with pytest.raises(ValueError, match="Unknown product"):
+        exa.cost_sensitivities("SEP1")
+
+    def product_costs(analysis):
+        # Specific costs of the total product and of stream 42, which includes the loss stream 12, in currency/GJ
+        c_total = analysis.system_costs["C_P"] / 3600 / exergy_analysis.E_P * 1e9
+        return np.array([c_total, analysis.connections["42"]["c_TOT"] * 1e9])
+
+    base = product_costs(exa)
+    total, stream = exa.cost_sensitivities(), exa.cost_sensitivities("42")
+    for name in ("COMP1", "VAL2"):
+        perturbed = _run(dict(costs, **{f"{name}_Z": costs[f"{name}_Z"] + 1.0}))
+        expected = product_costs(perturbed) - base
+        assert [total["components"][name], stream["components"][name]] == pytest.approx(expected, rel=1e-6)
+    perturbed = _run(dict(costs, E1_c=costs["E1_c"] + 1.0))
+    expected = product_costs(perturbed) - base
+    assert [total["connections"]["E1"], stream["connections"]["E1"]] == pytest.approx(expected, rel=1e-6)
+
+    # The tables only run the adjoint solve on request
+    df_comp, _, df_mat2, df_non_mat = exa.exergoeconomic_results(print_results=False)
+    assert not any(column.startswith("dc_P") for df in (df_comp, df_mat2, df_non_mat) for column in df)
+    # Every cost rate enters the total product cost with the same weight, so only the prices are ranked
+    df_comp, _, df_mat2, df_non_mat = exa.exergoeconomic_results(print_results=False, sensitivities=True)
+    assert not any(column.startswith("dc_P") for column in df_comp)
+    assert "dc_P,tot/dc [-]" in df_mat2 and "dc_P,tot/dc [-]" in df_non_mat
+    df_comp, _, _, df_non_mat = exa.exergoeconomic_results(print_results=False, sensitivities="42")
+    dZ = df_comp.set_index("Component")["dc_P,42/dZ [h/GJ]"]
+    assert dZ["COMP1"] == pytest.approx(stream["components"]["COMP1"])
+    assert dZ["VAL2"] == pytest.approx(stream["components"]["VAL2"])
+    assert df_non_mat.set_index("Connection").loc["E1", "dc_P,42/dc [-]"] == pytest.approx(stream["connections"]["E1"])
+
+
+def test_dependency_report(exergy_analysis, costs, capsys):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    deps = exa.detect_linear_dependencies()
+    assert deps["rank"] == exa.num_variables
+    assert deps["dependent_equation_sets"] == []
+
+    # Duplicate the first equation into the second one
+    exa._A = exa._A.copy()
+    exa._A[1] = exa._A[0]
+    exa.print_dependency_report()
+    out = capsys.readouterr().out
+    assert f"Eq[0] {exa.equations[0]!r}  ~  Eq[1] {exa.equations[1]!r}" in out
+    assert f"rank {exa.num_variables - 1} of {exa.num_variables}" in out
+
+
+def test_structure_is_checked_once_per_pattern(exergy_analysis, costs, monkeypatch):
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    checks = []
+    check_structure = exa._check_structure
+    monkeypatch.setattr(exa, "_check_structure", lambda: checks.append(1) or check_structure())
+    exa.solve_many([costs, dict(costs, E1_c=50.0), dict(costs, COMP1_Z=1.0)], Tamb=exergy_analysis.Tamb)
+    exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+    assert len(checks) == 1
+
+
+def test_structurally_singular_system(exergy_analysis, costs, monkeypatch):
+    # Without the auxiliary equations of COMP1 the system has fewer equations than variables
+    monkeypatch.setattr(
+        exergy_analysis.components["COMP1"],
+        "aux_eqs",
+        lambda A, b, counter, Tamb, equations, *args: (A, b, counter, equations),
+    )
+    exa = ExergoeconomicAnalysis(exergy_analysis)
+    with pytest.raises(ValueError, match="structurally singular") as error:
+        exa.run(Exe_Eco_Costs=costs, Tamb=exergy_analysis.Tamb)
+
+    structure = exa.structural_analysis()
+    assert structure["structural_rank"] == exa.num_variables - 1
+    assert any("(no equation)" in eq for block in structure["overdetermined"] for eq in block["equations"])
+    assert any("C_W1_TOT" in block["variables"] for block in structure["underdetermined"])
+    assert "Under-determined block" in str(error.value)
+
+
+def test_equation_labels_name_their_objects(costs):
+    exa = _run(costs)
+    labels = {row: exa._equation_label(row) for row in exa.equations}
+    # Component rows store their objects under "objects", the analysis rows under "object"
+    for row, equation in exa.equations.items():
+        names = equation.get("object") or equation.get("objects")
+        assert all(str(name) in labels[row] for name in names)
+    assert any("objects" in equation for equation in exa.equations.values())
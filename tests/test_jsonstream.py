@@ -0,0 +1,89 @@
+"""
+Tests for the streaming JSON reader and the streaming mode of ExergyAnalysis.from_json.
+"""
+
+import io
+import json
+import os
+
+import pytest
+
+from exerpy import ExergyAnalysis
+from exerpy.jsonstream import JsonScanner, iter_json_sections
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, "examples")
+MODEL_JSON = os.path.join(EXAMPLES, "ccpp", "ccpp_ebs.json")
+
+
+def _rebuild(json_path, chunk_size):
+    data = {}
+    for section, key, value in iter_json_sections(json_path, chunk_size=chunk_size):
+        if key is None:
+            data[section] = value
+        else:
+            data[section][key] = value
+    return data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_sections_rebuild_document(chunk_size):
+    with open(MODEL_JSON) as f:
+        expected = json.load(f)
+
+    data = _rebuild(MODEL_JSON, chunk_size)
+
+    assert data == expected
+    assert list(data["connections"]) == list(expected["connections"])
+
+
+def test_scanner_members_and_numbers_across_chunks():
+    scanner = JsonScanner(io.StringIO('{"a": 12345678, "b": {"c": [1, 2.5e3]}, "d": {}}'), chunk_size=3)
+    values = {}
+    for key in scanner.members():
+        if key == "b":
+            values[key] = {inner: scanner.value() for inner in scanner.members()}
+        else:
+            values[key] = scanner.value()
+    scanner.end()
+
+    assert values == {"a": 12345678, "b": {"c": [1, 2500.0]}, "d": {}}
+
+
+@pytest.mark.parametrize("document", ['{"a": 1,}', '{"a" 1}', '{"a": 1} {}', "[1, 2]", '{"a": [1, 2}'])
+def test_invalid_documents(tmp_path, document):
+    path = tmp_path / "invalid.json"
+    path.write_text(document)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_sections(str(path), chunk_size=2))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"chemExLib": "Ahrendts"}, {"chemExLib": "Ahrendts", "Tamb": 290.0, "pamb": 1.01e5}],
+)
+def test_from_json_streaming_matches_load(kwargs):
+    loaded = ExergyAnalysis.from_json(MODEL_JSON, **kwargs)
+    streamed = ExergyAnalysis.from_json(MODEL_JSON, streaming=True, **kwargs)
+
+    assert (streamed.Tamb, streamed.pamb) == (loaded.Tamb, loaded.pamb)
+    assert list(streamed.components) == list(loaded.components)
+    assert streamed.connections == loaded.connections
+
+
+def test_from_json_streaming_errors(tmp_path):
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps({"components": {}, "connections": {}}))
+    with pytest.raises(ValueError, match="Missing required sections"):
+        ExergyAnalysis.from_json(str(path), streaming=True)
+
+    path.write_text(
+        json.dumps(
+            {
+                "components": {},
+                "connections": {"1": {"kind": "material", "source_component": None}},
+                "ambient_conditions": {"Tamb": 298.15, "pamb": 101325},
+            }
+        )
+    )
+    with pytest.raises(ValueError, match="Connection '1' missing required fields"):
+        ExergyAnalysis.from_json(str(path), streaming=True)
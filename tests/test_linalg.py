@@ -0,0 +1,206 @@
+"""
+Unit tests for the sparse assembly and solver backends of the exergoeconomic analysis.
+"""
+
+import numpy as np
+import pytest
+
+from exerpy import linalg
+from exerpy.linalg import (
+    SPARSE_THRESHOLD,
+    BlockTriangularFactorisation,
+    LUFactorisation,
+    TripletMatrix,
+    dulmage_mendelsohn,
+    find_linear_dependencies,
+    solve_linear_system,
+    use_sparse,
+)
+
+scipy_sparse = pytest.importorskip("scipy.sparse")
+
+
+def test_triplet_matrix_assignment_semantics():
+    A = TripletMatrix((3, 3))
+    A[0, 0] = 2
+    A[0, 0] = 4  # overwrites like a dense array
+    A[1, 2] = -1.5
+    A[2, 1] = 0  # explicit zeros are not stored as non-zeros
+    assert A[0, 0] == 4.0
+    assert A[2, 2] == 0.0
+    assert A.nnz == 2
+    rows, cols, values = A.triplets()
+    assert rows.tolist() == [0, 1]
+    assert cols.tolist() == [0, 2]
+    assert values.tolist() == [4.0, -1.5]
+    np.testing.assert_array_equal(A.toarray(), [[4, 0, 0], [0, 0, -1.5], [0, 0, 0]])
+    np.testing.assert_array_equal(A.tocsr().toarray(), A.toarray())
+
+
+def test_triplet_matrix_out_of_bounds():
+    A = TripletMatrix((2, 2))
+    with pytest.raises(IndexError):
+        A[2, 0] = 1
+
+
+def test_use_sparse():
+    assert not use_sparse(SPARSE_THRESHOLD - 1)
+    assert use_sparse(SPARSE_THRESHOLD)
+    assert use_sparse(1, "sparse")
+    assert not use_sparse(10**6, "dense")
+    with pytest.raises(ValueError, match="Invalid solver"):
+        use_sparse(1, "iterative")
+
+
+def test_dense_and_sparse_solutions_agree():
+    rng = np.random.default_rng(0)
+    n = 50
+    A = TripletMatrix((n, n))
+    for i in range(n):
+        A[i, i] = 4.0
+        A[i, (i + 1) % n] = -1.0
+        A[i, (i + 7) % n] = 0.5 * rng.random()
+    b = rng.random(n)
+    np.testing.assert_allclose(solve_linear_system(A.tocsr(), b), solve_linear_system(A.toarray(), b))
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_singular_system_raises(backend):
+    A = TripletMatrix((2, 2))
+    A[0, 0] = 1
+    A[1, 0] = 1
+    matrix = A.tocsr() if backend == "sparse" else A.toarray()
+    with pytest.raises(np.linalg.LinAlgError):
+        solve_linear_system(matrix, np.ones(2))
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_factorisation_solves_many_right_hand_sides(backend):
+    rng = np.random.default_rng(1)
+    n = 30
+    A = TripletMatrix((n, n))
+    for i in range(n):
+        A[i, i] = 3.0
+        A[i, (i + 3) % n] = rng.random()
+    matrix = A.tocsr() if backend == "sparse" else A.toarray()
+    B = rng.random((n, 4))
+    lu = LUFactorisation(matrix)
+    X = lu.solve(B)
+    assert X.shape == (n, 4)
+    for k in range(4):
+        np.testing.assert_allclose(X[:, k], solve_linear_system(matrix, B[:, k]))
+    np.testing.assert_allclose(lu.solve(B[:, 0]), X[:, 0])
+    np.testing.assert_allclose(lu.solve(B, trans=True), np.linalg.solve(A.toarray().T, B))
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_factorisation_of_singular_matrix_raises(backend):
+    A = TripletMatrix((2, 2))
+    A[0, 0] = 1
+    A[1, 0] = 1
+    matrix = A.tocsr() if backend == "sparse" else A.toarray()
+    with pytest.raises(np.linalg.LinAlgError):
+        LUFactorisation(matrix)
+
+
+def test_fingerprint_depends_on_entries():
+    A = TripletMatrix((2, 2))
+    A[0, 0] = 1
+    B = TripletMatrix((2, 2))
+    B[0, 0] = 1
+    B[1, 1] = 0  # explicit zeros do not change the fingerprint
+    assert A.fingerprint() == B.fingerprint()
+    B[1, 1] = 2
+    assert A.fingerprint() != B.fingerprint()
+    B[1, 1] = 3
+    A[1, 1] = 4
+    assert A.fingerprint() != B.fingerprint()
+    assert A.fingerprint(values=False) == B.fingerprint(values=False)
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_find_linear_dependencies(backend):
+    A = np.array(
+        [
+            [1.0, 2.0, 0.0, 0.0, 0.0],
+            [-2.0, -4.0, 0.0, 0.0, 0.0],  # anti-parallel to row 0
+            [0.0, 1.0, 1.0, 0.0, 0.0],
+            [1.0, 3.0, 1.0, 0.0, 0.0],  # row 0 + row 2
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 1.0, 1e-10],  # nearly dependent on row 6
+            [0.0, 0.0, 1.0, 1.0, 0.0],
+        ]
+    )
+    A = np.hstack((A, np.zeros((7, 2))))
+    deps = find_linear_dependencies(scipy_sparse.csr_matrix(A) if backend == "sparse" else A)
+
+    assert deps["zero_rows"] == [4]
+    assert deps["zero_columns"] == [5, 6]
+    assert deps["colinear_equations_strict"] == [(0, 1)]
+    assert deps["colinear_equations_near_only"] == [(5, 6)]
+    assert deps["dependent_equation_sets"] == [[0, 1], [1, 2, 3]]
+    assert deps["near_dependent_equation_sets"] == [[5, 6]]
+    assert deps["rank"] == 4
+
+
+def test_find_linear_dependencies_large_sparse_system():
+    n = 3000
+    A = (scipy_sparse.eye(n) - 0.9 * scipy_sparse.eye(n, k=-1) + 0.1 * scipy_sparse.eye(n, k=5)).tolil()
+    assert find_linear_dependencies(A.tocsr())["dependent_equation_sets"] == []
+
+    A[10] = 2 * A[20] - A[30]
+    A[2000] = A[2001] + A[2002] + A[2500]
+    deps = find_linear_dependencies(A.tocsr())
+
+    assert deps["dependent_equation_sets"] == [[10, 20, 30], [2000, 2001, 2002, 2500]]
+    assert deps["rank"] == n - 2
+
+
+@pytest.mark.parametrize("matching", ["scipy", "python"])
+def test_dulmage_mendelsohn(monkeypatch, matching):
+    if matching == "python":
+        monkeypatch.setattr(linalg, "maximum_bipartite_matching", None)
+    A = np.array(
+        [
+            [1.0, 1.0, 0.0, 0.0, 0.0],  # rows 0-2 compete for columns 0 and 1
+            [1.0, 1.0, 0.0, 0.0, 0.0],
+            [1.0, 1.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 1.0, 1.0, 1.0],  # row 3 cannot fix both columns 2 and 3
+            [0.0, 0.0, 0.0, 0.0, 1.0],
+        ]
+    )
+    structure = dulmage_mendelsohn(A)
+
+    assert structure["structural_rank"] == 4
+    assert structure["overdetermined"] == [([0, 1, 2], [0, 1])]
+    assert structure["underdetermined"] == [([3], [2, 3])]
+
+    structure = dulmage_mendelsohn(scipy_sparse.eye(4, format="csr") + scipy_sparse.eye(4, k=1))
+    assert structure == {"structural_rank": 4, "underdetermined": [], "overdetermined": []}
+
+
+@pytest.mark.parametrize("backend", ["dense", "sparse"])
+def test_block_triangular_factorisation(backend):
+    rng = np.random.default_rng(0)
+    n = 40
+    A = np.diag(rng.uniform(1, 2, n)) - 0.5 * np.eye(n, k=-1)  # feed-forward chain
+    A[10, 14] = 0.3  # recycle loop over rows 10 to 14
+    A[30, 2] = 0.7
+    perm_rows, perm_cols = rng.permutation(n), rng.permutation(n)
+    A = A[perm_rows][:, perm_cols]
+    matrix = scipy_sparse.csr_matrix(A) if backend == "sparse" else A
+    factorisation = BlockTriangularFactorisation(matrix)
+
+    assert sorted(factorisation.block_sizes) == [1] * (n - 5) + [5]
+    b = rng.standard_normal((n, 3))
+    np.testing.assert_allclose(factorisation.solve(b), np.linalg.solve(A, b))
+    np.testing.assert_allclose(factorisation.solve(b[:, 0]), np.linalg.solve(A, b[:, 0]))
+    np.testing.assert_allclose(factorisation.solve(b, trans=True), np.linalg.solve(A.T, b))
+    np.testing.assert_allclose(factorisation.solve(b[:, 0], trans=True), np.linalg.solve(A.T, b[:, 0]))
+
+
+def test_block_triangular_factorisation_of_singular_matrix_raises():
+    with pytest.raises(np.linalg.LinAlgError):
+        BlockTriangularFactorisation(np.array([[1.0, 1.0, 0.0], [2.0, 2.0, 0.0], [0.0, 1.0, 1.0]]))
+    with pytest.raises(np.linalg.LinAlgError):
+        BlockTriangularFactorisation(np.array([[1.0, 1.0], [1.0, 0.0], [0.0, 1.0]]))
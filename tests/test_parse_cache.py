@@ -0,0 +1,153 @@
+"""
+Tests for the on-disk parse cache of simulator models, using a fake Aspen COM interface.
+"""
+
+import json
+import os
+import sys
+import types
+
+import pytest
+
+from exerpy import ExergyAnalysis
+from exerpy.parser.cache import ParseCache
+from exerpy.parser.from_aspen import aspen_parser
+
+MODEL_JSON = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "hp_cascade", "hp_cascade_ebs.json")
+
+
+class FakeNode:
+    def __init__(self, name="", value=None, unit=None, children=None):
+        self.Name = name
+        self.Value = value
+        self.UnitString = unit
+        self.Elements = FakeElements(children or [])
+
+
+class FakeElements(list):
+    @property
+    def Count(self):
+        return len(self)
+
+    def __call__(self, index):
+        return self[index]
+
+
+class FakeTree:
+    def __init__(self):
+        self.nodes = {
+            r"\Data\Streams": FakeNode("Streams"),
+            r"\Data\Blocks": FakeNode("Blocks"),
+            r"\Data\Setup\Sim-Options\Input\REF_TEMP": FakeNode("REF_TEMP", 25.0, "C"),
+            r"\Data\Setup\Sim-Options\Input\REF_PRES": FakeNode("REF_PRES", 1.013, "bar"),
+        }
+
+    def FindNode(self, path):
+        return self.nodes.get(path)
+
+
+class FakeAspenDocument:
+    def __init__(self):
+        self.Tree = FakeTree()
+
+    def InitFromArchive2(self, path):
+        pass
+
+
+@pytest.fixture
+def fake_aspen(monkeypatch):
+    """Install a fake ``win32com.client`` module and count the started Aspen documents."""
+    calls = []
+
+    def dispatch(name):
+        calls.append(name)
+        return FakeAspenDocument()
+
+    win32com = types.ModuleType("win32com")
+    client = types.ModuleType("win32com.client")
+    client.Dispatch = dispatch
+    win32com.client = client
+    monkeypatch.setitem(sys.modules, "win32com", win32com)
+    monkeypatch.setitem(sys.modules, "win32com.client", client)
+    return calls
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    path = tmp_path / "model.bkp"
+    path.write_bytes(b"aspen backup v1")
+    return str(path)
+
+
+def _get(cache, path, split_physical_exergy=True, parser_version=aspen_parser.PARSER_VERSION):
+    return cache.get(
+        path,
+        "aspen",
+        parser_version,
+        split_physical_exergy,
+        lambda: aspen_parser.run_aspen(path, split_physical_exergy=split_physical_exergy),
+    )
+
+
+def test_unchanged_model_skips_simulator(fake_aspen, model_path, tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    first = _get(cache, model_path)
+    second = _get(ParseCache(tmp_path / "cache"), model_path)
+
+    assert len(fake_aspen) == 1
+    assert first == second
+    assert second["ambient_conditions"]["Tamb"] == pytest.approx(298.15)
+    assert first is not second
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["file", "parser_version", "split_physical_exergy"],
+)
+def test_cache_invalidation(fake_aspen, model_path, tmp_path, change):
+    cache = ParseCache(tmp_path / "cache")
+    _get(cache, model_path)
+
+    kwargs = {}
+    if change == "file":
+        with open(model_path, "ab") as f:
+            f.write(b" modified")
+    elif change == "parser_version":
+        kwargs["parser_version"] = "changed"
+    else:
+        kwargs["split_physical_exergy"] = False
+    _get(cache, model_path, **kwargs)
+
+    assert len(fake_aspen) == 2
+    assert cache.misses == 2
+
+
+def test_corrupt_entry_is_reparsed(fake_aspen, model_path, tmp_path):
+    cache = ParseCache(tmp_path / "cache")
+    _get(cache, model_path)
+    key = cache.key(model_path, "aspen", aspen_parser.PARSER_VERSION, True)
+    with open(cache.entry_path(key), "wb") as f:
+        f.write(b"not a pickle")
+
+    _get(cache, model_path)
+    assert len(fake_aspen) == 2
+    assert cache.clear() == 1
+
+
+def test_from_aspen_uses_cache(monkeypatch, model_path, tmp_path):
+    with open(MODEL_JSON) as f:
+        parsed = json.load(f)
+    calls = []
+
+    def run_aspen(path, split_physical_exergy=True):
+        calls.append(path)
+        return parsed
+
+    monkeypatch.setattr(aspen_parser, "run_aspen", run_aspen)
+    cache_dir = str(tmp_path / "cache")
+    ean = ExergyAnalysis.from_aspen(model_path, cache_dir=cache_dir)
+    cached = ExergyAnalysis.from_aspen(model_path, cache_dir=cache_dir)
+
+    assert len(calls) == 1
+    assert list(cached.components) == list(ean.components)
+    assert cached.connections["11"]["E"] == pytest.approx(ean.connections["11"]["E"])
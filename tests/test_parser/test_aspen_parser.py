@@ -22,6 +22,7 @@ from unittest.mock import patch
 import pytest
 
 from exerpy.parser.from_aspen.aspen_parser import AspenModelParser, run_aspen
+from exerpy.parser.from_aspen.aspen_tree import CachedTree, StreamSnapshot
 
 # --- DummyCollection class to simulate COM collection behavior ---
 
@@ -362,6 +363,142 @@ def test_parse_streams_handles_missing_values(caplog, dummy_convert_to_SI, dummy
     assert any("has no value" in rec.message for rec in caplog.records)
 
 
+# --- Tests for the node handle cache ---
+
+
+class CountingTree(DummyTree):
+    """Dummy tree counting the ``FindNode`` calls per path."""
+
+    def __init__(self, nodes):
+        super().__init__(nodes)
+        self.calls = {}
+
+    def FindNode(self, path):
+        self.calls[path] = self.calls.get(path, 0) + 1
+        return super().FindNode(path)
+
+
+def test_cached_tree_resolves_paths_once():
+    """
+    Test that repeated lookups, including missing nodes, reach the tree only once.
+    """
+    tree = CountingTree({r"\Data\Streams\S1\Output\POWER_OUT": DummyNode("POWER_OUT", 100, "W")})
+    cached = CachedTree(tree)
+
+    for _ in range(3):
+        node = cached.FindNode(r"\Data\Streams\S1\Output\POWER_OUT")
+        assert cached.FindNode(r"\Data\Streams\S1\Input\HEAT") is None
+
+    assert node.Value == 100
+    assert node.UnitString == "W"
+    assert cached.lookups == 2
+    assert set(tree.calls.values()) == {1}
+
+
+def test_parse_streams_looks_up_each_node_once(monkeypatch, dummy_convert_to_SI, dummy_fluid_property_data):
+    """
+    Test that parsing a stream queries every node of the Aspen tree at most once.
+    """
+    import exerpy.parser.from_aspen.aspen_parser as ap
+
+    monkeypatch.setattr(ap, "convert_to_SI", dummy_convert_to_SI)
+    monkeypatch.setattr(ap, "fluid_property_data", dummy_fluid_property_data)
+
+    streams_parent = DummyNode("Streams")
+    streams_parent.Elements = DummyCollection([DummyNode("P1"), DummyNode("S1")])
+    mole_frac_node = DummyNode("MOLEFRAC")
+    mole_frac_node.Elements = DummyCollection([DummyNode("N2"), DummyNode("O2")])
+    nodes = {
+        r"\Data\Streams": streams_parent,
+        r"\Data\Streams\P1\Input\WORK": DummyNode("WORK"),
+        r"\Data\Streams\P1\Output\POWER_OUT": DummyNode("POWER_OUT", -100, "W"),
+        r"\Data\Streams\S1\Output\TEMP_OUT\MIXED": DummyNode("TEMP_OUT", 350, "K"),
+        r"\Data\Streams\S1\Output\MOLEFRAC\MIXED": mole_frac_node,
+        r"\Data\Streams\S1\Output\MOLEFRAC\MIXED\N2": DummyNode("N2", 0.79),
+        r"\Data\Streams\S1\Output\MOLEFRAC\MIXED\O2": DummyNode("O2", 0.21),
+    }
+    tree = CountingTree(nodes)
+    parser = AspenModelParser("dummy_model.apw")
+    parser.aspen = DummyAspen(tree)
+
+    parser.parse_streams()
+
+    assert max(tree.calls.values()) == 1
+    assert parser.connections_data["P1"]["energy_flow"] == 100
+    assert parser.connections_data["S1"]["T"] == 350
+    assert parser.connections_data["S1"]["molar_composition"] == {"N2": 0.79, "O2": 0.21}
+    assert parser.connections_data["S1"]["mfn2"] == 0.79
+
+
+# --- Tests for the pipelined stream parsing ---
+
+
+def many_streams_tree(n):
+    """Dummy tree with power, heat and material streams."""
+    names = [f"S{i}" for i in range(n)]
+    streams_parent = DummyNode("Streams")
+    streams_parent.Elements = DummyCollection([DummyNode(name) for name in names])
+    nodes = {r"\Data\Streams": streams_parent}
+    for i, name in enumerate(names):
+        root = rf"\Data\Streams\{name}"
+        source = DummyNode("SOURCE")
+        source.Elements = DummyCollection([DummyNode(f"B{i}")])
+        nodes[rf"{root}\Ports\SOURCE"] = source
+        if i % 5 == 0:
+            nodes[rf"{root}\Input\WORK"] = DummyNode("WORK")
+            nodes[rf"{root}\Output\POWER_OUT"] = DummyNode("POWER_OUT", -10.0 * i, "W")
+        elif i % 5 == 1:
+            nodes[rf"{root}\Input\HEAT"] = DummyNode("HEAT")
+            nodes[rf"{root}\Output\QCALC"] = DummyNode("QCALC", 5.0 * i, "W")
+        else:
+            mole_frac_node = DummyNode("MOLEFRAC")
+            mole_frac_node.Elements = DummyCollection([DummyNode("N2"), DummyNode("CH4")])
+            nodes[rf"{root}\Output\TEMP_OUT\MIXED"] = DummyNode("TEMP_OUT", 300.0 + i, "K")
+            nodes[rf"{root}\Output\PRES_OUT\MIXED"] = DummyNode("PRES_OUT", 1e5 + i, "Pa")
+            nodes[rf"{root}\Output\MASSFLMX\MIXED"] = DummyNode("MASSFLMX", 0.1 * i, "kg/s")
+            nodes[rf"{root}\Output\MOLEFRAC\MIXED"] = mole_frac_node
+            nodes[rf"{root}\Output\MOLEFRAC\MIXED\N2"] = DummyNode("N2", 0.9)
+            nodes[rf"{root}\Output\MOLEFRAC\MIXED\CH4"] = DummyNode("CH4", 0.1)
+    return CountingTree(nodes)
+
+
+def test_pipelined_parse_streams_matches_serial(monkeypatch, dummy_convert_to_SI, dummy_fluid_property_data):
+    """
+    Test that parsing the streams in worker threads gives the same data, in the same order, as the serial parse.
+    """
+    import exerpy.parser.from_aspen.aspen_parser as ap
+
+    monkeypatch.setattr(ap, "convert_to_SI", dummy_convert_to_SI)
+    monkeypatch.setattr(ap, "fluid_property_data", dummy_fluid_property_data)
+
+    serial = AspenModelParser("dummy_model.apw")
+    serial.aspen = DummyAspen(many_streams_tree(23))
+    serial.parse_streams()
+
+    tree = many_streams_tree(23)
+    pipelined = AspenModelParser("dummy_model.apw", n_workers=3)
+    pipelined.aspen = DummyAspen(tree)
+    pipelined.parse_streams()
+
+    assert list(pipelined.connections_data) == list(serial.connections_data)
+    assert pipelined.connections_data == serial.connections_data
+    assert max(tree.calls.values()) == 1
+    assert pipelined.connections_data["S2"]["molar_composition"] == {"N2": 0.9, "CH4": 0.1}
+
+
+def test_stream_snapshot_rejects_unfetched_nodes():
+    """
+    Test that a stream snapshot answers the fetched lookups, including missing nodes, and rejects all others.
+    """
+    snapshot = StreamSnapshot.fetch(many_streams_tree(1), "S0")
+
+    assert snapshot.FindNode(r"\Data\Streams\S0\Output\POWER_OUT").Value == 0.0
+    assert snapshot.FindNode(r"\Data\Streams\S0\Ports\SOURCE").Elements(0).Name == "B0"
+    assert snapshot.FindNode(r"\Data\Streams\S0\Ports\DEST") is None
+    with pytest.raises(LookupError):
+        snapshot.FindNode(r"\Data\Streams\S0\Output\TEMP_OUT\MIXED")
+
+
 # --- Tests for parse_blocks and component grouping ---
 
 
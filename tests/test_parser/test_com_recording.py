@@ -0,0 +1,162 @@
+"""
+Tests for recording the COM objects touched by the parsers and replaying them without the simulators.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from exerpy.parser.com_recording import ComRecorder, ComRecording, ReplayError
+from exerpy.parser.from_aspen.aspen_parser import AspenModelParser
+from exerpy.parser.from_ebsilon import ebsilon_parser, utils
+from exerpy.parser.from_ebsilon.ebsilon_parser import EbsilonModelParser
+
+
+class FakeCollection(list):
+    @property
+    def Count(self):
+        return len(self)
+
+    def __call__(self, index):
+        return self[index]
+
+
+class FakeNode:
+    def __init__(self, name, value=None, unit=None, children=()):
+        self.Name = name
+        self.Value = value
+        self.UnitString = unit
+        self.Elements = FakeCollection(children)
+
+
+class FakeTree:
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.lookups = 0
+
+    def FindNode(self, path):
+        self.lookups += 1
+        return self.nodes.get(path)
+
+
+def fake_aspen_document():
+    stream_out = r"\Data\Streams\S1\Output"
+    nodes = {
+        r"\Data\Setup\Sim-Options\Input\REF_TEMP": FakeNode("REF_TEMP", 25.0, "C"),
+        r"\Data\Setup\Sim-Options\Input\REF_PRES": FakeNode("REF_PRES", 1.0, "bar"),
+        r"\Data\Streams": FakeNode("Streams", children=[FakeNode("S1")]),
+        r"\Data\Streams\S1\Ports\SOURCE": FakeNode("SOURCE", children=[FakeNode("B1")]),
+        r"\Data\Blocks": FakeNode("Blocks"),
+        rf"{stream_out}\TEMP_OUT\MIXED": FakeNode("MIXED", 100.0, "C"),
+        rf"{stream_out}\PRES_OUT\MIXED": FakeNode("MIXED", 10.0, "bar"),
+        rf"{stream_out}\MASSFLMX\MIXED": FakeNode("MIXED", 3.6, "kg/h"),
+        rf"{stream_out}\MOLEFRAC\MIXED": FakeNode("MIXED", children=[FakeNode("H2O")]),
+        rf"{stream_out}\MOLEFRAC\MIXED\H2O": FakeNode("H2O", 1.0),
+    }
+    return SimpleNamespace(Tree=FakeTree(nodes))
+
+
+def test_replay_aspen_parser(tmp_path):
+    document = fake_aspen_document()
+    parser = AspenModelParser("model.bkp")
+    parser.aspen = document
+    recorder = parser.start_recording()
+    parser.parse_model()
+    path = str(tmp_path / "model.rec.json.gz")
+    recorder.save(path)
+
+    replay = AspenModelParser("model.bkp", recording=path)
+    replay.initialize_model()
+    replay.parse_model()
+
+    assert replay.get_sorted_data() == parser.get_sorted_data()
+    assert replay.connections_data["S1"]["kind"] == "material"
+    assert replay.connections_data["S1"]["source_component"] == "B1"
+
+
+def test_replay_reports_unrecorded_access():
+    recorder = ComRecorder()
+    tree = recorder.wrap("tree", FakeTree({r"\Data\Blocks": FakeNode("Blocks", 1.0)}))
+    assert tree.FindNode(r"\Data\Blocks").Value == 1.0
+    assert tree.FindNode(r"\Data\Streams") is None
+
+    replay = ComRecording.from_recorder(recorder).root("tree")
+    assert replay.FindNode(r"\Data\Blocks").Value == 1.0
+    assert replay.FindNode(r"\Data\Streams") is None
+    with pytest.raises(ReplayError):
+        replay.FindNode(r"\Data\Setup")
+    with pytest.raises(ReplayError):
+        ComRecording.from_recorder(recorder).root("app")
+
+
+def test_replay_sequences_and_missing_attributes():
+    state = SimpleNamespace(FluidType=0)
+    recorder = ComRecorder()
+    fluid = recorder.wrap("fluid", state)
+    fluid.FluidType = 3
+    first = fluid.FluidType
+    fluid.FluidType = 4
+    second = fluid.FluidType
+    assert not hasattr(fluid, "Medium")
+
+    replay = ComRecording.from_recorder(recorder).root("fluid")
+    replay.FluidType = 3
+    assert (replay.FluidType, replay.FluidType, replay.FluidType) == (first, second, second)
+    assert not hasattr(replay, "Medium")
+
+
+def _value(value, dimension):
+    return SimpleNamespace(Value=value, Dimension=dimension)
+
+
+def fake_ebsilon():
+    """Fake Ebsilon application with two measuring points for the ambient state and one steam pipe."""
+    objects = [
+        SimpleNamespace(Name="Tamb", IsKindOf=lambda kind: kind == 10),
+        SimpleNamespace(Name="pamb", IsKindOf=lambda kind: kind == 10),
+        SimpleNamespace(Name="1", IsKindOf=lambda kind: kind == 16),
+    ]
+    measuring_points = {
+        "Tamb": SimpleNamespace(Name="Tamb", Kind=10046, FTYP=_value(26, 1), MEASM=_value(15.0, 4)),
+        "pamb": SimpleNamespace(Name="pamb", Kind=10046, FTYP=_value(13, 1), MEASM=_value(1.013, 3)),
+    }
+    pipe = SimpleNamespace(
+        Name="1",
+        Kind=1003,
+        FluidType=3,
+        HasComp=lambda i: False,
+        T=_value(500.0, 4),
+        P=_value(100.0, 3),
+        H=_value(3375.0, 5),
+        S=_value(6.6, 26),
+        M=_value(10.0, 6),
+        E=_value(1400.0, 5),
+    )
+    model = SimpleNamespace(Objects=SimpleNamespace(Count=len(objects), Item=lambda j: objects[j - 1]))
+    oc = SimpleNamespace(
+        CastToComp=lambda obj: measuring_points[obj.Name],
+        CastToComp46=lambda obj: measuring_points[obj.Name],
+        CastToPipe=lambda obj: pipe,
+    )
+    return SimpleNamespace(ObjectCaster=oc), model, oc
+
+
+def test_replay_ebsilon_parser_without_ebsilon(tmp_path, monkeypatch):
+    # Recording needs the Ebsilon COM interface, which is faked here
+    monkeypatch.setattr(ebsilon_parser, "is_ebsilon_available", lambda: True)
+    monkeypatch.setattr(utils, "__ebsilon_available__", True)
+    parser = EbsilonModelParser("model.ebs", split_physical_exergy=False)
+    parser.app, parser.model, parser.oc = fake_ebsilon()
+    recorder = parser.start_recording()
+    parser.parse_model()
+    path = str(tmp_path / "model.rec.json.gz")
+    recorder.save(path)
+    monkeypatch.undo()
+
+    replay = EbsilonModelParser("model.ebs", split_physical_exergy=False, recording=path)
+    replay.initialize_model()
+    replay.parse_model()
+
+    assert replay.get_sorted_data() == parser.get_sorted_data()
+    assert replay.Tamb == pytest.approx(288.15)
+    assert replay.connections_data["1"]["kind"] == "material"
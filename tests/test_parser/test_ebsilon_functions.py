@@ -13,9 +13,15 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from exerpy.parser.from_ebsilon import __ebsilon_path__
+from exerpy.parser.from_ebsilon import __ebsilon_path__, utils
 from exerpy.parser.from_ebsilon.ebsilon_config import substance_mapping
-from exerpy.parser.from_ebsilon.ebsilon_functions import calc_eM, calc_eT, calc_X_from_PT
+from exerpy.parser.from_ebsilon.ebsilon_functions import (
+    ReferenceStateCache,
+    calc_eM,
+    calc_eT,
+    calc_physical_split,
+    calc_X_from_PT,
+)
 
 
 @pytest.fixture
@@ -326,3 +332,57 @@ def test_calc_eM_error(monkeypatch, mock_app, mock_pipe):
     )
     with pytest.raises(Exception, match="Test error in eT"):
         calc_eM(mock_app, mock_pipe, 1e5, 300, 101325)
+
+
+@pytest.fixture
+def counted_reference_states(monkeypatch):
+    """
+    Allow the Ebsilon functions without Ebsilon and replace calc_X_from_PT by a counting dummy.
+
+    Returns
+    -------
+    list
+        The (property, pressure, temperature) of every property evaluation.
+    """
+    calls = []
+
+    def dummy_calc_X_from_PT(app, pipe, prop, pressure, temperature):
+        calls.append((prop, pressure, temperature))
+        return 100.0 if prop == "H" else 0.1
+
+    monkeypatch.setattr(utils, "__ebsilon_available__", True)
+    monkeypatch.setattr("exerpy.parser.from_ebsilon.ebsilon_functions.calc_X_from_PT", dummy_calc_X_from_PT)
+    return calls
+
+
+def test_calc_physical_split(counted_reference_states, mock_app, mock_pipe):
+    """
+    Test that the physical exergy split evaluates the dead state once and matches calc_eT and calc_eM.
+    """
+    e_T, e_M, e_PH = calc_physical_split(mock_app, mock_pipe, 1e5, 300, 101325)
+
+    assert len(counted_reference_states) == 2
+    assert e_T == pytest.approx(calc_eT(mock_app, mock_pipe, 1e5, 300, 101325))
+    assert e_M == pytest.approx(calc_eM(mock_app, mock_pipe, 1e5, 300, 101325))
+    assert e_T + e_M == pytest.approx(e_PH)
+
+
+def test_reference_state_cache(monkeypatch, counted_reference_states, mock_app, mock_pipe):
+    """
+    Test that the dead state is shared by streams of the same fluid and pressure, and evaluated for new ones.
+    """
+    monkeypatch.setattr("exerpy.parser.from_ebsilon.ebsilon_functions.substance_mapping", {"XN2": 1, "XO2": 2})
+    mock_pipe.XN2 = Mock(Value=0.79)
+    mock_pipe.XO2 = Mock(Value=0.21)
+    cache = ReferenceStateCache()
+    calc_physical_split(mock_app, mock_pipe, 1e5, 300, 101325, cache)
+    mock_pipe.Kind = 1004  # water shares the dead state with steam
+    calc_physical_split(mock_app, mock_pipe, 1e5, 300, 101325, cache)
+    assert (cache.misses, cache.hits, len(counted_reference_states)) == (1, 1, 2)
+
+    calc_physical_split(mock_app, mock_pipe, 2e5, 300, 101325, cache)
+    mock_pipe.Kind = 1001  # air, identified by its composition
+    calc_physical_split(mock_app, mock_pipe, 1e5, 300, 101325, cache)
+    mock_pipe.XO2.Value = 0.2
+    calc_physical_split(mock_app, mock_pipe, 1e5, 300, 101325, cache)
+    assert (cache.misses, cache.hits, len(cache)) == (4, 1, 4)
@@ -0,0 +1,76 @@
+"""
+Tests for running exergoeconomic scenarios in a batch on one analysed model.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from exerpy import EconomicAnalysis, ExergoeconomicAnalysis, ExergyAnalysis, ScenarioBatch
+from exerpy.scenarios import RESULT_COLUMNS
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "hp_cascade", "hp_cascade_ebs.json")
+E_F = {"inputs": ["E1", "E2"], "outputs": []}
+E_P = {"inputs": ["42"], "outputs": ["41"]}
+E_L = {"inputs": ["12"], "outputs": ["11"]}
+
+
+@pytest.fixture(scope="module")
+def batch():
+    batch = ScenarioBatch.from_json(MODEL_PATH, E_F, E_P, E_L, base_costs={"11_c": 0.0, "41_c": 0.0})
+    names = sorted(batch.exergy_analysis.components)
+    batch.PEC = {name: 1000.0 * (i + 1) for i, name in enumerate(names)}
+    batch.OMC_relative = 0.03
+    return batch
+
+
+def _reference(costs):
+    ean = ExergyAnalysis.from_json(MODEL_PATH)
+    ean.analyse(E_F=E_F, E_P=E_P, E_L=E_L)
+    exa = ExergoeconomicAnalysis(ean)
+    exa.run(Exe_Eco_Costs=costs, Tamb=ean.Tamb)
+    return exa
+
+
+def _system(df, scenario, variable):
+    mask = (df["Scenario"] == scenario) & (df["Type"] == "system") & (df["Variable"] == variable)
+    return df.loc[mask, "Value"].item()
+
+
+def test_economic_scenarios_match_individual_runs(batch):
+    scenarios = pd.DataFrame(
+        {"E1_c": [80.0, 111.0], "tau": [4000, 5500], "i_eff": 0.08, "n": 20, "r_n": 0.02}, index=["low", "high"]
+    )
+    df = batch.run(scenarios)
+    assert list(df.columns) == list(RESULT_COLUMNS)
+    assert set(df["Scenario"]) == {"low", "high"}
+
+    for label, row in scenarios.iterrows():
+        names = list(batch.PEC)
+        _, _, Z = EconomicAnalysis(row[["tau", "i_eff", "n", "r_n"]].to_dict()).compute_component_costs(
+            [batch.PEC[name] for name in names], [0.03] * len(names)
+        )
+        costs = {f"{name}_Z": z for name, z in zip(names, Z, strict=True)}
+        costs.update({"11_c": 0.0, "41_c": 0.0, "E1_c": row["E1_c"]})
+        reference = _reference(costs)
+        for variable in ("C_F", "C_P", "Z"):
+            assert _system(df, label, variable) == pytest.approx(reference.system_costs[variable])
+
+
+def test_parallel_run_matches_serial(batch):
+    Z = {f"{name}_Z": 5.0 for name in batch.PEC}
+    scenarios = [dict(Z, E1_c=price) for price in (90.0, 100.0, 110.0, 120.0)]
+    serial = batch.run(scenarios)
+    parallel = batch.run(scenarios, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_incomplete_economic_parameters(batch):
+    with pytest.raises(ValueError, match="missing"):
+        batch.costs({"tau": 5500})
+
+
+def test_requires_analysed_model():
+    with pytest.raises(ValueError, match="analysed"):
+        ScenarioBatch(ExergyAnalysis.from_json(MODEL_PATH))
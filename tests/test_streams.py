@@ -0,0 +1,83 @@
+"""
+Unit tests for the columnar StreamTable.
+"""
+
+import numpy as np
+import pytest
+
+from exerpy.streams import StreamTable
+
+
+@pytest.fixture
+def connections():
+    return {
+        "1": {"kind": "material", "m": 2.0, "T": 300.0, "e_PH": 100.0, "E": 200.0},
+        "2": {"kind": "material", "m": 2.0, "T": 400.0, "e_PH": None, "E": None},
+        "E1": {"kind": "power", "energy_flow": 50.0, "E": 50.0},
+    }
+
+
+def test_dict_like_view(connections):
+    table = StreamTable(connections)
+    assert len(table) == 3
+    assert list(table) == ["1", "2", "E1"]
+    assert table["1"] is connections["1"]
+    assert table.get("missing") is None
+    assert dict(table.items()) == connections
+    assert table == connections
+
+
+def test_columns(connections):
+    table = StreamTable(connections)
+    assert table.ids == {"1": 0, "2": 1, "E1": 2}
+    np.testing.assert_array_equal(table.column("T"), [300.0, 400.0, np.nan])
+    np.testing.assert_array_equal(table.kind, ["material", "material", "power"])
+    assert table.total("E", ["1", "2", "E1"]) == 250.0
+    assert table.total("E", []) == 0.0
+
+
+def test_writes_invalidate_columns(connections):
+    table = StreamTable(connections)
+    assert np.isnan(table.column("E")[1])
+
+    # The connection dictionaries are the storage, a write drops the cached columns
+    connections["2"]["E"] = 10.0
+    assert table.column("E")[1] == 10.0
+    connections["1"].update(T=310.0)
+    assert table.column("T")[0] == 310.0
+    connections["1"].pop("T")
+    assert np.isnan(table.column("T")[0])
+
+    table.set_column("C_TOT", [1.0, np.nan], names=["1", "E1"])
+    assert connections["1"]["C_TOT"] == 1.0
+    assert connections["E1"]["C_TOT"] is None
+    np.testing.assert_array_equal(table.column("C_TOT"), [1.0, np.nan, np.nan])
+    # Writing a column keeps the other cached columns
+    E = table.column("E")
+    table.set_column("C_T", [2.0, 3.0, 4.0])
+    assert table.column("E") is E
+
+
+def test_refresh(connections):
+    table = StreamTable(connections)
+    connections["3"] = {"kind": "heat", "E": 5.0}
+    assert "3" not in table.ids
+    table.refresh()
+    assert table.total("E", ["3"]) == 5.0
+
+
+def test_add_and_remove_streams(connections):
+    table = StreamTable(connections)
+    table["3"] = {"kind": "heat", "E": 5.0}
+    assert table.ids["3"] == 3
+    assert table.total("E", ["3"]) == 5.0
+    del table["1"]
+    assert "1" not in connections
+    assert table.ids == {"2": 0, "E1": 1, "3": 2}
+
+
+def test_to_dataframe(connections):
+    df = StreamTable(connections).to_dataframe(["m", "E"])
+    assert list(df.columns) == ["kind", "m", "E"]
+    assert list(df.index) == ["1", "2", "E1"]
+    assert df.loc["1", "E"] == 200.0
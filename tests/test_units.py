@@ -0,0 +1,130 @@
+"""
+Tests for the precompiled unit registry, the vectorised unit conversion and the unit audit sink.
+"""
+
+import queue
+
+import numpy as np
+import pytest
+
+from exerpy.functions import UNIT_REGISTRY, convert_array_to_SI, convert_to_SI, fluid_property_data
+from exerpy.units import (
+    UnitAuditSink,
+    UnitNotFoundError,
+    UnitRegistry,
+    flush_unit_audit,
+    get_unit_audit_sink,
+    normalize_unit,
+    set_unit_audit_sink,
+)
+
+
+@pytest.mark.parametrize(
+    "unit, expected",
+    [("kJ/kg-K", "kj/kg k"), ("Watts", "watt"), ("°C", "c"), ("kJ per kg", "kj / kg"), ("N/sq. m", "n/sq m")],
+)
+def test_normalize_unit(unit, expected):
+    assert normalize_unit(unit) == expected
+
+
+def test_registry_resolves_aliases_and_normalised_units():
+    registry = UnitRegistry(fluid_property_data)
+    assert registry.resolve("T", "°C") == ("C", 273.15, 1)
+    assert registry.resolve("power", "Kilowatt") == ("kW", 0, 1e3)
+    assert registry.resolve("p", "N/sqm") == ("Pa", 0, 1)
+    assert registry.resolve("s", "KJ/KG-K") == ("kJ/kg-K", 0, 1e3)
+    assert registry.resolve("T", "Unknown") is None
+    with pytest.raises(UnitNotFoundError):
+        registry.resolve("T", "invalid_unit")
+
+
+def test_registry_caches_raw_unit_strings():
+    registry = UnitRegistry(fluid_property_data)
+    for _ in range(5):
+        registry.resolve("h", "kJ/kg")
+    info = registry.cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+
+
+def test_convert_to_SI_does_not_print(capsys):
+    assert convert_to_SI("T", 25, "C") == pytest.approx(298.15)
+    assert capsys.readouterr().out == ""
+
+
+def test_convert_array_to_SI():
+    np.testing.assert_allclose(convert_array_to_SI("T", [0, 25, None], "°C"), [273.15, 298.15, np.nan])
+    np.testing.assert_allclose(convert_array_to_SI("p", np.array([1.0, 2.5]), "bar"), [1e5, 2.5e5])
+    values = [convert_to_SI("m", v, "t/h") for v in (3.6, 7.2)]
+    np.testing.assert_array_equal(convert_array_to_SI("m", [3.6, 7.2], "t/h"), values)
+    # Unknown units and properties return the values unchanged
+    np.testing.assert_array_equal(convert_array_to_SI("T", [1, 2], "Unknown"), [1, 2])
+    np.testing.assert_array_equal(convert_array_to_SI("invalid_property", [1, 2], "K"), [1, 2])
+    with pytest.raises(ValueError, match="Invalid unit"):
+        convert_array_to_SI("p", [1.0], "furlong")
+
+
+def test_module_registry_covers_all_properties():
+    assert all(prop in UNIT_REGISTRY for prop in fluid_property_data)
+
+
+@pytest.fixture
+def audit_sink():
+    sink = UnitAuditSink()
+    previous = set_unit_audit_sink(sink)
+    yield sink
+    set_unit_audit_sink(previous)
+
+
+def test_unit_audit_is_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert get_unit_audit_sink() is None
+    convert_to_SI("T", 25.0, "°C", context="stream:S1")
+    flush_unit_audit()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unit_audit_sink_deduplicates_and_counts(audit_sink):
+    for value in (10.0, 20.0, 30.0):
+        convert_to_SI("T", value, "°C", context="stream:S1")
+    convert_to_SI("p", 1.0, "bar", context="stream:S2")
+
+    seen = {(obs.property, obs.raw_unit): obs for obs in audit_sink.observations()}
+    assert len(seen) == 2
+    assert seen[("T", "°C")].count == 3
+    assert seen[("T", "°C")].unit == "C"
+    assert seen[("T", "°C")].context == "stream:S1"
+
+
+def test_unit_audit_sink_records_unknown_units(audit_sink):
+    with pytest.raises(ValueError):
+        convert_to_SI("p", 1.0, "furlong", context="stream:S3")
+    kinds = {obs.kind for obs in audit_sink.observations() if obs.raw_unit == "furlong"}
+    assert kinds == {"seen", "unknown"}
+
+
+def test_unit_audit_sink_flush_to_file(tmp_path):
+    path = tmp_path / "units.tsv"
+    sink = UnitAuditSink(path=str(path))
+    sink.record("seen", "T", "°C", "C", "stream:S1", count=2)
+    sink.record("unknown", "p", "furlong", "furlong")
+
+    assert len(sink.flush()) == 2
+    assert len(sink) == 0
+    assert sink.flush() == []
+
+    observations = UnitAuditSink.read(str(path))
+    assert observations[0] == ("seen", "T", "°C", "C", "stream:S1", 2)
+    assert observations[1].context is None
+
+
+def test_unit_audit_sink_collects_from_queue():
+    q = queue.Queue()
+    workers = [UnitAuditSink(queue=q), UnitAuditSink(queue=q)]
+    for worker in workers:
+        worker.record("seen", "m", "kg/h", "kg / h", "stream:S1")
+        worker.flush()
+
+    main = UnitAuditSink()
+    assert main.collect(q) == 2
+    assert main.observations()[0].count == 2
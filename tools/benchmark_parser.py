@@ -0,0 +1,47 @@
+"""
+Time the Aspen or Ebsilon parser on a COM recording, without the simulator.
+
+A recording is created on a machine with the simulator installed, e.g.:
+    from exerpy.parser.from_aspen.aspen_parser import run_aspen
+    run_aspen("model.bkp", record_path="model.rec.json.gz")
+
+Usage:
+    python tools/benchmark_parser.py aspen model.rec.json.gz [repeats]
+    python tools/benchmark_parser.py ebsilon model.rec.json.gz [repeats]
+"""
+
+import sys
+import time
+
+from exerpy.parser.com_recording import ComRecording
+
+
+def benchmark(tool, recording_path, repeats=5):
+    """Return the parse times in seconds of the replayed model."""
+    if tool == "aspen":
+        from exerpy.parser.from_aspen.aspen_parser import AspenModelParser as Parser
+    elif tool == "ebsilon":
+        from exerpy.parser.from_ebsilon.ebsilon_parser import EbsilonModelParser as Parser
+    else:
+        raise ValueError(f"Unknown parser '{tool}'. Choose 'aspen' or 'ebsilon'.")
+
+    recording = ComRecording.load(recording_path)
+    times = []
+    for _ in range(repeats):
+        recording.rewind()
+        parser = Parser(recording_path, recording=recording)
+        parser.initialize_model()
+        start = time.perf_counter()
+        parser.parse_model()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python tools/benchmark_parser.py <aspen|ebsilon> <recording> [repeats]")
+        sys.exit(1)
+
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    times = benchmark(sys.argv[1], sys.argv[2], repeats)
+    print(f"{sys.argv[1]} parse of {sys.argv[2]}: best {min(times):.3f} s, mean {sum(times) / len(times):.3f} s")
@@ -1,4 +1,4 @@
-"""
+r"""
 Collect distinct UnitString values from an Aspen Plus model via COM and write them to a file.
 
 Usage (PowerShell):
@@ -7,7 +7,15 @@ Usage (PowerShell):
 The script requires Aspen Plus to be installed (COM interface) and will connect via
 win32com.client.Dispatch("Apwn.Document").
 
-It traverses the tree under "\\Data" and collects any `UnitString` attributes.
+It traverses the tree under "\Data" and collects any `UnitString` attributes.
+
+Alternatively, the units observed during a parse can be read from a unit audit file
+written by exerpy (see exerpy.units.UnitAuditSink):
+    python tools\collect_aspen_units.py --audit "units_audit.tsv" "output_units.txt"
+
+The audit file is created by enabling the sink before parsing:
+    from exerpy.units import UnitAuditSink, set_unit_audit_sink
+    set_unit_audit_sink(UnitAuditSink(path="units_audit.tsv"))
 """
 import sys
 import os
@@ -63,19 +71,34 @@ def collect_units_from_model(model_path):
     return seen
 
 
+def collect_units_from_audit(audit_path, kind=None):
+    """Return the distinct raw units of a unit audit file, optionally of one kind ("seen" or "unknown")."""
+    from exerpy.units import UnitAuditSink
+
+    return {
+        obs.raw_unit.strip()
+        for obs in UnitAuditSink.read(audit_path)
+        if (kind is None or obs.kind == kind) and obs.raw_unit.strip() and obs.raw_unit != "None"
+    }
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python tools\\collect_aspen_units.py <model.apw> [output_file]")
+    args = sys.argv[1:]
+    audit = bool(args) and args[0] == "--audit"
+    if audit:
+        args = args[1:]
+    if len(args) < 1:
+        print("Usage: python tools\\collect_aspen_units.py [--audit] <model.apw | audit.tsv> [output_file]")
         sys.exit(1)
 
-    model = sys.argv[1]
-    out = sys.argv[2] if len(sys.argv) > 2 else "detected_aspen_units.txt"
+    model = args[0]
+    out = args[1] if len(args) > 1 else "detected_aspen_units.txt"
 
     if not os.path.exists(model):
         print(f"Model file not found: {model}")
         sys.exit(2)
 
-    units = collect_units_from_model(model)
+    units = collect_units_from_audit(model) if audit else collect_units_from_model(model)
     units_sorted = sorted(units)
     with open(out, "w", encoding="utf-8") as f:
         for u in units_sorted: